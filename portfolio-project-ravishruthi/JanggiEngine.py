@@ -0,0 +1,538 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: An alpha-beta search engine for JanggiGame, and an analysis mode
+#              that annotates every ply of a recorded game using a pool of
+#              worker processes.
+#
+
+import copy
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from JanggiGame import JanggiGame, General, Guard, Elephant, Horse, Chariot, Cannon, Soldier, \
+    BLUE_TO_MOVE_KEY, move_to_notation
+
+# Piece values in hundredths of a point, from the usual Janggi scoring.
+PIECE_VALUES = {General: 0, Guard: 300, Elephant: 300, Horse: 500,
+                Chariot: 1300, Cannon: 700, Soldier: 200}
+MATE_SCORE = 100000
+MOBILITY_WEIGHT = 5
+MAX_PLY = 64
+
+# Transposition table entry flags
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+class SearchTimeout(Exception):
+    """Raised inside a search when its time is up."""
+    pass
+
+
+class SearchContext:
+    """
+        Represents the limits and counters of one search. Every search gets
+        its own, so a background search (see pondering) never reads the
+        limits of, or counts its nodes into, another search. The limits and
+        the stop flag are read as the search goes, so another thread may
+        change them.
+    """
+    def __init__(self, depth_limit=None, time_limit=None):
+        """
+            Initializes a SearchContext object starting now.
+        :param depth_limit: the deepest iteration to run, None for no limit
+        :param time_limit: seconds to search for, None for no limit
+        """
+        self.depth_limit = depth_limit
+        self.time_limit = time_limit
+        self.start_time = time.time()
+        self.deadline = None
+        self.stop = False
+        self.nodes = 0
+        self.completed_depth = 0
+
+    def check_time(self):
+        """Raises SearchTimeout once the deadline has passed or the search is stopped."""
+        if self.stop or (self.deadline is not None and time.time() >= self.deadline):
+            raise SearchTimeout()
+
+
+class JanggiEngine:
+    """
+        Represents a searching engine that picks moves for a JanggiGame.
+        It searches with iterative deepening alpha-beta and keeps a
+        transposition table between searches, so searching nearby positions
+        one after another reuses earlier work.
+    """
+    def __init__(self, table_size=1000000):
+        """
+            Initializes a JanggiEngine object with an empty transposition
+            table, which is cleared once it holds table_size entries.
+        :param table_size: the most positions kept in the transposition table
+        """
+        self._table = {}
+        self._table_size = table_size
+        # pondering: the background thread, its SearchContext, the position it
+        # searches (key and player to move) and where it leaves its result
+        self._ponder_thread = None
+        self._ponder_context = None
+        self._ponder_key = None
+        self._ponder_result = None
+
+    def get_table(self):
+        """Returns the transposition table (position key -> entry)."""
+        return self._table
+
+    def clear(self):
+        """Forgets everything in the transposition table."""
+        self._table = {}
+
+    def evaluate(self, board, player):
+        """
+            Scores the position for player: material plus a small bonus for
+            every square attacked, read from the Board's attack maps.
+        :param board: The board object for the Janggi Game
+        :param player: The player ('blue' or 'red')
+        :return: score in hundredths of a point, positive is good for player
+        """
+        score = 0
+        for side in ("red", "blue"):
+            material = 0
+            for index in board.get_piece_squares(side):
+                material += PIECE_VALUES[type(board.get_piece_at(index))]
+            material += MOBILITY_WEIGHT * board.get_mobility(side)
+            if side == player:
+                score += material
+            else:
+                score -= material
+        return score
+
+    def search(self, board, player, depth=None, time_limit=None):
+        """
+            Searches the position for player with iterative deepening until
+            depth is reached or time_limit seconds have passed. At least depth
+            one is always completed.
+        :param board: The board object for the Janggi Game
+        :param player: The player to move ('blue' or 'red')
+        :param depth: the deepest iteration to run, None for no limit
+        :param time_limit: seconds to search for, None for no limit
+        :return: dict with score, move (start index, end index), depth,
+            nodes and pv; move is None if player has no move (checkmate) and
+            a pass is written as the General's square twice
+        """
+        # a background search left running would compete with this one, so it
+        # is cancelled; choose_move takes over a ponder hit before getting here
+        self.stop_pondering()
+        if depth is None and time_limit is None:
+            depth = 4
+        return self._iterative_deepening(board, player, SearchContext(depth, time_limit))
+
+    def _iterative_deepening(self, board, player, context):
+        """
+            Runs deeper and deeper searches until the depth limit of context
+            is reached, its time limit runs out or it is stopped.
+        :param context: the SearchContext of this search
+        :return: result dict of the deepest completed iteration, see search
+        """
+        result = {"score": 0, "move": None, "depth": 0, "nodes": 0, "pv": []}
+        current = 1
+        while current <= MAX_PLY and (context.depth_limit is None or current <= context.depth_limit):
+            try:
+                score = self._negamax(board, player, current, -MATE_SCORE - 1, MATE_SCORE + 1, 0, context)
+            except SearchTimeout:
+                break
+            result = {"score": score, "move": self._table_move(board, player), "depth": current,
+                      "nodes": context.nodes, "pv": self.principal_variation(board, player, current)}
+            context.completed_depth = current
+            if abs(score) >= MATE_SCORE - MAX_PLY or context.stop:
+                break
+            if context.time_limit is not None:
+                context.deadline = context.start_time + context.time_limit
+                if time.time() >= context.deadline:
+                    break
+            current += 1
+        result["nodes"] = context.nodes
+        return result
+
+    def choose_move(self, game, depth=None, time_limit=None):
+        """
+            Picks a move for the player whose turn it is in game.
+        :param game: a JanggiGame object, left unchanged
+        :return: (start location, end location), the same location twice for
+            a pass, or None if the player is checkmated
+        """
+        board = game.get_board()
+        result = None
+        if self._ponder_thread is not None:
+            if self._ponder_key == (self._key(board, game.get_turn()), game.get_turn()):
+                result = self._ponder_hit(depth, time_limit)
+            else:
+                self.stop_pondering()
+        if result is None:
+            result = self.search(board, game.get_turn(), depth, time_limit)
+        if result["move"] is None:
+            return None
+        return board.index_to_location(result["move"][0]), board.index_to_location(result["move"][1])
+
+    def start_pondering(self, game, reply=None):
+        """
+            Starts searching, in a background thread, the position after the
+            opponent's most likely reply, while the opponent is thinking. The
+            next choose_move carries on with that search if the opponent did
+            play the reply (a ponder hit), and cancels it otherwise. The
+            background search works on a copy of the board and shares the
+            transposition table.
+        :param game: the JanggiGame object, with the opponent to move
+        :param reply: predicted reply (start location, end location); by
+            default the best move stored for the opponent by the last search
+        :return: the reply being pondered, or None if there was none to ponder
+        """
+        self.stop_pondering()
+        board = copy.deepcopy(game.get_board())
+        opponent = game.get_turn()
+        if reply is None:
+            move = self._table_move(board, opponent)
+            if move is None:
+                return None
+        else:
+            move = board.location_to_index(reply[0]), board.location_to_index(reply[1])
+            if move[0] != move[1] and not board.is_legal_move(move[0], move[1]):
+                return None
+        if move[0] != move[1]:
+            board.apply_move(move[0], move[1])
+        player = _other(opponent)
+        self._ponder_key = (self._key(board, player), player)
+        self._ponder_result = None
+        self._ponder_context = SearchContext()
+        self._ponder_thread = threading.Thread(target=self._ponder, args=(board, player, self._ponder_context),
+                                               daemon=True)
+        self._ponder_thread.start()
+        return board.index_to_location(move[0]), board.index_to_location(move[1])
+
+    def stop_pondering(self):
+        """Cancels the background search, if there is one, and waits for it to end."""
+        if self._ponder_thread is None:
+            return
+        self._ponder_context.stop = True
+        self._ponder_thread.join()
+        self._ponder_thread = None
+        self._ponder_context = None
+        self._ponder_key = None
+
+    def is_pondering(self):
+        """Returns True while a background search is running or waiting to be used."""
+        return self._ponder_thread is not None
+
+    def _ponder(self, board, player, context):
+        """Body of the pondering thread: an unlimited search until context is stopped."""
+        self._ponder_result = self._iterative_deepening(board, player, context)
+
+    def _ponder_hit(self, depth, time_limit):
+        """
+            Turns the running background search into the real one: it keeps
+            its tree and table and now has time_limit seconds from now and at
+            most depth plies.
+        :return: result dict of the search, see search
+        """
+        if depth is None and time_limit is None:
+            depth = 4
+        context = self._ponder_context
+        context.depth_limit = depth
+        context.start_time = time.time()
+        context.time_limit = time_limit
+        if depth is not None and context.completed_depth >= depth:
+            context.stop = True
+        elif time_limit is not None and context.completed_depth >= 1:
+            context.deadline = context.start_time + time_limit
+        self._ponder_thread.join()
+        self._ponder_thread = None
+        self._ponder_context = None
+        self._ponder_key = None
+        return self._ponder_result
+
+    def principal_variation(self, board, player, length):
+        """
+            Follows the best moves stored in the transposition table from the
+            current position, for at most length plies.
+        :return: list of (start index, end index) moves
+        """
+        pv = []
+        undo = []
+        side = player
+        seen = set()
+        while len(pv) < length:
+            key = self._key(board, side)
+            move = self._table_move(board, side)
+            if move is None or key in seen:
+                break
+            seen.add(key)
+            pv.append(move)
+            undo.append((move, board.apply_move(move[0], move[1]) if move[0] != move[1] else None))
+            side = _other(side)
+        for move, captured in reversed(undo):
+            if move[0] != move[1]:
+                board.undo_move(move[0], move[1], captured)
+        return pv
+
+    def _key(self, board, player):
+        """Returns the transposition table key of the position with player to move."""
+        if player == "blue":
+            return board.get_key() ^ BLUE_TO_MOVE_KEY
+        return board.get_key()
+
+    def _table_move(self, board, player):
+        """Returns the best move stored for the position, if it is still legal."""
+        entry = self._table.get(self._key(board, player))
+        if entry is None or entry[3] is None:
+            return None
+        start, end = entry[3]
+        if start == end or board.is_legal_move(start, end):
+            return entry[3]
+        return None
+
+    def _store(self, key, depth, score, flag, move, ply):
+        """Stores a search result, with mate scores made relative to this node."""
+        if len(self._table) >= self._table_size:
+            self._table = {}
+        if score >= MATE_SCORE - MAX_PLY:
+            score += ply
+        elif score <= -MATE_SCORE + MAX_PLY:
+            score -= ply
+        self._table[key] = (depth, score, flag, move)
+
+    def _ordered_moves(self, board, player, hint):
+        """
+            Returns the legal moves of player with the hinted move first, then
+            captures of the most valuable pieces by the least valuable ones.
+        """
+        scored = []
+        for start, end in board.generate_moves(player):
+            if (start, end) == hint:
+                order = 1000000
+            else:
+                victim = board.get_piece_at(end)
+                order = 0
+                if victim is not None:
+                    order = 10 * PIECE_VALUES[type(victim)] - PIECE_VALUES[type(board.get_piece_at(start))] // 100 + 1
+            scored.append((order, start, end))
+        scored.sort(reverse=True)
+        return [(start, end) for order, start, end in scored]
+
+    def _negamax(self, board, player, depth, alpha, beta, ply, context):
+        """
+            Alpha-beta search of the position for player.
+        :param context: the SearchContext of the search
+        :return: score of the position for player
+        """
+        context.nodes += 1
+        if context.nodes & 255 == 0:
+            context.check_time()
+        key = self._key(board, player)
+        hint = None
+        entry = self._table.get(key)
+        if entry is not None:
+            entry_depth, score, flag, hint = entry
+            if score >= MATE_SCORE - MAX_PLY:
+                score -= ply
+            elif score <= -MATE_SCORE + MAX_PLY:
+                score += ply
+            if entry_depth >= depth and ply > 0:
+                if flag == EXACT:
+                    return score
+                if flag == LOWER_BOUND and score >= beta:
+                    return score
+                if flag == UPPER_BOUND and score <= alpha:
+                    return score
+
+        in_check = board.is_in_check(player)
+        if depth <= 0 and (not in_check or ply >= MAX_PLY):
+            return self._quiesce(board, player, alpha, beta, ply, 0, context)
+        if depth <= 0:
+            depth = 1
+
+        moves = self._ordered_moves(board, player, hint)
+        general = board.get_general(player)
+        if not moves and (in_check or general is None):
+            return -MATE_SCORE + ply
+        if not in_check and general is not None:
+            # passing is always allowed outside of check; try it last
+            moves.append((general, general))
+
+        original_alpha = alpha
+        best_score = -MATE_SCORE - 1
+        best_move = None
+        for start, end in moves:
+            if start == end:
+                score = -self._negamax(board, _other(player), depth - 1, -beta, -alpha, ply + 1, context)
+            else:
+                captured = board.apply_move(start, end)
+                try:
+                    score = -self._negamax(board, _other(player), depth - 1, -beta, -alpha, ply + 1, context)
+                finally:
+                    board.undo_move(start, end, captured)
+            if score > best_score:
+                best_score = score
+                best_move = (start, end)
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self._store(key, depth, best_score, flag, best_move, ply)
+        return best_score
+
+    def _quiesce(self, board, player, alpha, beta, ply, q_depth, context):
+        """
+            Searches only captures until the position is quiet, so the
+            evaluation is not taken in the middle of an exchange.
+        """
+        context.nodes += 1
+        stand_pat = self.evaluate(board, player)
+        if stand_pat >= beta or q_depth >= 6:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+        for start, end in self._ordered_moves(board, player, None):
+            if board.get_piece_at(end) is None:
+                break
+            captured = board.apply_move(start, end)
+            try:
+                score = -self._quiesce(board, _other(player), -beta, -alpha, ply + 1, q_depth + 1, context)
+            finally:
+                board.undo_move(start, end, captured)
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+        return alpha
+
+
+def _other(player):
+    """Returns the opposing player."""
+    if player == "red":
+        return "blue"
+    return "red"
+
+
+def _replay(moves, facing_generals):
+    """
+        Plays moves on a new JanggiGame.
+    :return: the JanggiGame object
+    :raises ValueError: if one of the moves is not legal
+    """
+    game = JanggiGame(facing_generals)
+    for ply, (start_loc, end_loc) in enumerate(moves):
+        if not game.make_move(start_loc, end_loc):
+            raise ValueError("illegal move at ply " + str(ply + 1) + ": " + start_loc + " " + end_loc)
+    return game
+
+
+# Engine of the current worker process, so that every chunk a worker is
+# given shares one transposition table.
+_worker_engine = None
+
+
+def _init_worker(table_size):
+    """Creates the engine of a worker process."""
+    global _worker_engine
+    _worker_engine = JanggiEngine(table_size)
+
+
+def _analyze_chunk(moves, first, last, depth, time_per_ply, facing_generals, engine=None):
+    """
+        Searches the positions before plies first..last - 1 of moves (position
+        len(moves) is the final one), in order.
+    :param engine: the JanggiEngine to search with, the worker's by default
+    :return: list of search results, one per position
+    """
+    if engine is None:
+        engine = _worker_engine
+    game = _replay(moves[:first], facing_generals)
+    board = game.get_board()
+    results = []
+    for ply in range(first, last):
+        result = engine.search(board, game.get_turn(), depth, time_per_ply)
+        result["move"] = _move_to_locations(board, result["move"])
+        result["pv"] = [_move_to_locations(board, move) for move in result["pv"]]
+        results.append(result)
+        if ply < len(moves):
+            game.make_move(moves[ply][0], moves[ply][1])
+    return results
+
+
+def _move_to_locations(board, move):
+    """Turns a (start index, end index) move into algebraic notation."""
+    if move is None:
+        return None
+    return board.index_to_location(move[0]), board.index_to_location(move[1])
+
+
+def analyze_game(moves, depth=None, time_per_ply=None, workers=None, facing_generals=False,
+                 blunder_margin=300, table_size=1000000):
+    """
+        Annotates every ply of a recorded game. Every position of the game is
+        rebuilt from the move list and searched; the positions are split into
+        runs of consecutive plies handed out to a pool of worker processes, and
+        each worker keeps one transposition table for all the runs it searches.
+    :param moves: list of (start location, end location) pairs as passed to
+        JanggiGame.make_move, the same location twice for a pass, or integer
+        moves (see encode_move)
+    :param depth: search depth per position (4 if neither limit is given)
+    :param time_per_ply: seconds of search per position
+    :param workers: number of worker processes, defaults to the CPU count;
+        1 searches in this process
+    :param facing_generals: the JanggiGame facing_generals rule
+    :param blunder_margin: how much worse than the best move (in hundredths
+        of a point) a move must score to be flagged as a blunder
+    :param table_size: transposition table size of each worker
+    :return: list with one dict per ply, in order: ply, player, move, eval
+        (best score for the mover before the move), best_move, pv,
+        played_eval, loss and blunder
+    :raises ValueError: if one of the moves is not legal
+    """
+    moves = [move_to_notation(move) if isinstance(move, int) else tuple(move) for move in moves]
+    _replay(moves, facing_generals)
+    positions = len(moves) + 1
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        results = _analyze_chunk(moves, 0, positions, depth, time_per_ply, facing_generals,
+                                 JanggiEngine(table_size))
+    else:
+        # a few runs per worker keeps the load even while runs stay long
+        # enough for the table to be reused from ply to ply
+        run_length = max(1, -(-positions // (workers * 4)))
+        bounds = [(first, min(first + run_length, positions)) for first in range(0, positions, run_length)]
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(table_size,)) as pool:
+            futures = [pool.submit(_analyze_chunk, moves, first, last, depth, time_per_ply, facing_generals)
+                       for first, last in bounds]
+            results = []
+            for future in futures:
+                results.extend(future.result())
+
+    annotations = []
+    player = "blue"
+    for ply, move in enumerate(moves):
+        best = results[ply]
+        after = results[ply + 1]
+        if move == best["move"] or (move[0] == move[1] and best["move"] is not None
+                                    and best["move"][0] == best["move"][1]):
+            played_eval = best["score"]
+        else:
+            played_eval = -after["score"]
+        loss = max(0, best["score"] - played_eval)
+        annotations.append({"ply": ply + 1, "player": player, "move": move, "eval": best["score"],
+                            "best_move": best["move"], "pv": best["pv"], "played_eval": played_eval,
+                            "loss": loss, "blunder": loss >= blunder_margin, "depth": best["depth"]})
+        player = _other(player)
+    return annotations
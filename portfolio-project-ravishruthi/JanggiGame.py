@@ -3,7 +3,140 @@
 # Description: A program that allows for the user to play an abstract game of Janggi.
 #
 
-import copy
+import random
+from array import array
+
+ROWS = 10
+COLS = 9
+SIDES = ("blue", "red")
+
+
+def _index(row, col):
+    """Returns the flat index (row * COLS + col) of a spot on the board."""
+    return row * COLS + col
+
+
+def _on_board(row, col):
+    """Returns True if the row and column are on the board."""
+    return 0 <= row < ROWS and 0 <= col < COLS
+
+
+def _other_side(side):
+    """Returns the opposing player of side."""
+    if side == "red":
+        return "blue"
+    return "red"
+
+
+def _build_palace(first_row):
+    """Returns the set of square indexes of the palace starting at first_row."""
+    return frozenset(_index(row, col) for row in range(first_row, first_row + 3) for col in range(3, 6))
+
+
+def _build_orthogonal_rays():
+    """
+        For every square, builds the four straight lines (up, down, right, left)
+        leading away from it, nearest square first.
+    """
+    rays = []
+    for row in range(ROWS):
+        for col in range(COLS):
+            sq_rays = []
+            for d_row, d_col in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                ray = []
+                r, c = row + d_row, col + d_col
+                while _on_board(r, c):
+                    ray.append(_index(r, c))
+                    r, c = r + d_row, c + d_col
+                if ray:
+                    sq_rays.append(ray)
+            rays.append(sq_rays)
+    return rays
+
+
+def _build_palace_diagonals():
+    """
+        For every square, builds the diagonal palace lines leading away from it.
+        A corner has one line (through the center to the opposite corner) and
+        the center has one single-step line to each corner.
+    """
+    rays = [[] for _ in range(ROWS * COLS)]
+    for first_row in (0, 7):
+        center = _index(first_row + 1, 4)
+        for corner in (_index(first_row, 3), _index(first_row, 5),
+                       _index(first_row + 2, 3), _index(first_row + 2, 5)):
+            rays[corner].append([center, 2 * center - corner])
+            rays[center].append([corner])
+    return rays
+
+
+def _build_leaping_moves(length):
+    """
+        For every square, builds the (legs, target) pairs for a piece that moves
+        one step orthogonally and then length - 1 steps diagonally outward.
+        Length 2 is the Horse and length 3 is the Elephant; every leg must be
+        empty for the move to be possible.
+    """
+    moves = []
+    for row in range(ROWS):
+        for col in range(COLS):
+            sq_moves = []
+            for d_row, d_col in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                for p_row, p_col in ((d_col, d_row), (-d_col, -d_row)):
+                    legs = [(row + d_row, col + d_col)]
+                    for step in range(1, length - 1):
+                        legs.append((row + (step + 1) * d_row + step * p_row,
+                                     col + (step + 1) * d_col + step * p_col))
+                    t_row = row + length * d_row + (length - 1) * p_row
+                    t_col = col + length * d_col + (length - 1) * p_col
+                    if _on_board(t_row, t_col):
+                        sq_moves.append((tuple(_index(r, c) for r, c in legs), _index(t_row, t_col)))
+            moves.append(sq_moves)
+    return moves
+
+
+def _build_between(lines):
+    """
+        Maps every (from, to) pair of squares joined by one of the lines to the
+        squares strictly between them.
+    """
+    between = {}
+    for start in range(ROWS * COLS):
+        for line in lines[start]:
+            for pos, end in enumerate(line):
+                between[(start, end)] = tuple(line[:pos])
+    return between
+
+
+def _invert_leaping_moves(moves):
+    """
+        Turns per-square (legs, target) leaping moves into, for every target,
+        the (source, legs) pairs that reach it.
+    """
+    sources = [[] for _ in range(ROWS * COLS)]
+    for source, sq_moves in enumerate(moves):
+        for legs, target in sq_moves:
+            sources[target].append((source, legs))
+    return sources
+
+
+# Board geometry, precomputed once. Squares are numbered row * COLS + col,
+# so "a1" is 0 and "i10" is 89. The public tables are shared with
+# JanggiValidator and must not be changed:
+# ORTHOGONAL_RAYS[sq] is the straight lines leading away from sq,
+# LINES[sq] is those lines plus the palace diagonals, and
+# HORSE_SOURCES[sq] and ELEPHANT_SOURCES[sq] are the (source, legs) pairs
+# of the moves that reach sq.
+RED_PALACE = _build_palace(0)
+BLUE_PALACE = _build_palace(7)
+ORTHOGONAL_RAYS = _build_orthogonal_rays()
+_PALACE_DIAGONALS = _build_palace_diagonals()
+LINES = [ORTHOGONAL_RAYS[i] + _PALACE_DIAGONALS[i] for i in range(ROWS * COLS)]
+_HORSE_MOVES = _build_leaping_moves(2)
+_ELEPHANT_MOVES = _build_leaping_moves(3)
+_BETWEEN = _build_between(LINES)
+HORSE_SOURCES = _invert_leaping_moves(_HORSE_MOVES)
+ELEPHANT_SOURCES = _invert_leaping_moves(_ELEPHANT_MOVES)
 
 
 class Piece:
@@ -31,54 +164,32 @@ class Piece:
     def get_side(self):
         return self._side
 
-    def legal_move(self, start_sq, end_sq, board):
-        """Checks whether the move is legal for the Piece."""
-        pass
-
-    def is_checked(self, start_sq, end_sq, board):
-        """
-            Checks to see whether the moving of the Piece object place
-            the General piece for the player in check.
-        """
-        pass
-
-
-class General(Piece):
-    """
-        Inherits from Piece and represents a General Piece.
-        ** Refer to Piece **
-    """
-    def __init__(self, side):
+    def get_attacks(self, index, board):
         """
-            Initializes a General Piece object.
-            ** Refer to Piece **
+            Returns the squares the Piece attacks from index, which are the
+            squares it could move to if they held an enemy piece, and the
+            squares whose contents decide that (lines, legs and screens).
+        :param index: Index of the Square the Piece is on
+        :param board: The board object for the Janggi Game
+        :return: (list of attacked square indexes, list of depended-on square indexes)
         """
-        super().__init__(side)
+        return [], []
 
     def legal_move(self, start_loc, end_loc, board):
         """
             Checks to see if move is legal and follows the rules specific
-            to the General. Returns True, if legal. False if not.
+            to the Piece. Returns True, if legal. False if not.
         :param start_loc: Starting location ("algebraic notation")
         :param end_loc: Ending Location ("algebraic notation")
         :param board: The board object for the Janggi Game
         :return: True if move is legal, False if not
         """
-        # get palace details
-        if self._side == "red":
-            palace = board.get_red_palace()
-        else:
-            palace = board.get_blue_palace()
         # Get the Square object for start and end locations
         start_sq = board.get_square_with_loc(start_loc)
         end_sq = board.get_square_with_loc(end_loc)
 
-        # move only in palace
-        if end_sq not in palace:
-            return False
-
-        # moves only one space at a time
-        if abs(end_sq.get_row() - start_sq.get_row()) > 1 or abs(end_sq.get_col() - start_sq.get_col()) > 1:
+        # can the piece reach the end square under its own rules?
+        if not board.attacks(start_sq, end_sq):
             return False
         # Check to see if end location has a piece from the player's side
         if end_sq.get_piece() is not None:
@@ -89,83 +200,55 @@ class General(Piece):
         self._in_check = self.is_checked(start_sq, end_sq, board)
         if self._in_check:
             return False
-        # otherwise move is good
+        # move is good
         return True
 
     def is_checked(self, start_sq, end_sq, board):
-        """Will check to see if it will be in check if it moves."""
-        for sq_list in board.get_board():
-            for sq in sq_list:
-                if sq.get_piece() is not None:
-                    if sq.get_piece().get_side() != self._side:
-                        if sq.get_piece().legal_move(sq.get_location(), end_sq.get_location(), board):
-                            return True
-        return False
+        """
+            Checks to see whether the moving of the Piece object place
+            the General piece for the player in check.
+        """
+        return board.leaves_in_check(start_sq, end_sq)
 
 
-class Guard(Piece):
+class General(Piece):
     """
-        Inherits from Piece and represents a Guard Piece.
+        Inherits from Piece and represents a General Piece.
         ** Refer to Piece **
     """
     def __init__(self, side):
         """
-            Initializes a Guard Piece object.
+            Initializes a General Piece object.
             ** Refer to Piece **
         """
         super().__init__(side)
 
-    def legal_move(self, start_loc, end_loc, board):
+    def get_attacks(self, index, board):
         """
-            Checks to see if move is legal and follows the rules specific
-            to the Guard. Returns True, if legal. False if not.
-        :param start_loc: Starting location ("algebraic notation")
-        :param end_loc: Ending Location ("algebraic notation")
-        :param board: The board object for the Janggi Game
-        :return: True if move is legal, False if not
+            Moves one step along the lines of its own palace.
+            ** Refer to Piece **
         """
-        # get palace details
-        if self._side == "red":
-            palace = board.get_red_palace()
-        else:
-            palace = board.get_blue_palace()
-        # Get the Square object for start and end locations
-        start_sq = board.get_square_with_loc(start_loc)
-        end_sq = board.get_square_with_loc(end_loc)
-
-        # move only in palace
-        if end_sq not in palace:
-            return False
+        return _palace_steps(index, self._side), []
 
-        # moves only one space at a time
-        if abs(end_sq.get_row() - start_sq.get_row()) > 1 or abs(end_sq.get_col() - start_sq.get_col()) > 1:
-            return False
-        # Check to see if end location has a piece from the player's side
-        if end_sq.get_piece() is not None:
-            if end_sq.get_piece().get_side() == self._side:
-                return False
 
-        # will move cause general to be in check?
-        self._in_check = self.is_checked(start_sq, end_sq, board)
-        if self._in_check:
-            return False
-        # otherwise move is good
-        return True
+class Guard(Piece):
+    """
+        Inherits from Piece and represents a Guard Piece.
+        ** Refer to Piece **
+    """
+    def __init__(self, side):
+        """
+            Initializes a Guard Piece object.
+            ** Refer to Piece **
+        """
+        super().__init__(side)
 
-    def is_checked(self, start_sq, end_sq, board):
-        """Will check to see if the General Piece will be in check if it moves."""
-        gen_type = General(self.get_side())
-        potential_board = copy.deepcopy(board)
-        for sq_list in board.get_board():
-            for sq in sq_list:
-                if sq.get_piece() is not None:
-                    if type(sq.get_piece()) == type(gen_type) and sq.get_piece().get_side() == self._side:
-                        gen_sq = sq
-                        potential_board.get_board()[end_sq.get_row()][end_sq.get_col()].set_piece(start_sq.get_piece())
-                        potential_board.get_board()[start_sq.get_row()][start_sq.get_col()].set_piece(None)
-                        if gen_sq.get_piece().is_checked(gen_sq, gen_sq, potential_board):
-                            return True
-                        return False
+    def get_attacks(self, index, board):
+        """
+            Moves one step along the lines of its own palace.
+            ** Refer to Piece **
+        """
+        return _palace_steps(index, self._side), []
 
 
 class Horse(Piece):
@@ -180,135 +263,19 @@ class Horse(Piece):
         """
         super().__init__(side)
 
-    def legal_move(self, start_loc, end_loc, board):
-        """
-            Checks to see if move is legal and follows the rules specific
-            to the Horse. Returns True, if legal. False if not.
-        :param start_loc: Starting location ("algebraic notation")
-        :param end_loc: Ending Location ("algebraic notation")
-        :param board: The board object for the Janggi Game
-        :return: True if move is legal, False if not
+    def get_attacks(self, index, board):
         """
-        # Get the Square object for start and end locations
-        start_sq = board.get_square_with_loc(start_loc)
-        end_sq = board.get_square_with_loc(end_loc)
-
-        # is end square legal?
-        possible_end_squares = self._possible_moves(start_sq, board)
-        if end_sq not in possible_end_squares:
-            return False
-        # Again, illegal move
-        if abs(start_sq.get_row() - end_sq.get_row()) > 2 or abs(start_sq.get_row() - end_sq.get_row()) < 1:
-            return False
-        if abs(start_sq.get_col() - end_sq.get_col()) > 2 or abs(start_sq.get_col() - end_sq.get_col()) < 1:
-            return False
-
-        # is it blocked?
-        if self._is_blocked(start_sq, end_sq, board):
-            return False
-        # Check to see if end location has a piece from the player's side
-        if end_sq.get_piece() is not None:
-            if end_sq.get_piece().get_side() == self._side:
-                return False
-
-        # will move cause general to be in check?
-        self._in_check = self.is_checked(start_sq, end_sq, board)
-        if self._in_check:
-            return False
-        # move is good
-        return True
-
-    def _possible_moves(self, start_sq, board):
+            Moves one step orthogonally and then one step diagonally outward,
+            and is blocked by a piece on the orthogonal step.
+            ** Refer to Piece **
         """
-            Check to see the possible squares that the Horse could move to
-            in regards to its rules.
-        :param start_sq: Starting Square, or Square object it is currently on
-        :param board: The board object for the Janggi Game
-        :return: A list of squares that it can legally move to
-        """
-        game_board = board.get_board()
-        current_sq_row = start_sq.get_row()
-        current_sq_col = start_sq.get_col()
-        legal_end_squares = []
-        try:
-            legal_end_squares.append(game_board[current_sq_row - 1][current_sq_col - 2])
-        except IndexError:
-            pass
-        try:
-            legal_end_squares.append(game_board[current_sq_row + 1][current_sq_col - 2])
-        except IndexError:
-            pass
-        try:
-            legal_end_squares.append(game_board[current_sq_row - 2][current_sq_col - 1])
-        except IndexError:
-            pass
-        try:
-            legal_end_squares.append(game_board[current_sq_row - 2][current_sq_col + 1])
-        except IndexError:
-            pass
-        try:
-            legal_end_squares.append(game_board[current_sq_row - 1][current_sq_col + 2])
-        except IndexError:
-            pass
-        try:
-            legal_end_squares.append(game_board[current_sq_row + 1][current_sq_col + 2])
-        except IndexError:
-            pass
-        try:
-            legal_end_squares.append(game_board[current_sq_row + 2][current_sq_col - 1])
-        except IndexError:
-            pass
-        try:
-            legal_end_squares.append(game_board[current_sq_row + 2][current_sq_col + 1])
-        except IndexError:
-            pass
-        return legal_end_squares
-
-    def _is_blocked(self, start_sq, end_sq, board):
-        """
-            Checks to see if there is a Piece blocking its path to the End Square.
-        :param start_sq: Starting Square, or current Square object it is "on"
-        :param end_sq: Ending Square, or the Square object it wants to move to.
-        :param board: The board object for the Janggi Game
-        :return: True if it is being blocked, False if not.
-        """
-        game_board = board.get_board()
-        current_sq_row = start_sq.get_row()
-        current_sq_col = start_sq.get_col()
-        end_sq_row = end_sq.get_row()
-        end_sq_col = end_sq.get_col()
-        if current_sq_row - 2 == end_sq_row:
-            # check top square
-            if game_board[current_sq_row - 1][current_sq_col].get_piece() is not None:
-                return True
-        elif current_sq_row + 2 == end_sq_row:
-            # check bottom square
-            if game_board[current_sq_row + 1][current_sq_col].get_piece() is not None:
-                return True
-        elif current_sq_col + 2 == end_sq_col:
-            # check right square
-            if game_board[current_sq_row][current_sq_col + 2].get_piece() is not None:
-                return True
-        elif current_sq_col - 2 == end_sq_col:
-            # check left square
-            if game_board[current_sq_row][current_sq_col - 2].get_piece() is not None:
-                return True
-        return False
-
-    def is_checked(self, start_sq, end_sq, board):
-        """Will check to see if the General Piece will be in check if it moves."""
-        gen_type = General(self.get_side())
-        potential_board = copy.deepcopy(board)
-        for sq_list in board.get_board():
-            for sq in sq_list:
-                if sq.get_piece() is not None:
-                    if type(sq.get_piece()) == type(gen_type) and sq.get_piece().get_side() == self._side:
-                        gen_sq = sq
-                        potential_board.get_board()[end_sq.get_row()][end_sq.get_col()].set_piece(start_sq.get_piece())
-                        potential_board.get_board()[start_sq.get_row()][start_sq.get_col()].set_piece(None)
-                        if gen_sq.get_piece().is_checked(gen_sq, gen_sq, potential_board):
-                            return True
-                        return False
+        targets = []
+        deps = []
+        for legs, target in _HORSE_MOVES[index]:
+            deps.append(legs[0])
+            if board.get_piece_at(legs[0]) is None:
+                targets.append(target)
+        return targets, deps
 
 
 class Elephant(Piece):
@@ -323,162 +290,19 @@ class Elephant(Piece):
         """
         super().__init__(side)
 
-    def legal_move(self, start_loc, end_loc, board):
+    def get_attacks(self, index, board):
         """
-            Checks to see if move is legal and follows the rules specific
-            to the Elephant. Returns True, if legal. False if not.
-        :param start_loc: Starting location ("algebraic notation")
-        :param end_loc: Ending Location ("algebraic notation")
-        :param board: The board object for the Janggi Game
-        :return: True if move is legal, False if not
-        """
-        # Get the Square object for start and end locations
-        start_sq = board.get_square_with_loc(start_loc)
-        end_sq = board.get_square_with_loc(end_loc)
-
-        # is end square legal?
-        possible_end_squares = self._possible_moves(start_sq, board)
-        if end_sq not in possible_end_squares:
-            return False
-        # Again, illegal move
-        if abs(start_sq.get_row() - end_sq.get_row()) > 3 or abs(start_sq.get_row() - end_sq.get_row()) < 2:
-            return False
-        if abs(start_sq.get_col() - end_sq.get_col()) > 3 or abs(start_sq.get_col() - end_sq.get_col()) < 2:
-            return False
-
-        # is it blocked?
-        if self._is_blocked(start_sq, end_sq, board):
-            return False
-        # Check to see if end location has a piece from the player's side
-        if end_sq.get_piece() is not None:
-            if end_sq.get_piece().get_side() == self._side:
-                return False
-
-        # will move cause general to be in check?
-        self._in_check = self.is_checked(start_sq, end_sq, board)
-        if self._in_check:
-            return False
-        # move is good
-        return True
-
-    def _possible_moves(self, start_sq, board):
-        """
-            Check to see the possible squares that the Elephant could move to
-            in regards to its rules.
-        :param start_sq: Starting Square, or Square object it is currently on
-        :param board: The board object for the Janggi Game
-        :return: A list of squares that it can legally move to
-        """
-        game_board = board.get_board()
-        current_sq_row = start_sq.get_row()
-        current_sq_col = start_sq.get_col()
-        legal_end_squares = []
-        try:
-            legal_end_squares.append(game_board[current_sq_row - 2][current_sq_col - 3])
-        except IndexError:
-            pass
-        try:
-            legal_end_squares.append(game_board[current_sq_row + 2][current_sq_col - 3])
-        except IndexError:
-            pass
-        try:
-            legal_end_squares.append(game_board[current_sq_row - 3][current_sq_col - 2])
-        except IndexError:
-            pass
-        try:
-            legal_end_squares.append(game_board[current_sq_row - 3][current_sq_col + 2])
-        except IndexError:
-            pass
-        try:
-            legal_end_squares.append(game_board[current_sq_row - 2][current_sq_col + 3])
-        except IndexError:
-            pass
-        try:
-            legal_end_squares.append(game_board[current_sq_row + 2][current_sq_col + 3])
-        except IndexError:
-            pass
-        try:
-            legal_end_squares.append(game_board[current_sq_row + 3][current_sq_col - 2])
-        except IndexError:
-            pass
-        try:
-            legal_end_squares.append(game_board[current_sq_row + 3][current_sq_col + 2])
-        except IndexError:
-            pass
-        return legal_end_squares
-
-    def _is_blocked(self, start_sq, end_sq, board):
-        """
-            Checks to see if there is a Piece blocking its path to the End Square.
-        :param start_sq: Starting Square, or current Square object it is "on"
-        :param end_sq: Ending Square, or the Square object it wants to move to.
-        :param board: The board object for the Janggi Game
-        :return: True if it is being blocked, False if not.
+            Moves one step orthogonally and then two steps diagonally outward,
+            and is blocked by a piece on any square before the last one.
+            ** Refer to Piece **
         """
-        game_board = board.get_board()
-        current_sq_row = start_sq.get_row()
-        current_sq_col = start_sq.get_col()
-        end_sq_row = end_sq.get_row()
-        end_sq_col = end_sq.get_col()
-
-        if current_sq_row - 3 == end_sq_row:
-            # top
-            if game_board[current_sq_row - 1][current_sq_col].get_piece() is not None:
-                return True
-            elif current_sq_col < end_sq_col:
-                if game_board[current_sq_row - 2][current_sq_col + 1].get_piece() is not None:
-                    return True
-            elif current_sq_col > end_sq_col:
-                if game_board[current_sq_row - 2][current_sq_col - 1].get_piece() is not None:
-                    return True
-        elif current_sq_row + 3 == end_sq_row:
-            # bottom
-            if game_board[current_sq_row + 1][current_sq_col].get_piece() is not None:
-                return True
-            elif current_sq_col < end_sq_col:
-                if game_board[current_sq_row + 2][current_sq_col + 1].get_piece() is not None:
-                    return True
-            elif current_sq_col > end_sq_col:
-                if game_board[current_sq_row + 2][current_sq_col - 1].get_piece() is not None:
-                    return True
-        elif current_sq_col + 3 == end_sq_col:
-            # right
-            if game_board[current_sq_row][current_sq_col + 1].get_piece() is not None:
-                return True
-            elif current_sq_row < end_sq_row:
-                if game_board[current_sq_row + 1][current_sq_col + 2].get_piece() is not None:
-                    return True
-                pass
-            elif current_sq_row > end_sq_row:
-                if game_board[current_sq_row - 1][current_sq_col + 2].get_piece() is not None:
-                    return True
-        elif current_sq_col - 3 == end_sq_col:
-            # left
-            if game_board[current_sq_row][current_sq_col - 1].get_piece() is not None:
-                return True
-            elif current_sq_row < end_sq_row:
-                if game_board[current_sq_row + 1][current_sq_col - 2].get_piece() is not None:
-                    return True
-                pass
-            elif current_sq_row > end_sq_row:
-                if game_board[current_sq_row - 1][current_sq_col - 2].get_piece() is not None:
-                    return True
-        return False
-
-    def is_checked(self, start_sq, end_sq, board):
-        """Will check to see if the General Piece will be in check if it moves."""
-        gen_type = General(self.get_side())
-        potential_board = copy.deepcopy(board)
-        for sq_list in board.get_board():
-            for sq in sq_list:
-                if sq.get_piece() is not None:
-                    if type(sq.get_piece()) == type(gen_type) and sq.get_piece().get_side() == self._side:
-                        gen_sq = sq
-                        potential_board.get_board()[end_sq.get_row()][end_sq.get_col()].set_piece(start_sq.get_piece())
-                        potential_board.get_board()[start_sq.get_row()][start_sq.get_col()].set_piece(None)
-                        if gen_sq.get_piece().is_checked(gen_sq, gen_sq, potential_board):
-                            return True
-                        return False
+        targets = []
+        deps = []
+        for legs, target in _ELEPHANT_MOVES[index]:
+            deps.extend(legs)
+            if board.get_piece_at(legs[0]) is None and board.get_piece_at(legs[1]) is None:
+                targets.append(target)
+        return targets, deps
 
 
 class Chariot(Piece):
@@ -493,109 +317,21 @@ class Chariot(Piece):
         """
         super().__init__(side)
 
-    def legal_move(self, start_loc, end_loc, board):
+    def get_attacks(self, index, board):
         """
-            Checks to see if move is legal and follows the rules specific
-            to the Chariot. Returns True, if legal. False if not.
-        :param start_loc: Starting location ("algebraic notation")
-        :param end_loc: Ending Location ("algebraic notation")
-        :param board: The board object for the Janggi Game
-        :return: True if move is legal, False if not
+            Moves any distance along a straight line or a palace diagonal,
+            up to and including the first piece in the way.
+            ** Refer to Piece **
         """
-        # get palace details
-        if self._side == "red":
-            palace = board.get_red_palace()
-        else:
-            palace = board.get_blue_palace()
-        # get squares
-        start_sq = board.get_square_with_loc(start_loc)
-        end_sq = board.get_square_with_loc(end_loc)
-        # get row and col for start and end square
-        start_row = start_sq.get_row()
-        start_col = start_sq.get_col()
-        end_row = end_sq.get_row()
-        end_col = end_sq.get_col()
-
-        # if moving diagonal and not in palace, return False
-        if abs(start_row - end_row) == abs(start_col - end_col) and start_sq not in palace and end_sq not in palace:
-            return False
-        # not moving vertically or horizontally
-        elif not (start_sq.get_row() != end_sq.get_row() and start_sq.get_col() == end_sq.get_col()) \
-                and not (start_sq.get_row() == end_sq.get_row() and start_sq.get_col() != end_sq.get_col()):
-            return False
-        # Will technically be considered "blocked" if there is another Piece in between the start and end
-        if self._is_blocked(start_sq, end_sq, board):
-            return False
-        # Check to see if end location has a piece from the player's side
-        if end_sq.get_piece() is not None:
-            if end_sq.get_piece().get_side() == self._side:
-                return False
-
-        # will move cause general to be in check?
-        self._in_check = self.is_checked(start_sq, end_sq, board)
-        if self._in_check:
-            return False
-        # move is good
-        return True
-
-    def _is_blocked(self, start_sq, end_sq, board):
-        """
-            Checks to see if there is a Piece blocking its path to the End Square.
-        :param start_sq: Starting Square, or current Square object it is "on"
-        :param end_sq: Ending Square, or the Square object it wants to move to.
-        :param board: The board object for the Janggi Game
-        :return: True if it is being blocked, False if not.
-        """
-        current_sq_row = start_sq.get_row()
-        current_sq_col = start_sq.get_col()
-        end_sq_row = end_sq.get_row()
-        end_sq_col = end_sq.get_col()
-
-        if current_sq_row == end_sq_row:
-            squares_in_row = board.get_board()[current_sq_row]
-            for square in squares_in_row:
-                if current_sq_col < square.get_col() < end_sq_col:
-                    if square.get_piece() is not None:
-                        return True
-                elif current_sq_col > square.get_col() > end_sq_col:
-                    if square.get_piece() is not None:
-                        return True
-        elif current_sq_col == end_sq_col:
-            squares_in_col = []
-            for sq_list in board.get_board():
-                for square in sq_list:
-                    if square.get_col() == current_sq_col:
-                        squares_in_col.append(square)
-            for square in squares_in_col:
-                if current_sq_row < square.get_row() < end_sq_row:
-                    if square.get_piece() is not None:
-                        return True
-                elif current_sq_row > square.get_row() > end_sq_row:
-                    if square.get_piece() is not None:
-                        return True
-        elif abs(current_sq_row - end_sq_row) == abs(current_sq_col - end_sq_col):
-            if end_sq in board.get_red_palace():
-                if board.get_board()[1][4].get_piece() is not None:
-                    return True
-            if end_sq in board.get_blue_palace():
-                if board.get_board()[8][4].get_piece() is not None:
-                    return True
-        return False
-
-    def is_checked(self, start_sq, end_sq, board):
-        """Will check to see if the General Piece will be in check if it moves."""
-        gen_type = General(self.get_side())
-        potential_board = copy.deepcopy(board)
-        for sq_list in board.get_board():
-            for sq in sq_list:
-                if sq.get_piece() is not None:
-                    if type(sq.get_piece()) == type(gen_type) and sq.get_piece().get_side() == self._side:
-                        gen_sq = sq
-                        potential_board.get_board()[end_sq.get_row()][end_sq.get_col()].set_piece(start_sq.get_piece())
-                        potential_board.get_board()[start_sq.get_row()][start_sq.get_col()].set_piece(None)
-                        if gen_sq.get_piece().is_checked(gen_sq, gen_sq, potential_board):
-                            return True
-                        return False
+        targets = []
+        deps = []
+        for line in LINES[index]:
+            for sq in line:
+                targets.append(sq)
+                deps.append(sq)
+                if board.get_piece_at(sq) is not None:
+                    break
+        return targets, deps
 
 
 class Cannon(Piece):
@@ -610,211 +346,193 @@ class Cannon(Piece):
         """
         super().__init__(side)
 
-    def legal_move(self, start_loc, end_loc, board):
+    def get_attacks(self, index, board):
         """
-            Checks to see if move is legal and follows the rules specific
-            to the Cannon. Returns True, if legal. False if not.
-        :param start_loc: Starting location ("algebraic notation")
-        :param end_loc: Ending Location ("algebraic notation")
-        :param board: The board object for the Janggi Game
-        :return: True if move is legal, False if not
-        """
-        # get squares
-        start_sq = board.get_square_with_loc(start_loc)
-        end_sq = board.get_square_with_loc(end_loc)
-        # get row and col for start and end square
-        start_row = start_sq.get_row()
-        start_col = start_sq.get_col()
-        end_row = end_sq.get_row()
-        end_col = end_sq.get_col()
-        # get palace details
-        palace = None
-        if end_row == 0 or end_row == 1 or end_row == 2:
-            palace = board.get_red_palace()
-        elif end_row == 7 or end_row == 8 or end_row == 9:
-            palace = board.get_blue_palace()
-        elif self._side == "red":
-            palace = board.get_red_palace()
-        else:
-            palace = board.get_blue_palace()
-
-        # if moving diagonal and not in palace, return False
-        if abs(start_row - end_row) == abs(start_col - end_col) \
-                and start_sq not in palace and end_sq not in palace:
-            return False
-        # if diagonal and in palace, consider it legal
-        if abs(start_row - end_row) == abs(start_col - end_col):
-            pass
-        # not moving vertically or horizontally
-        elif not (start_sq.get_row() != end_sq.get_row() and start_sq.get_col() == end_sq.get_col()) \
-             and not (start_sq.get_row() == end_sq.get_row() and start_sq.get_col() != end_sq.get_col()):
-            return False
-        # check if exactly one piece in between
-        if not self._is_one_piece_between(start_row, start_col, end_row, end_col, board, palace):
-            return False
-        # Check to see if end location has a piece from the player's side
-        if end_sq.get_piece() is not None:
-            if end_sq.get_piece().get_side() == self._side:
-                return False
-
-        # will move cause general to be in check?
-        self._in_check = self.is_checked(start_sq, end_sq, board)
-        if self._in_check:
-            return False
-        return True
-
-    def _is_one_piece_between(self, s_row, s_col, e_row, e_col, board, palace):
+            Moves along a straight line or a palace diagonal by jumping over
+            exactly one piece (the screen), up to and including the first piece
+            after it. The screen can not be a Cannon, and a Cannon can not be
+            captured by a Cannon.
+            ** Refer to Piece **
         """
-            Checks to see that there is exactly one object in between the start and
-            end location of Cannon, and that the screen object is not a Cannon.
-        :param s_row: Start location row
-        :param s_col: Start location column
-        :param e_row: End location row
-        :param e_col: End location column
-        :param board: The board object for the Janggi Game
-        :param palace: The palace of side player is on, None if not
-        :return: True if it is being blocked, False if not.
-        """
-        piece_count = 0
-        cannon_type = Cannon(self.get_side())
-        # If moving horizontally
-        if s_row == e_row:
-            sq_list = board.get_board()[s_row]
-            for square in sq_list:
-                if (s_col < square.get_col() < e_col) or (s_col > square.get_col() > e_col):
-                    if square.get_piece() is not None and type(square.get_piece()) != type(cannon_type):
-                        piece_count += 1
-                    elif square.get_piece() is not None and type(square.get_piece()) == type(cannon_type):
-                        return False
-        # If moving vertically
-        elif s_col == e_col:
-            col_list = []
-            for sq_list in board.get_board():
-                for square in sq_list:
-                    if square.get_col() == s_col:
-                        col_list.append(square)
-            for square in col_list:
-                if (s_row < square.get_row() < e_row) or (s_row > square.get_row() > e_row):
-                    if square.get_piece() is not None and type(square.get_piece()) != type(cannon_type):
-                        piece_count += 1
-                    elif square.get_piece() is not None and type(square.get_piece()) == type(cannon_type):
-                        return False
-        # If moving diagonally and in palace
-        elif palace is not None and s_row in palace and e_row in palace:
-            if s_row == 0 or s_row == 1 or s_row == 2:
-                if board.get_board()[1][4].get_piece() is None \
-                        or type(board.get_board()[1][4].get_piece()) == type(cannon_type):
-                    return False
-                piece_count += 1
-            if s_row == 7 or s_row == 8 or s_row == 9:
-                if board.get_board()[8][4].get_piece() is None \
-                        or type(board.get_board()[8][4].get_piece()) == type(cannon_type):
-                    return False
-                piece_count += 1
-        # If more than one object in between or none, not legal
-        if piece_count > 1 or piece_count == 0:
-            return False
-        return True
-
-    def is_checked(self, start_sq, end_sq, board):
-        """Will check to see if the General Piece will be in check if it moves."""
-        gen_type = General(self.get_side())
-        potential_board = copy.deepcopy(board)
-        for sq_list in board.get_board():
-            for sq in sq_list:
-                if sq.get_piece() is not None:
-                    if type(sq.get_piece()) == type(gen_type) and sq.get_piece().get_side() == self._side:
-                        gen_sq = sq
-                        potential_board.get_board()[end_sq.get_row()][end_sq.get_col()].set_piece(start_sq.get_piece())
-                        potential_board.get_board()[start_sq.get_row()][start_sq.get_col()].set_piece(None)
-                        if gen_sq.get_piece().is_checked(gen_sq, gen_sq, potential_board):
-                            return True
-                        return False
+        targets = []
+        deps = []
+        for line in LINES[index]:
+            screen = None
+            for sq in line:
+                deps.append(sq)
+                piece = board.get_piece_at(sq)
+                if screen is None:
+                    if piece is not None:
+                        # Janggi rule, not enforced before the attack maps:
+                        # a Cannon can not jump over another Cannon
+                        if type(piece) == Cannon:
+                            break
+                        screen = piece
+                elif piece is None:
+                    targets.append(sq)
+                else:
+                    # Janggi rule, not enforced before the attack maps:
+                    # a Cannon can not capture another Cannon
+                    if type(piece) != Cannon:
+                        targets.append(sq)
+                    break
+        return targets, deps
 
 
 class Soldier(Piece):
     """
-        Inherits from Piece and represents a Cannon Piece.
+        Inherits from Piece and represents a Soldier Piece.
         ** Refer to Piece **
     """
     def __init__(self, side):
         """
-            Initializes a Cannon Piece object.
+            Initializes a Soldier Piece object.
             ** Refer to Piece **
         """
         super().__init__(side)
 
-    def legal_move(self, start_loc, end_loc, board):
+    def get_attacks(self, index, board):
         """
-            Checks to see if move is legal and follows the rules specific
-            to the Cannon. Returns True, if legal. False if not.
-        :param start_loc: Starting location ("algebraic notation")
-        :param end_loc: Ending Location ("algebraic notation")
-        :param board: The board object for the Janggi Game
-        :return: True if move is legal, False if not
+            Moves one step forward or sideways, or forward along a palace
+            diagonal inside the enemy palace.
+            ** Refer to Piece **
         """
-        # get squares
-        start_sq = board.get_square_with_loc(start_loc)
-        end_sq = board.get_square_with_loc(end_loc)
-        # get row and col for start and end square
-        start_row = start_sq.get_row()
-        start_col = start_sq.get_col()
-        end_row = end_sq.get_row()
-        end_col = end_sq.get_col()
-
-        # get palace details
-        palace = None
-        if end_row == 0 or end_row == 1 or end_row == 2:
-            palace = board.get_red_palace()
-        elif end_row == 7 or end_row == 8 or end_row == 9:
-            palace = board.get_blue_palace()
-        # Checks legal moves for soldiers moving from red side
-        if self._side == "red":
-            if end_row - start_row == 1 and end_col == start_col:
-                pass
-            elif abs(end_col - start_col) == 1 and end_row == start_row:
-                pass
-            elif start_sq in palace and end_sq in palace:
-                if end_row - start_row == 1 and abs(end_col - start_col) == 1:
-                    pass
-            else:
-                return False
-        # Checks legal moves for soldiers moving from blue side
-        else:
-            if end_row - start_row == -1 and end_col == start_col:
-                pass
-            elif abs(end_col - start_col) == 1 and end_row == start_row:
-                pass
-            elif start_sq in palace and end_sq in palace:
-                if end_row - start_row == -1 and abs(end_col - start_col) == 1:
-                    pass
-            else:
-                return False
-        # Check to see if end location has a piece from the player's side
-        if end_sq.get_piece() is not None:
-            if end_sq.get_piece().get_side() == self._side:
-                return False
+        row, col = divmod(index, COLS)
+        forward = 1 if self._side == "red" else -1
+        targets = []
+        for d_row, d_col in ((forward, 0), (0, 1), (0, -1)):
+            if _on_board(row + d_row, col + d_col):
+                targets.append(_index(row + d_row, col + d_col))
+        for line in _PALACE_DIAGONALS[index]:
+            if (line[0] // COLS - row) == forward:
+                targets.append(line[0])
+        return targets, []
+
+
+def _palace_steps(index, side):
+    """
+        Returns the squares one step away from index along the lines of the
+        palace of side, which is where the General and the Guards may go.
+    """
+    palace = RED_PALACE if side == "red" else BLUE_PALACE
+    targets = [line[0] for line in ORTHOGONAL_RAYS[index] if line[0] in palace]
+    if index in palace:
+        targets.extend(line[0] for line in _PALACE_DIAGONALS[index])
+    return targets
 
-        # will move cause general to be in check?
-        self._in_check = self.is_checked(start_sq, end_sq, board)
-        if self._in_check:
-            return False
-        return True
 
-    def is_checked(self, start_sq, end_sq, board):
-        """Will check to see if the General Piece will be in check if it moves."""
-        gen_type = General(self.get_side())
-        potential_board = copy.deepcopy(board)
-        for sq_list in board.get_board():
-            for sq in sq_list:
-                if sq.get_piece() is not None:
-                    if type(sq.get_piece()) == type(gen_type) and sq.get_piece().get_side() == self._side:
-                        gen_sq = sq
-                        potential_board.get_board()[end_sq.get_row()][end_sq.get_col()].set_piece(start_sq.get_piece())
-                        potential_board.get_board()[start_sq.get_row()][start_sq.get_col()].set_piece(None)
-                        if gen_sq.get_piece().is_checked(gen_sq, gen_sq, potential_board):
-                            return True
-                        return False
+LOCATIONS = [chr(ord("a") + index % COLS) + str(index // COLS + 1) for index in range(ROWS * COLS)]
+LOCATION_INDEX = {loc: index for index, loc in enumerate(LOCATIONS)}
+
+# Moves as integers: bits 0-6 are the start square index, bits 7-13 the end
+# square index, then one flag bit for a capture and one for a pass.
+MOVE_CAPTURE = 1 << 14
+MOVE_PASS = 1 << 15
+_SQUARE_MASK = 127
+
+
+def encode_move(start, end, capture=False):
+    """
+        Packs a move between square indexes into an integer. A move with the
+        same start and end is a pass.
+    """
+    move = start | (end << 7)
+    if start == end:
+        move |= MOVE_PASS
+    elif capture:
+        move |= MOVE_CAPTURE
+    return move
+
+
+def decode_move(move):
+    """Returns the (start index, end index) of an integer move."""
+    return move & _SQUARE_MASK, (move >> 7) & _SQUARE_MASK
+
+
+def notation_to_move(start_loc, end_loc):
+    """Returns the integer move for two locations in algebraic notation (no capture flag)."""
+    start = LOCATION_INDEX[start_loc]
+    end = LOCATION_INDEX[end_loc]
+    if start == end:
+        return start | (end << 7) | MOVE_PASS
+    return start | (end << 7)
+
+
+def move_to_notation(move):
+    """Returns the (start location, end location) of an integer move."""
+    return LOCATIONS[move & _SQUARE_MASK], LOCATIONS[(move >> 7) & _SQUARE_MASK]
+
+
+def encode_moves(moves):
+    """
+        Encodes a whole list of (start location, end location) pairs at once.
+    :return: array of unsigned ints, one per move (no capture flags)
+    """
+    index = LOCATION_INDEX
+    return array("I", [index[start] | (index[end] << 7) | (MOVE_PASS if start == end else 0)
+                       for start, end in moves])
+
+
+def decode_moves(moves):
+    """Decodes a whole sequence of integer moves into (start location, end location) pairs."""
+    locations = LOCATIONS
+    return [(locations[move & _SQUARE_MASK], locations[(move >> 7) & _SQUARE_MASK]) for move in moves]
+
+# Piece codes: 0 is an empty square, 1-7 are red pieces and 8-14 are blue
+# pieces, both in PIECE_TYPES order.
+PIECE_TYPES = (General, Guard, Elephant, Horse, Chariot, Cannon, Soldier)
+_PIECE_CODES = {(piece_type, side): PIECE_TYPES.index(piece_type) + 1 + (7 if side == "blue" else 0)
+                for piece_type in PIECE_TYPES for side in SIDES}
+
+
+def piece_code(piece):
+    """Returns the code of a Piece object, 0 for None."""
+    if piece is None:
+        return 0
+    return _PIECE_CODES[(type(piece), piece.get_side())]
+
+
+def _build_zobrist():
+    """
+        Builds the random 64-bit numbers XORed together into position keys,
+        one per piece code and square. The seed is fixed so every process
+        computes the same keys.
+    """
+    rng = random.Random(2021)
+    table = [[0] * (ROWS * COLS)]
+    for _ in range(14):
+        table.append([rng.getrandbits(64) for _ in range(ROWS * COLS)])
+    return table, rng.getrandbits(64)
+
+
+_ZOBRIST, BLUE_TO_MOVE_KEY = _build_zobrist()
+
+# The starting position as piece codes, a1 to i10, with the Elephant and
+# Horse transposed on the right side.
+INITIAL_LAYOUT = (
+    5, 3, 4, 2, 0, 2, 3, 4, 5,
+    0, 0, 0, 0, 1, 0, 0, 0, 0,
+    0, 6, 0, 0, 0, 0, 0, 6, 0,
+    7, 0, 7, 0, 7, 0, 7, 0, 7,
+    0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0,
+    14, 0, 14, 0, 14, 0, 14, 0, 14,
+    0, 13, 0, 0, 0, 0, 0, 13, 0,
+    0, 0, 0, 0, 8, 0, 0, 0, 0,
+    12, 10, 11, 9, 0, 9, 10, 11, 12,
+)
+
+# Attack maps of the starting position, saved by the first Board.reset
+_initial_state = None
+
+
+def _new_piece(code):
+    """Returns a new Piece object for a piece code, None for 0."""
+    if code == 0:
+        return None
+    if code > 7:
+        return PIECE_TYPES[code - 8]("blue")
+    return PIECE_TYPES[code - 1]("red")
 
 
 class Square:
@@ -865,70 +583,512 @@ class Board:
         The Game class will communicate with this class.
         The Square class will be communicated with by this class.
     """
-    def __init__(self):
+    def __init__(self, facing_generals=False):
         """
             Initializes a Board object with a lists of list of Squares, with the
             Piece objects placed on its initial Squares. It also initializes
             the Squares in the Red Palace and Blue Palace.
+        :param facing_generals: if True, a move may not leave the two Generals
+            facing each other on an open file
         """
-        self._squares = [
-            # -----------------------------------
-            [Square(0, 0, Chariot("red"), "a1"), Square(0, 1, Elephant("red"), "b1"), Square(0, 2, Horse("red"), "c1"),
-             Square(0, 3, Guard("red"), "d1"), Square(0, 4, None, "e1"), Square(0, 5, Guard("red"), "f1"),
-             Square(0, 6, Elephant("red"), "g1"), Square(0, 7, Horse("red"), "h1"), Square(0, 8, Chariot("red"), "i1")],
-            # -----------------------------------
-            [Square(1, 0, None, "a2"), Square(1, 1, None, "b2"), Square(1, 2, None, "c2"),
-             Square(1, 3, None, "d2"), Square(1, 4, General("red"), "e2"), Square(1, 5, None, "f2"),
-             Square(1, 6, None, "g2"), Square(1, 7, None, "h2"), Square(1, 8, None, "i2")],
-            # -----------------------------------
-            [Square(2, 0, None, "a3"), Square(2, 1, Cannon("red"), "b3"), Square(2, 2, None, "c3"),
-             Square(2, 3, None, "d3"), Square(2, 4, None, "e3"), Square(2, 5, None, "f3"),
-             Square(2, 6, None, "g3"), Square(2, 7, Cannon("red"), "h3"), Square(2, 8, None, "i3")],
-            # -----------------------------------
-            [Square(3, 0, Soldier("red"), "a4"), Square(3, 1, None, "b4"), Square(3, 2, Soldier("red"), "c4"),
-             Square(3, 3, None, "d4"), Square(3, 4, Soldier("red"), "e4"), Square(3, 5, None, "f4"),
-             Square(3, 6, Soldier("red"), "g4"), Square(3, 7, None, "h4"), Square(3, 8, Soldier("red"), "i4")],
-            # -----------------------------------
-            [Square(4, 0, None, "a5"), Square(4, 1, None, "b5"), Square(4, 2, None, "c5"),
-             Square(4, 3, None, "d5"), Square(4, 4, None, "e5"), Square(4, 5, None, "f5"),
-             Square(4, 6, None, "g5"), Square(4, 7, None, "h5"), Square(4, 8, None, "i5")],
-            # -----------------------------------
-            [Square(5, 0, None, "a6"), Square(5, 1, None, "b6"), Square(5, 2, None, "c6"),
-             Square(5, 3, None, "d6"), Square(5, 4, None, "e6"), Square(5, 5, None, "f6"),
-             Square(5, 6, None, "g6"), Square(5, 7, None, "h6"), Square(5, 8, None, "i6")],
-            # -----------------------------------
-            [Square(6, 0, Soldier("blue"), "a7"), Square(6, 1, None, "b7"), Square(6, 2, Soldier("blue"), "c7"),
-             Square(6, 3, None, "d7"), Square(6, 4, Soldier("blue"), "e7"), Square(6, 5, None, "f7"),
-             Square(6, 6, Soldier("blue"), "g7"), Square(6, 7, None, "h7"), Square(6, 8, Soldier("blue"), "i7")],
-            # -----------------------------------
-            [Square(7, 0, None, "a8"), Square(7, 1, Cannon("blue"), "b8"), Square(7, 2, None, "c8"),
-             Square(7, 3, None, "d8"), Square(7, 4, None, "e8"), Square(7, 5, None, "f8"),
-             Square(7, 6, None, "g8"), Square(7, 7, Cannon("blue"), "h8"), Square(7, 8, None, "i8")],
-            # -----------------------------------
-            [Square(8, 0, None, "a9"), Square(8, 1, None, "b9"), Square(8, 2, None, "c9"),
-             Square(8, 3, None, "d9"), Square(8, 4, General("blue"), "e9"), Square(8, 5, None, "f9"),
-             Square(8, 6, None, "g9"), Square(8, 7, None, "h9"), Square(8, 8, None, "i9")],
-            # -----------------------------------
-            [Square(9, 0, Chariot("blue"), "a10"), Square(9, 1, Elephant("blue"), "b10"),
-             Square(9, 2, Horse("blue"), "c10"),
-             Square(9, 3, Guard("blue"), "d10"), Square(9, 4, None, "e10"), Square(9, 5, Guard("blue"), "f10"),
-             Square(9, 6, Elephant("blue"), "g10"), Square(9, 7, Horse("blue"), "h10"),
-             Square(9, 8, Chariot("blue"), "i10")]
-        ]
+        self._squares = [[Square(row, col, None, LOCATIONS[_index(row, col)]) for col in range(COLS)]
+                         for row in range(ROWS)]
+        # the Piece objects of the starting position, put back by reset
+        self._initial_pieces = [_new_piece(code) for code in INITIAL_LAYOUT]
         self._red_palace = [self._squares[0][3], self._squares[0][4], self._squares[0][5],
                             self._squares[1][3], self._squares[1][4], self._squares[1][5],
                             self._squares[2][3], self._squares[2][4], self._squares[2][5]]
         self._blue_palace = [self._squares[7][3], self._squares[7][4], self._squares[7][5],
                              self._squares[8][3], self._squares[8][4], self._squares[8][5],
                              self._squares[9][3], self._squares[9][4], self._squares[9][5]]
+        # Attack maps, kept up to date by _set_pieces on every change.
+        # _targets/_deps are per square index of the attacking piece, and
+        # _watchers[sq] holds the pieces whose attacks depend on sq.
+        self._cells = [square for sq_list in self._squares for square in sq_list]
+        self._attack_counts = {"red": [0] * (ROWS * COLS), "blue": [0] * (ROWS * COLS)}
+        self._targets = [None] * (ROWS * COLS)
+        self._deps = [None] * (ROWS * COLS)
+        self._attack_side = [None] * (ROWS * COLS)
+        self._watchers = [set() for _ in range(ROWS * COLS)]
+        self._piece_squares = {"red": set(), "blue": set()}
+        self._mobility = {"red": 0, "blue": 0}
+        self._generals = {"red": None, "blue": None}
+        # Move lists: _ends[index] is the list of squares the Chariot or
+        # Cannon on index attacks that do not hold a piece of its own side,
+        # None when it has to be worked out again. Every square such a piece
+        # can move to is also one it depends on, so _clear_attacks drops the
+        # list whenever one of them changes. _move_cache keeps the legal moves
+        # of each side for the version they were generated at.
+        self._ends = [None] * (ROWS * COLS)
+        self._facing_generals = facing_generals
+        # Pins and checks are worked out once per position and side. Every new
+        # position gets a new _version; undo_move restores the previous one.
+        self._version = 0
+        self._last_version = 0
+        self._version_stack = []
+        self._safety_cache = {}
+        self._move_cache = {}
+        self._key = 0
+        self.reset()
+
+    def reset(self):
+        """
+            Puts the Board back to the starting position in place, reusing its
+            Squares and Pieces. The attack maps of the starting position are
+            worked out by the first Board made and copied after that.
+        """
+        global _initial_state
+        for index, square in enumerate(self._cells):
+            piece = self._initial_pieces[index]
+            square.set_piece(piece)
+            if piece is not None:
+                piece.set_is_captured(False)
+        self._version_stack = []
+        self._safety_cache = {}
+        self._move_cache = {}
+        if _initial_state is None:
+            self._rebuild_attacks()
+            _initial_state = (self._attack_counts["red"][:], self._attack_counts["blue"][:],
+                              self._targets[:], self._deps[:], self._attack_side[:],
+                              [frozenset(watchers) for watchers in self._watchers],
+                              frozenset(self._piece_squares["red"]), frozenset(self._piece_squares["blue"]),
+                              dict(self._mobility), dict(self._generals), self._key)
+            return
+        (red_counts, blue_counts, targets, deps, attack_side, watchers, red_squares, blue_squares,
+         mobility, generals, key) = _initial_state
+        # the per-piece target and dep lists are never changed in place, so
+        # they can be shared with the template
+        self._attack_counts = {"red": red_counts[:], "blue": blue_counts[:]}
+        self._targets = targets[:]
+        self._deps = deps[:]
+        self._attack_side = attack_side[:]
+        self._watchers = [set(sq_watchers) for sq_watchers in watchers]
+        self._piece_squares = {"red": set(red_squares), "blue": set(blue_squares)}
+        self._mobility = dict(mobility)
+        self._generals = dict(generals)
+        self._ends = [None] * (ROWS * COLS)
+        self._key = key
+        self._new_version()
 
     def get_board(self):
         """Returns the Board."""
         return self._squares
 
+    def get_position(self):
+        """Returns the piece placement as a tuple of 90 piece codes, a1 to i10."""
+        return tuple(piece_code(square.get_piece()) for square in self._cells)
+
+    def set_position(self, codes):
+        """
+            Sets up the piece placement given as 90 piece codes (see
+            get_position) with new Piece objects. The move caches are
+            cleared; JanggiGame.set_position also clears the game's history.
+        """
+        for index, square in enumerate(self._cells):
+            square.set_piece(_new_piece(codes[index]))
+        self._version_stack = []
+        self._safety_cache = {}
+        self._move_cache = {}
+        self._rebuild_attacks()
+
     def set_square(self, square):
         """Sets a square in a Board equal to another square"""
         self._squares[square.get_row()][square.get_col()] = square
+        self._cells[_index(square.get_row(), square.get_col())] = square
+        self._rebuild_attacks()
+
+    def get_piece_at(self, index):
+        """Returns the Piece object on the Square at index, None if empty."""
+        return self._cells[index].get_piece()
+
+    def get_facing_generals(self):
+        """Returns True if moves may not leave the Generals facing each other."""
+        return self._facing_generals
+
+    def _rebuild_attacks(self):
+        """Recomputes the attack maps from scratch for the current Squares."""
+        self._new_version()
+        self._key = 0
+        for side in SIDES:
+            self._attack_counts[side] = [0] * (ROWS * COLS)
+            self._piece_squares[side] = set()
+            self._mobility[side] = 0
+            self._generals[side] = None
+        self._targets = [None] * (ROWS * COLS)
+        self._deps = [None] * (ROWS * COLS)
+        self._attack_side = [None] * (ROWS * COLS)
+        self._watchers = [set() for _ in range(ROWS * COLS)]
+        self._ends = [None] * (ROWS * COLS)
+        for index in range(ROWS * COLS):
+            piece = self._cells[index].get_piece()
+            if piece is not None:
+                self._piece_squares[piece.get_side()].add(index)
+                if type(piece) == General:
+                    self._generals[piece.get_side()] = index
+                self._key ^= _ZOBRIST[piece_code(piece)][index]
+                self._add_attacks(index)
+
+    def _new_version(self):
+        """Gives the current position a version number never used before."""
+        self._last_version += 1
+        self._version = self._last_version
+
+    def _add_attacks(self, index):
+        """Adds the attacks of the Piece at index to the attack maps."""
+        piece = self._cells[index].get_piece()
+        targets, deps = piece.get_attacks(index, self)
+        counts = self._attack_counts[piece.get_side()]
+        for sq in targets:
+            counts[sq] += 1
+        for sq in deps:
+            self._watchers[sq].add(index)
+        self._mobility[piece.get_side()] += len(targets)
+        self._targets[index] = targets
+        self._deps[index] = deps
+        self._attack_side[index] = piece.get_side()
+
+    def _clear_attacks(self, index):
+        """Removes the attacks registered for index from the attack maps."""
+        self._ends[index] = None
+        targets = self._targets[index]
+        if targets is None:
+            return
+        counts = self._attack_counts[self._attack_side[index]]
+        for sq in targets:
+            counts[sq] -= 1
+        for sq in self._deps[index]:
+            self._watchers[sq].discard(index)
+        self._mobility[self._attack_side[index]] -= len(targets)
+        self._targets[index] = None
+        self._deps[index] = None
+        self._attack_side[index] = None
+
+    def _set_pieces(self, changes):
+        """
+            Places pieces on Squares and updates the attack maps incrementally.
+            Only the pieces on a changed Square, and the pieces whose lines,
+            legs or screens pass through one, have their attacks recomputed.
+        :param changes: list of (index, Piece object or None) pairs
+        """
+        affected = set()
+        for index, piece in changes:
+            affected.add(index)
+            affected.update(self._watchers[index])
+        for index in affected:
+            self._clear_attacks(index)
+        for index, piece in changes:
+            old_piece = self._cells[index].get_piece()
+            self._key ^= _ZOBRIST[piece_code(old_piece)][index] ^ _ZOBRIST[piece_code(piece)][index]
+            if old_piece is not None:
+                self._piece_squares[old_piece.get_side()].discard(index)
+                if self._generals[old_piece.get_side()] == index:
+                    self._generals[old_piece.get_side()] = None
+            self._cells[index].set_piece(piece)
+            if piece is not None:
+                self._piece_squares[piece.get_side()].add(index)
+                if type(piece) == General:
+                    self._generals[piece.get_side()] = index
+        for index in affected:
+            if self._cells[index].get_piece() is not None:
+                self._add_attacks(index)
+
+    def apply_move(self, start, end):
+        """
+            Moves the Piece on square index start to square index end without
+            checking that the move is legal. Used by searches together with
+            undo_move.
+        :return: the Piece object captured on end, None if there was none
+        """
+        piece = self._cells[start].get_piece()
+        captured = self._cells[end].get_piece()
+        self._set_pieces([(start, None), (end, piece)])
+        self._version_stack.append(self._version)
+        self._new_version()
+        return captured
+
+    def undo_move(self, start, end, captured):
+        """Takes back apply_move(start, end), putting captured back on end."""
+        piece = self._cells[end].get_piece()
+        self._set_pieces([(end, captured), (start, piece)])
+        self._version = self._version_stack.pop()
+
+    def get_key(self):
+        """
+            Returns the 64-bit Zobrist key of the piece placement. XOR it with
+            BLUE_TO_MOVE_KEY to tell apart the same placement with blue to move.
+        """
+        return self._key
+
+    def get_piece_squares(self, player):
+        """Returns the set of square indexes holding the Pieces of player."""
+        return self._piece_squares[player]
+
+    def get_mobility(self, player):
+        """Returns the total number of attacks by the Pieces of player."""
+        return self._mobility[player]
+
+    def location_to_index(self, loc):
+        """Returns the square index of loc, in algebraic notation."""
+        return LOCATION_INDEX[loc]
+
+    def index_to_location(self, index):
+        """Returns the algebraic notation of square index."""
+        return LOCATIONS[index]
+
+    def get_general(self, player):
+        """Returns the square index of the General of player, None if it is gone."""
+        return self._generals[player]
+
+    def attacks(self, start_sq, end_sq):
+        """
+            Returns True if the Piece on start_sq attacks end_sq, meaning it
+            could move there under its own rules if end_sq held an enemy.
+        """
+        targets = self._targets[_index(start_sq.get_row(), start_sq.get_col())]
+        return targets is not None and _index(end_sq.get_row(), end_sq.get_col()) in targets
+
+    def leaves_in_check(self, start_sq, end_sq):
+        """
+            Checks whether the move from start_sq to end_sq would put or leave
+            the mover's General in check.
+        :return: True if the move would put or leave its General in check
+        """
+        return self._leaves_in_check(_index(start_sq.get_row(), start_sq.get_col()),
+                                     _index(end_sq.get_row(), end_sq.get_col()))
+
+    def _leaves_in_check(self, start, end):
+        """
+            Index based leaves_in_check. Most moves are settled from the pins
+            and checks of the position, and only the ambiguous ones are played
+            out on the board.
+        """
+        piece = self._cells[start].get_piece()
+        if piece is None or start == end:
+            return False
+        safety = self._get_safety(piece.get_side())
+        if safety is None:
+            return False
+        general, checkers, evasions, pins, unsafe_movers, unsafe_ends = safety
+        if start == general:
+            return self._simulate_check(start, end)
+        if checkers:
+            # only capturing a checker, blocking it or moving a cannon screen away can help
+            if end not in evasions and start not in evasions:
+                return True
+            return self._simulate_check(start, end)
+        if start in pins and end not in pins[start]:
+            return True
+        if start in unsafe_movers or end in unsafe_ends:
+            return self._simulate_check(start, end)
+        return False
+
+    def _simulate_check(self, start, end):
+        """
+            Plays the move from start to end, checks whether the mover's
+            General is attacked (or facing the other General, if that rule is
+            on) and takes the move back.
+        """
+        piece = self._cells[start].get_piece()
+        side = piece.get_side()
+        captured = self._cells[end].get_piece()
+        self._set_pieces([(start, None), (end, piece)])
+        general = self._generals[side]
+        in_check = general is not None and self._attack_counts[_other_side(side)][general] > 0
+        if not in_check and self._facing_generals:
+            in_check = self.generals_face()
+        self._set_pieces([(end, captured), (start, piece)])
+        return in_check
+
+    def generals_face(self):
+        """Returns True if the two Generals are on the same file with nothing between them."""
+        red = self._generals["red"]
+        blue = self._generals["blue"]
+        if red is None or blue is None or red % COLS != blue % COLS:
+            return False
+        return all(self._cells[sq].get_piece() is None for sq in _BETWEEN[(red, blue)])
+
+    def _get_safety(self, player):
+        """
+            Works out, once per position, what can put the General of player
+            in check:
+            - checkers: enemy pieces attacking the General (and the enemy
+              General when the facing rule is on and the file is open)
+            - evasions: when in check, the squares a move must start or end on
+              to have a chance of escaping (checkers, squares between a line
+              checker and the General, horse/elephant legs, cannon screens)
+            - pins: for pieces alone between an enemy Chariot (or the enemy
+              General, with the facing rule) and the General, the squares they
+              may still move to
+            - unsafe_movers: pieces whose move might uncover the General, a
+              cannon screen piece or a horse/elephant leg blocker
+            - unsafe_ends: squares where a piece would become a cannon screen
+        :return: (general, checkers, evasions, pins, unsafe_movers, unsafe_ends),
+            or None if player has no General
+        """
+        cached = self._safety_cache.get(player)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        general = self._generals[player]
+        if general is None:
+            self._safety_cache[player] = (self._version, None)
+            return None
+        enemy = _other_side(player)
+        checkers = []
+        evasions = set()
+        pins = {}
+        unsafe_movers = set()
+        unsafe_ends = set()
+
+        for sq in self._piece_squares[enemy]:
+            piece = self._cells[sq].get_piece()
+            piece_type = type(piece)
+            if general in self._targets[sq]:
+                checkers.append(sq)
+                evasions.add(sq)
+                evasions.update(self._deps[sq] if piece_type in (Horse, Elephant) else ())
+            if piece_type not in (Chariot, Cannon):
+                continue
+            between = _BETWEEN.get((sq, general))
+            if between is None:
+                continue
+            blockers = [b for b in between if self._cells[b].get_piece() is not None]
+            if piece_type == Chariot:
+                if not blockers:
+                    evasions.update(between)
+                elif len(blockers) == 1 and self._cells[blockers[0]].get_piece().get_side() == player:
+                    _add_pin(pins, blockers[0], set(between) | {sq})
+            elif len(blockers) <= 2:
+                # a cannon line two pieces or less from firing
+                if general in self._targets[sq]:
+                    evasions.update(between)
+                unsafe_ends.update(between)
+                for b in blockers:
+                    if self._cells[b].get_piece().get_side() == player:
+                        unsafe_movers.add(b)
+
+        for sources, leaper_type in ((HORSE_SOURCES, Horse), (ELEPHANT_SOURCES, Elephant)):
+            for source, legs in sources[general]:
+                piece = self._cells[source].get_piece()
+                if type(piece) != leaper_type or piece.get_side() != enemy:
+                    continue
+                blockers = [leg for leg in legs if self._cells[leg].get_piece() is not None]
+                if len(blockers) == 1 and self._cells[blockers[0]].get_piece().get_side() == player:
+                    unsafe_movers.add(blockers[0])
+
+        if self._facing_generals and self._generals[enemy] is not None:
+            other = self._generals[enemy]
+            between = _BETWEEN.get((other, general))
+            if between is not None and other % COLS == general % COLS:
+                blockers = [b for b in between if self._cells[b].get_piece() is not None]
+                if not blockers:
+                    checkers.append(other)
+                    evasions.add(other)
+                    evasions.update(between)
+                elif len(blockers) == 1 and self._cells[blockers[0]].get_piece().get_side() == player:
+                    _add_pin(pins, blockers[0], set(between) | {other})
+
+        safety = (general, checkers, evasions, pins, unsafe_movers, unsafe_ends)
+        self._safety_cache[player] = (self._version, safety)
+        return safety
+
+    def is_legal_move(self, start, end):
+        """
+            Returns True if the Piece on square index start may move to square
+            index end: it attacks end, end does not hold a piece of its own
+            side, and the move does not put or leave its General in check.
+        """
+        piece = self._cells[start].get_piece()
+        if piece is None or self._targets[start] is None or end not in self._targets[start]:
+            return False
+        end_piece = self._cells[end].get_piece()
+        if end_piece is not None and end_piece.get_side() == piece.get_side():
+            return False
+        return not self._leaves_in_check(start, end)
+
+    def _get_move_cache(self, player):
+        """
+            Returns the [version, moves, location pairs or None] entry of the
+            legal moves of player in the current position, generating the
+            moves if the position has changed since they were last asked for.
+            The move lists of Chariots and Cannons are kept until a square on
+            their lines changes; the short range pieces have at most eight
+            squares to look at and are worked out each time.
+        """
+        cached = self._move_cache.get(player)
+        if cached is not None and cached[0] == self._version:
+            return cached
+        cells = self._cells
+        ends_cache = self._ends
+        moves = []
+        for start in sorted(self._piece_squares[player]):
+            ends = ends_cache[start]
+            if ends is None:
+                ends = []
+                for end in self._targets[start]:
+                    end_piece = cells[end].get_piece()
+                    if end_piece is None or end_piece.get_side() != player:
+                        ends.append(end)
+                if type(cells[start].get_piece()) in (Chariot, Cannon):
+                    ends_cache[start] = ends
+            for end in ends:
+                if not self._leaves_in_check(start, end):
+                    moves.append((start, end))
+        cached = [self._version, moves, None]
+        self._move_cache[player] = cached
+        return cached
+
+    def generate_moves(self, player):
+        """
+            Returns every legal move of player, not counting a pass, as
+            (start index, end index) pairs. Asking again in the same position
+            only copies the cached list.
+        """
+        return list(self._get_move_cache(player)[1])
+
+    def get_legal_moves(self, player):
+        """
+            Returns every legal move of player, not counting a pass, as
+            (start location, end location) pairs in algebraic notation.
+        """
+        cached = self._get_move_cache(player)
+        if cached[2] is None:
+            cached[2] = [(LOCATIONS[start], LOCATIONS[end]) for start, end in cached[1]]
+        return list(cached[2])
+
+    def get_encoded_moves(self, player):
+        """
+            Returns every legal move of player, not counting a pass, as
+            integer moves (see encode_move) with the capture flag set.
+        """
+        cells = self._cells
+        return [start | (end << 7) | (MOVE_CAPTURE if cells[end].get_piece() is not None else 0)
+                for start, end in self._get_move_cache(player)[1]]
+
+    def is_in_check(self, player):
+        """
+            Returns True if the General of player is attacked by the other
+            player. This is a lookup in the attack map.
+        """
+        general = self._generals[player]
+        return general is not None and self._attack_counts[_other_side(player)][general] > 0
+
+    def is_attacked(self, loc, by_player):
+        """Returns True if the Square at loc is attacked by any Piece of by_player."""
+        sq = self.get_square_with_loc(loc)
+        return self._attack_counts[by_player][_index(sq.get_row(), sq.get_col())] > 0
+
+    def get_attack_count(self, loc, by_player):
+        """Returns the number of Pieces of by_player attacking the Square at loc."""
+        sq = self.get_square_with_loc(loc)
+        return self._attack_counts[by_player][_index(sq.get_row(), sq.get_col())]
+
+    def get_attack_map(self, by_player):
+        """
+            Returns the attack counts of by_player as a list of rows, laid out
+            the same way as get_board.
+        """
+        counts = self._attack_counts[by_player]
+        return [counts[row * COLS:(row + 1) * COLS] for row in range(ROWS)]
 
     def get_red_palace(self):
         """Returns the Red Palace"""
@@ -943,12 +1103,10 @@ class Board:
             Takes a location, in algebraic notation, and returns the
             Square associated with it.
         """
-        square = None
-        for sq_list in self._squares:
-            for sq in sq_list:
-                if loc == sq.get_location():
-                    square = sq
-        return square
+        index = LOCATION_INDEX.get(loc)
+        if index is None:
+            return None
+        return self._cells[index]
 
     def make_move(self, start_loc, end_loc):
         """
@@ -962,12 +1120,28 @@ class Board:
         end_sq = self.get_square_with_loc(end_loc)
         if start_sq.get_piece().legal_move(start_sq.get_location(), end_sq.get_location(), self):
             if end_sq.get_piece() is not None:
-                self._squares[end_sq.get_row()][end_sq.get_col()].get_piece().set_is_captured(True)
-            self._squares[end_sq.get_row()][end_sq.get_col()].set_piece(start_sq.get_piece())
-            self._squares[start_sq.get_row()][start_sq.get_col()].set_piece(None)
+                end_sq.get_piece().set_is_captured(True)
+            self._set_pieces([(_index(start_sq.get_row(), start_sq.get_col()), None),
+                              (_index(end_sq.get_row(), end_sq.get_col()), start_sq.get_piece())])
+            self._new_version()
             return True
         return False
 
+    def make_index_move(self, start, end):
+        """
+            Index based make_move: moves the Piece on square index start to
+            square index end if the move is legal.
+        :return: True if successful, False if not
+        """
+        if not self.is_legal_move(start, end):
+            return False
+        captured = self._cells[end].get_piece()
+        if captured is not None:
+            captured.set_is_captured(True)
+        self._set_pieces([(start, None), (end, self._cells[start].get_piece())])
+        self._new_version()
+        return True
+
     def display_board(self):
         """Displays the current content of the Squares on Board"""
         for sq_list in self._squares:
@@ -980,19 +1154,18 @@ class Board:
         :param player: The player ('blue' or 'red')
         :return: True if in checkmate, False if not
         """
-        piece_list = [General(player), Guard(player), Elephant(player),
-                      Horse(player), Chariot(player), Cannon(player), Soldier(player)]
-        for piece in piece_list:
-            for sq_list in self._squares:
-                for square in sq_list:
-                    if square.get_piece() is not None and square.get_piece().get_side() == player \
-                            and type(square.get_piece()) == type(piece):
-                        start_sq = square
-                        for row in self._squares:
-                            for col in row:
-                                if not square.get_piece().is_checked(start_sq, col, self):
-                                    return False
-        return True
+        # passing is always possible, so only a player in check can be mated
+        if not self.is_in_check(player):
+            return False
+        return not self._get_move_cache(player)[1]
+
+
+def _add_pin(pins, index, allowed):
+    """Restricts the pinned piece on index to the allowed squares."""
+    if index in pins:
+        pins[index] = pins[index] & allowed
+    else:
+        pins[index] = allowed
 
 
 class JanggiGame:
@@ -1000,14 +1173,92 @@ class JanggiGame:
         Represents a Game of Janggi.
         The Board class will be communicated with this class.
     """
-    def __init__(self):
+    def __init__(self, facing_generals=False, repetition_limit=None, bikjang_draw=False):
         """
             Initializes a Game object with a Board, the current state of the
-            game and the player's who's turn it is.
+            game and the player's who's turn it is. It also initializes the
+            history of position keys and how often each has occurred.
+        :param facing_generals: if True, a move may not leave the two Generals
+            facing each other on an open file
+        :param repetition_limit: if set, the game is a 'DRAW' once the same
+            position (with the same player to move) has occurred this many times
+        :param bikjang_draw: if True, the game is a 'DRAW' when a player leaves
+            the Generals facing each other after the other player faced them
         """
-        self._board = Board()
+        self._board = Board(facing_generals)
+        self._game_state = "UNFINISHED"
+        self._turn = "blue"
+        self._repetition_limit = repetition_limit
+        self._bikjang_draw = bikjang_draw
+        self._history = []
+        self._position_counts = {}
+        self._record_position()
+
+    def reset(self):
+        """Starts a new game in place, reusing the Board, Squares and Pieces."""
+        self._board.reset()
         self._game_state = "UNFINISHED"
         self._turn = "blue"
+        self._history = []
+        self._position_counts = {}
+        self._record_position()
+
+    def set_position(self, codes, turn="blue"):
+        """
+            Starts the game in place from the piece placement given as 90
+            piece codes (see Board.get_position). The history used by the draw
+            rules is cleared, so it holds only the new position.
+        :param turn: the player to move ('blue' or 'red')
+        :raises ValueError: if turn is not a player
+        """
+        if turn not in SIDES:
+            raise ValueError("turn must be 'blue' or 'red'")
+        self._board.set_position(codes)
+        self._game_state = "UNFINISHED"
+        self._turn = turn
+        self._history = []
+        self._position_counts = {}
+        self._record_position()
+
+    def get_rules(self):
+        """Returns the (facing_generals, repetition_limit, bikjang_draw) rules of the game."""
+        return self._board.get_facing_generals(), self._repetition_limit, self._bikjang_draw
+
+    def get_position_key(self):
+        """Returns the key of the current position, including whose turn it is."""
+        if self._turn == "blue":
+            return self._board.get_key() ^ BLUE_TO_MOVE_KEY
+        return self._board.get_key()
+
+    def repetition_count(self):
+        """Returns how many times the current position has occurred, this time included."""
+        return self._position_counts.get(self.get_position_key(), 0)
+
+    def get_history(self):
+        """Returns the list of position keys of the game so far, the current one last."""
+        return self._history
+
+    def _record_position(self):
+        """Adds the current position to the history."""
+        key = self.get_position_key()
+        self._history.append(key)
+        self._position_counts[key] = self._position_counts.get(key, 0) + 1
+
+    def _switch_turn(self, generals_faced):
+        """
+            Gives the turn to the other player, records the new position and
+            applies the draw rules that are turned on.
+        :param generals_faced: whether the Generals faced each other before the move
+        """
+        if self._turn == "blue":
+            self._turn = "red"
+        else:
+            self._turn = "blue"
+        self._record_position()
+        if self._repetition_limit is not None and self.repetition_count() >= self._repetition_limit:
+            self._game_state = "DRAW"
+        elif self._bikjang_draw and generals_faced and self._board.generals_face():
+            self._game_state = "DRAW"
 
     def is_in_check(self, player):
         """
@@ -1016,25 +1267,51 @@ class JanggiGame:
         :param player: The player ('blue' or 'red')
         :return: True if so, False if not
         """
-        gen_type = General(player)
-        for sq_list in self._board.get_board():
-            for square in sq_list:
-                if square.get_piece() is not None and type(square.get_piece()) == type(gen_type) \
-                        and square.get_piece().get_side() == player:
-                    if square.get_piece().is_checked(square, square, self._board):
-                        return True
-                    return False
+        return self._board.is_in_check(player)
 
-    def make_move(self, start_loc, end_loc):
+    def is_square_attacked(self, loc, player):
+        """
+            Returns True if the Square at loc (algebraic notation) is attacked
+            by any Piece of player ('blue' or 'red').
+        """
+        return self._board.is_attacked(loc, player)
+
+    def get_attack_map(self, player):
+        """
+            Returns, for every Square, how many Pieces of player attack it,
+            as a list of rows with row 1 first.
+        """
+        return self._board.get_attack_map(player)
+
+    def make_move(self, start_loc, end_loc=None):
         """
             Checks to see if move is legal and updates the Game accordingly.
-        :param start_loc: Starting location ("algebraic notation")
-        :param end_loc: Ending location ("algebraic notation")
+        :param start_loc: Starting location ("algebraic notation"), or an
+            integer move (see encode_move) with end_loc left out
+        :param end_loc: Ending location ("algebraic notation"), only left out
+            for an integer move
         :return: True if successful, False if not
         """
         # print("Attempting:", start_loc, "->", end_loc)
-        start_sq = self._board.get_square_with_loc(start_loc)
+        if end_loc is None:  # integer moves skip the locations altogether
+            if not isinstance(start_loc, int):
+                return False
+            start = start_loc & _SQUARE_MASK
+            end = (start_loc >> 7) & _SQUARE_MASK
+            if start >= ROWS * COLS or end >= ROWS * COLS:
+                return False
+            return self._make_index_move(start, end)
+        start = LOCATION_INDEX.get(start_loc)
+        end = LOCATION_INDEX.get(end_loc)
+        if start is None or end is None:
+            return False
+        return self._make_index_move(start, end)
+
+    def _make_index_move(self, start, end):
+        """make_move for a move between square indexes."""
         # self._board.display_board()
+        if self._game_state != "UNFINISHED":
+            return False
         # Checks to see if current player is in checkmate
         if self._board.is_checkmate(self._turn):
             if self._turn == "red":
@@ -1042,42 +1319,40 @@ class JanggiGame:
             else:
                 self._game_state = "RED_WON"
             return False
-        if self._game_state != "UNFINISHED":
-            return False
+        generals_faced = self._bikjang_draw and self._board.generals_face()
+        piece = self._board.get_piece_at(start)
         # If not piece in starting location, change turn and return False
-        if start_sq.get_piece() is None:
-            if self._turn == "blue":
-                self._turn = "red"
-            else:
-                self._turn = "blue"
+        if piece is None:
+            self._switch_turn(generals_faced)
             return False
         # If wrong player playing, return False
-        if start_sq.get_piece().get_side() != self._turn:
+        if piece.get_side() != self._turn:
             return False
         # If position does not change, take it as a pass
-        if start_loc == end_loc:
-            if self._turn == "blue":
-                self._turn = "red"
-            else:
-                self._turn = "blue"
+        if start == end:
+            self._switch_turn(generals_faced)
             return True
         # If move is legal, great!
-        if self._board.make_move(start_loc, end_loc):
-            if self._turn == "blue":
-                self._turn = "red"
-            else:
-                self._turn = "blue"
+        if self._board.make_index_move(start, end):
+            self._switch_turn(generals_faced)
             return True
         # Else, switch turn
         else:
-            if self._turn == "blue":
-                self._turn = "red"
-            else:
-                self._turn = "blue"
+            self._switch_turn(generals_faced)
         return False
 
+    def get_legal_moves(self, encoded=False):
+        """
+            Returns the legal moves of the player whose turn it is, not
+            counting a pass, as (start location, end location) pairs.
+        :param encoded: if True, returns integer moves (see encode_move) instead
+        """
+        if encoded:
+            return self._board.get_encoded_moves(self._turn)
+        return self._board.get_legal_moves(self._turn)
+
     def get_game_state(self):
-        """Returns state of the game"""
+        """Returns state of the game ('DRAW' only with a draw rule turned on)"""
         return self._game_state
 
     def get_turn(self):
@@ -1087,3 +1362,50 @@ class JanggiGame:
     def get_board(self):
         """Returns the board"""
         return self._board
+
+
+class JanggiGamePool:
+    """
+        Represents a bounded pool of JanggiGame objects, for servers that start
+        and finish many games. Released games are reset and kept for reuse,
+        up to max_size of them.
+    """
+    def __init__(self, max_size=64, facing_generals=False, repetition_limit=None, bikjang_draw=False):
+        """
+            Initializes a JanggiGamePool object with no games in it.
+        :param max_size: the most idle games kept
+        :param facing_generals: rules of the games made, see JanggiGame
+        :param repetition_limit: rules of the games made, see JanggiGame
+        :param bikjang_draw: rules of the games made, see JanggiGame
+        """
+        self._max_size = max_size
+        self._facing_generals = facing_generals
+        self._repetition_limit = repetition_limit
+        self._bikjang_draw = bikjang_draw
+        # idle games by id(), so the same game can not be in the pool twice
+        self._idle = {}
+
+    def acquire(self):
+        """Returns a JanggiGame at the starting position, reused if possible."""
+        if self._idle:
+            return self._idle.popitem()[1]
+        return JanggiGame(self._facing_generals, self._repetition_limit, self._bikjang_draw)
+
+    def release(self, game):
+        """
+            Gives a finished game back to the pool. The game is reset now so
+            that acquire stays cheap; it is dropped if the pool is full.
+        :raises ValueError: if the game is already in the pool, or its rules
+            are not the rules of the pool
+        """
+        if id(game) in self._idle:
+            raise ValueError("the game has already been released")
+        if game.get_rules() != (self._facing_generals, self._repetition_limit, self._bikjang_draw):
+            raise ValueError("the game's rules do not match the pool's rules")
+        if len(self._idle) < self._max_size:
+            game.reset()
+            self._idle[id(game)] = game
+
+    def get_size(self):
+        """Returns the number of idle games in the pool."""
+        return len(self._idle)
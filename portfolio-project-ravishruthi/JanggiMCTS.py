@@ -0,0 +1,354 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: A Monte Carlo tree search player for JanggiGame. Leaves are
+#              evaluated in batches by a pool of worker processes, with
+#              virtual loss keeping the leaves of one batch apart.
+#
+
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from JanggiGame import Board, BLUE_TO_MOVE_KEY
+from JanggiEngine import JanggiEngine, PIECE_VALUES
+
+# How far a score (in hundredths of a point) is from an even game when the
+# win chance is about 73%
+SCORE_SCALE = 400.0
+
+
+class _Node:
+    """
+        Represents a position in the search tree. Statistics are kept per
+        move (edge), so a position reached by different move orders is stored
+        once. Values are from the view of the player to move.
+    """
+    __slots__ = ("moves", "priors", "visits", "values", "total")
+
+    def __init__(self, moves, priors):
+        """
+            Initializes a _Node object for the moves of a position and their
+            prior probabilities, with no visits.
+        """
+        self.moves = moves
+        self.priors = priors
+        self.visits = [0] * len(moves)
+        self.values = [0.0] * len(moves)
+        self.total = 0
+
+
+class MCTSPlayer:
+    """
+        Represents a player that picks moves for a JanggiGame with PUCT Monte
+        Carlo tree search. Each round selects a batch of leaves, adding a
+        virtual loss along every selected path so the rest of the batch looks
+        elsewhere, evaluates the leaves on a pool of worker processes with
+        short random playouts (or the static evaluation alone) and backs the
+        results up. Nodes are kept by position key, so the part of the tree
+        under the new position survives when the game moves on.
+    """
+    def __init__(self, workers=None, batch_size=None, rollout_depth=8, exploration=1.5,
+                 virtual_loss=1, max_nodes=200000, seed=None):
+        """
+            Initializes an MCTSPlayer object with an empty tree.
+        :param workers: number of worker processes, defaults to the CPU
+            count; 1 evaluates in this process
+        :param batch_size: leaves evaluated per round, defaults to 4 per worker
+        :param rollout_depth: plies of random play before the static
+            evaluation, 0 to use the evaluation alone
+        :param exploration: PUCT exploration constant
+        :param virtual_loss: visits counted as losses for a pending leaf
+        :param max_nodes: the tree is pruned to the current position once it
+            holds this many nodes
+        :param seed: seed for the random playouts
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self._workers = workers
+        self._batch_size = batch_size if batch_size is not None else 4 * workers
+        self._rollout_depth = rollout_depth
+        self._exploration = exploration
+        self._virtual_loss = virtual_loss
+        self._max_nodes = max_nodes
+        self._seed = seed if seed is not None else random.randrange(1 << 30)
+        self._nodes = {}
+        self._pool = None
+        self._stats = {"playouts": 0, "seconds": 0.0, "playouts_per_second": 0.0, "nodes": 0}
+
+    def close(self):
+        """Shuts down the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def get_stats(self):
+        """
+            Returns a dict about the last choose_move: playouts, seconds,
+            playouts_per_second and nodes (size of the tree).
+        """
+        return dict(self._stats)
+
+    def choose_move(self, game, playouts=None, time_limit=None):
+        """
+            Searches the position of game and picks the most visited move for
+            the player whose turn it is.
+        :param game: a JanggiGame object, left unchanged
+        :param playouts: number of leaf evaluations to run
+        :param time_limit: seconds to search for
+        :return: (start location, end location), the same location twice for
+            a pass, or None if the player is checkmated
+        """
+        if playouts is None and time_limit is None:
+            playouts = 1000
+        board = game.get_board()
+        player = game.get_turn()
+        if len(self._nodes) >= self._max_nodes:
+            self.advance(game)
+        root_key = _key(board, player)
+        root = self._expand(board, player, root_key)
+        if not root.moves:
+            return None
+
+        start_time = time.time()
+        done = 0
+        while (playouts is None or done < playouts) and \
+                (time_limit is None or time.time() - start_time < time_limit):
+            batch = self._batch_size if playouts is None else min(self._batch_size, playouts - done)
+            done += self._run_batch(board, player, root_key, batch)
+        seconds = time.time() - start_time
+        self._stats = {"playouts": done, "seconds": seconds,
+                       "playouts_per_second": done / seconds if seconds > 0 else 0.0,
+                       "nodes": len(self._nodes)}
+
+        best = max(range(len(root.moves)), key=lambda i: (root.visits[i], root.values[i]))
+        start, end = root.moves[best]
+        return board.index_to_location(start), board.index_to_location(end)
+
+    def advance(self, game):
+        """
+            Drops every node that can not be reached from the position of
+            game, keeping the subtree under it.
+        """
+        board = game.get_board()
+        player = game.get_turn()
+        root_key = _key(board, player)
+        root = self._nodes.get(root_key)
+        if root is None:
+            self._nodes = {}
+            return
+        keep = {root_key: root}
+        # depth first walk over visited moves, playing them on the board
+        stack = [[root, player, 0, None, None]]
+        while stack:
+            frame = stack[-1]
+            node, side = frame[0], frame[1]
+            if frame[2] == len(node.moves):
+                stack.pop()
+                if frame[3] is not None and frame[3][0] != frame[3][1]:
+                    board.undo_move(frame[3][0], frame[3][1], frame[4])
+                continue
+            move = node.moves[frame[2]]
+            frame[2] += 1
+            if node.visits[frame[2] - 1] == 0:
+                continue
+            captured = board.apply_move(move[0], move[1]) if move[0] != move[1] else None
+            child_key = _key(board, _other(side))
+            child = self._nodes.get(child_key)
+            if child is None or child_key in keep:
+                if move[0] != move[1]:
+                    board.undo_move(move[0], move[1], captured)
+                continue
+            keep[child_key] = child
+            stack.append([child, _other(side), 0, move, captured])
+        self._nodes = keep
+
+    def _expand(self, board, player, key):
+        """Returns the node of the position, making it if it is new."""
+        node = self._nodes.get(key)
+        if node is not None:
+            return node
+        moves = board.generate_moves(player)
+        general = board.get_general(player)
+        if general is not None and not board.is_in_check(player):
+            moves.append((general, general))
+        # captures of valuable pieces get a larger prior, a pass a small one
+        weights = []
+        for start, end in moves:
+            victim = board.get_piece_at(end) if start != end else None
+            if start == end:
+                weights.append(0.25)
+            elif victim is None:
+                weights.append(1.0)
+            else:
+                weights.append(1.0 + PIECE_VALUES[type(victim)] / 100.0)
+        total = sum(weights)
+        node = _Node(moves, [weight / total for weight in weights])
+        self._nodes[key] = node
+        return node
+
+    def _select(self, node):
+        """Returns the index of the move to follow from node (PUCT)."""
+        sqrt_total = math.sqrt(node.total + 1)
+        best = 0
+        best_score = -1.0
+        for i in range(len(node.moves)):
+            visits = node.visits[i]
+            q = node.values[i] / visits if visits else 0.5
+            score = q + self._exploration * node.priors[i] * sqrt_total / (1 + visits)
+            if score > best_score:
+                best_score = score
+                best = i
+        return best
+
+    def _run_batch(self, board, player, root_key, batch_size):
+        """
+            Selects up to batch_size leaves, evaluates them together and backs
+            up the results.
+        :return: number of leaves evaluated
+        """
+        paths = []
+        leaves = []
+        ready = []
+        for _ in range(batch_size):
+            path, leaf, value = self._descend(board, player, root_key)
+            if leaf is None:
+                ready.append((path, value))
+            else:
+                paths.append(path)
+                leaves.append(leaf)
+        values = self._evaluate(leaves, board.get_facing_generals())
+        for path, value in zip(paths, values):
+            self._backup(path, value)
+        for path, value in ready:
+            self._backup(path, value)
+        return len(leaves) + len(ready)
+
+    def _descend(self, board, player, root_key):
+        """
+            Walks down from the root, adding virtual loss on the way, until it
+            reaches a new position or a finished game. The board is restored
+            before returning.
+        :return: (path of (node, move index) pairs, leaf to evaluate or None,
+            value for the player to move at the end if it needs no evaluation)
+        """
+        path = []
+        played = []
+        seen = {root_key}
+        side = player
+        node = self._nodes[root_key]
+        leaf = None
+        value = None
+        while True:
+            if not node.moves:
+                value = 0.0  # checkmated
+                break
+            i = self._select(node)
+            node.visits[i] += self._virtual_loss
+            node.total += self._virtual_loss
+            path.append((node, i))
+            start, end = node.moves[i]
+            played.append((start, end, board.apply_move(start, end) if start != end else None))
+            side = _other(side)
+            key = _key(board, side)
+            if key in seen:
+                value = 0.5  # going round in circles
+                break
+            seen.add(key)
+            child = self._nodes.get(key)
+            if child is None:
+                self._expand(board, side, key)
+                leaf = (board.get_position(), side, self._seed + len(self._nodes))
+                break
+            node = child
+        for start, end, captured in reversed(played):
+            if start != end:
+                board.undo_move(start, end, captured)
+        return path, leaf, value
+
+    def _backup(self, path, value):
+        """
+            Adds a result to every move on path and takes off its virtual loss.
+        :param value: result for the player to move after the last move
+        """
+        for node, i in reversed(path):
+            value = 1.0 - value
+            node.visits[i] += 1 - self._virtual_loss
+            node.total += 1 - self._virtual_loss
+            node.values[i] += value
+
+    def _evaluate(self, leaves, facing_generals):
+        """
+            Returns the value of every leaf, using the worker pool if there is
+            one. The rollouts follow the facing_generals rule of the game.
+        """
+        args = [(position, side, self._rollout_depth, seed, facing_generals) for position, side, seed in leaves]
+        if self._workers <= 1 or len(args) <= 1:
+            return [_evaluate_leaf(*arg) for arg in args]
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self._workers)
+        chunk = max(1, len(args) // self._workers)
+        return list(self._pool.map(_evaluate_leaf_args, args, chunksize=chunk))
+
+
+def _key(board, player):
+    """Returns the key of the position with player to move."""
+    if player == "blue":
+        return board.get_key() ^ BLUE_TO_MOVE_KEY
+    return board.get_key()
+
+
+def _other(player):
+    """Returns the opposing player."""
+    if player == "red":
+        return "blue"
+    return "red"
+
+
+# Boards (one per facing_generals rule) and engine of the current process,
+# reused for every leaf.
+_leaf_boards = {}
+_leaf_engine = None
+
+
+def _evaluate_leaf_args(args):
+    """Calls _evaluate_leaf with a tuple of arguments (for Pool.map)."""
+    return _evaluate_leaf(*args)
+
+
+def _evaluate_leaf(position, player, rollout_depth, seed, facing_generals=False):
+    """
+        Plays up to rollout_depth random moves from a position, preferring
+        captures, and scores where it ends up.
+    :param position: 90 piece codes, see Board.get_position
+    :param player: the player to move
+    :param facing_generals: the facing_generals rule of the game, so the
+        rollout moves are legal under the same rules as the tree moves
+    :return: chance of winning for player, between 0 and 1
+    """
+    global _leaf_engine
+    if _leaf_engine is None:
+        _leaf_engine = JanggiEngine(1)
+    board = _leaf_boards.get(facing_generals)
+    if board is None:
+        board = _leaf_boards[facing_generals] = Board(facing_generals)
+    board.set_position(position)
+    rng = random.Random(seed)
+    side = player
+    for _ in range(rollout_depth):
+        moves = board.generate_moves(side)
+        if not moves:
+            if board.is_in_check(side):
+                return 0.0 if side == player else 1.0
+            side = _other(side)
+            continue
+        captures = [move for move in moves if board.get_piece_at(move[1]) is not None]
+        if captures and rng.random() < 0.5:
+            start, end = rng.choice(captures)
+        else:
+            start, end = rng.choice(moves)
+        board.apply_move(start, end)
+        side = _other(side)
+    score = _leaf_engine.evaluate(board, player)
+    return 1.0 / (1.0 + math.exp(-score / SCORE_SCALE))
@@ -0,0 +1,223 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: A bulk validator for imported Janggi positions. Positions are
+#              rows of 90 piece codes (see Board.get_position) and are checked
+#              many at a time with NumPy masks built from the same palaces,
+#              lines and piece moves that Board uses.
+#
+
+import numpy as np
+
+from JanggiGame import Board, General, Guard, Elephant, Horse, Chariot, Cannon, Soldier, \
+    ROWS, COLS, SIDES, RED_PALACE, BLUE_PALACE, INITIAL_LAYOUT, piece_code, \
+    LINES, ORTHOGONAL_RAYS, HORSE_SOURCES, ELEPHANT_SOURCES
+
+# Error flags, ORed together into the error code of a position. A valid
+# position has the code 0.
+INVALID_PIECE_CODE = 1
+MISSING_GENERAL = 2
+GENERAL_OUTSIDE_PALACE = 4
+GUARD_OUTSIDE_PALACE = 8
+SOLDIER_BEHIND_START = 16
+TOO_MANY_PIECES = 32
+OPPONENT_IN_CHECK = 64
+
+ERROR_NAMES = {
+    INVALID_PIECE_CODE: "INVALID_PIECE_CODE",
+    MISSING_GENERAL: "MISSING_GENERAL",
+    GENERAL_OUTSIDE_PALACE: "GENERAL_OUTSIDE_PALACE",
+    GUARD_OUTSIDE_PALACE: "GUARD_OUTSIDE_PALACE",
+    SOLDIER_BEHIND_START: "SOLDIER_BEHIND_START",
+    TOO_MANY_PIECES: "TOO_MANY_PIECES",
+    OPPONENT_IN_CHECK: "OPPONENT_IN_CHECK",
+}
+
+SQUARES = ROWS * COLS
+CODES = 15
+
+_GENERAL_CODES = [piece_code(General("red")), piece_code(General("blue"))]
+_CANNON_CODES = (piece_code(Cannon("red")), piece_code(Cannon("blue")))
+
+
+def _build_forbidden():
+    """
+        Builds the squares that pieces with a restricted placement may not
+        stand on. Generals and Guards stay in their palace, and Soldiers never
+        go back past the rank they start on in INITIAL_LAYOUT.
+    :return: list of (piece code, SQUARES bool array, error flag)
+    """
+    forbidden = []
+    rows = np.arange(SQUARES) // COLS
+    for side, palace in (("red", RED_PALACE), ("blue", BLUE_PALACE)):
+        outside = np.ones(SQUARES, dtype=bool)
+        outside[list(palace)] = False
+        forbidden.append((piece_code(General(side)), outside, GENERAL_OUTSIDE_PALACE))
+        forbidden.append((piece_code(Guard(side)), outside, GUARD_OUTSIDE_PALACE))
+        code = piece_code(Soldier(side))
+        start_rows = [index // COLS for index, layout_code in enumerate(INITIAL_LAYOUT) if layout_code == code]
+        if side == "red":
+            forbidden.append((code, rows < min(start_rows), SOLDIER_BEHIND_START))
+        else:
+            forbidden.append((code, rows > max(start_rows), SOLDIER_BEHIND_START))
+    return forbidden
+
+
+def _build_max_counts():
+    """Returns how many pieces of each code a side starts with, the most it can have."""
+    counts = np.zeros(CODES, dtype=np.int64)
+    for code in INITIAL_LAYOUT:
+        counts[code] += 1
+    # code 0 is an empty square, which there can be any number of
+    counts[0] = SQUARES
+    return counts
+
+
+def _build_step_attackers():
+    """
+        For every side and square, builds the (square, code) pairs of the
+        Generals, Guards and Soldiers of that side that attack the square.
+        Their moves do not depend on the other pieces, so they are read off
+        an empty Board.
+    """
+    board = Board()
+    board.set_position((0,) * SQUARES)
+    attackers = {}
+    for side in SIDES:
+        attackers[side] = [[] for _ in range(SQUARES)]
+        for piece_type in (General, Guard, Soldier):
+            piece = piece_type(side)
+            for source in range(SQUARES):
+                for target in piece.get_attacks(source, board)[0]:
+                    attackers[side][target].append((source, piece_code(piece)))
+    return attackers
+
+
+def _build_rays():
+    """
+        For every square, builds the lines leading away from it as index
+        arrays, with whether the line is orthogonal (the only way two
+        Generals can face each other).
+    """
+    return [[(np.array(line), line in ORTHOGONAL_RAYS[sq]) for line in LINES[sq]] for sq in range(SQUARES)]
+
+
+_FORBIDDEN = _build_forbidden()
+_MAX_COUNTS = _build_max_counts()
+_STEP_ATTACKERS = _build_step_attackers()
+_RAYS = _build_rays()
+
+
+def describe_errors(code):
+    """Returns the names of the error flags set in an error code, in flag order."""
+    return [name for flag, name in sorted(ERROR_NAMES.items()) if code & flag]
+
+
+def validate_positions(positions, to_move, facing_generals=False, chunk_size=262144):
+    """
+        Checks many positions at once and returns an error code for each.
+    :param positions: array-like of shape (N, 90) holding piece codes, a1 to
+        i10 (see Board.get_position)
+    :param to_move: the player to move, 'red' or 'blue', either one string
+        for every position or an array-like of N strings
+    :param facing_generals: if True, the two Generals facing each other on an
+        open file also counts as the side not to move being in check
+    :param chunk_size: positions checked together, which bounds the memory
+        used for the temporary masks
+    :return: NumPy array of N error codes, 0 for a valid position
+    :raises ValueError: if the shapes of positions and to_move do not match
+    """
+    positions = np.asarray(positions)
+    if positions.ndim != 2 or positions.shape[1] != SQUARES:
+        raise ValueError("positions must have shape (N, " + str(SQUARES) + ")")
+    count = positions.shape[0]
+    blue_to_move = np.broadcast_to(np.asarray(to_move) == "blue", (count,))
+    errors = np.zeros(count, dtype=np.uint16)
+    for start in range(0, count, chunk_size):
+        end = min(start + chunk_size, count)
+        errors[start:end] = _validate_chunk(positions[start:end], blue_to_move[start:end], facing_generals)
+    return errors
+
+
+def _validate_chunk(positions, blue_to_move, facing_generals):
+    """Returns the error codes of one chunk of validate_positions."""
+    invalid = positions >= CODES
+    if positions.dtype.kind != "u":
+        invalid |= positions < 0
+    invalid_rows = invalid.any(axis=1)
+    errors = np.where(invalid_rows, INVALID_PIECE_CODE, 0).astype(np.uint16)
+    if invalid_rows.any():
+        positions = np.where(invalid, 0, positions)
+    codes = positions.astype(np.uint8)
+
+    for code, squares, flag in _FORBIDDEN:
+        errors[((codes == code) & squares).any(axis=1)] |= flag
+
+    # one bincount over (row, code) pairs counts every code of every row
+    row_offsets = (np.arange(len(codes), dtype=np.int32) * CODES)[:, None]
+    counts = np.bincount((row_offsets + codes).ravel(), minlength=len(codes) * CODES).reshape(-1, CODES)
+    errors[(counts > _MAX_COUNTS).any(axis=1)] |= TOO_MANY_PIECES
+    # the Generals are never captured
+    errors[(counts[:, _GENERAL_CODES] == 0).any(axis=1)] |= MISSING_GENERAL
+
+    errors[_opponent_in_check(codes, blue_to_move, facing_generals)] |= OPPONENT_IN_CHECK
+    return errors
+
+
+def _opponent_in_check(codes, blue_to_move, facing_generals):
+    """
+        Returns a bool array, True where the General of the side not to move
+        is attacked by the side to move. Positions are grouped by the square
+        of that General and the side to move, and every group is checked
+        with one mask per line, leg and attacking square.
+    """
+    victim = np.where(blue_to_move, _GENERAL_CODES[0], _GENERAL_CODES[1])
+    is_victim = codes == victim[:, None]
+    has_general = is_victim.any(axis=1)
+    general_sq = is_victim.argmax(axis=1)
+
+    in_check = np.zeros(len(codes), dtype=bool)
+    group_keys = general_sq * 2 + blue_to_move
+    for key in np.unique(group_keys[has_general]):
+        rows = np.nonzero(has_general & (group_keys == key))[0]
+        attacked = _attacked(codes[rows], int(key) // 2, "blue" if key % 2 else "red", facing_generals)
+        in_check[rows] = attacked
+    return in_check
+
+
+def _attacked(codes, sq, side, facing_generals):
+    """
+        Returns a bool array, True for the positions in which a piece of side
+        attacks square sq.
+    :param codes: uint8 array of shape (n, 90)
+    """
+    general = piece_code(General(side))
+    horse = piece_code(Horse(side))
+    elephant = piece_code(Elephant(side))
+    chariot = piece_code(Chariot(side))
+    cannon = piece_code(Cannon(side))
+    attacked = np.zeros(len(codes), dtype=bool)
+
+    for source, code in _STEP_ATTACKERS[side][sq]:
+        attacked |= codes[:, source] == code
+    for source, legs in HORSE_SOURCES[sq]:
+        attacked |= (codes[:, source] == horse) & (codes[:, legs[0]] == 0)
+    for source, legs in ELEPHANT_SOURCES[sq]:
+        attacked |= (codes[:, source] == elephant) & (codes[:, legs[0]] == 0) & (codes[:, legs[1]] == 0)
+
+    index = np.arange(len(codes))
+    for line, orthogonal in _RAYS[sq]:
+        segment = codes[:, line]
+        occupied = segment != 0
+        has_first = occupied.any(axis=1)
+        first = occupied.argmax(axis=1)
+        first_code = segment[index, first]
+        attacked |= has_first & (first_code == chariot)
+        if facing_generals and orthogonal:
+            attacked |= has_first & (first_code == general)
+        # a cannon jumps exactly one piece, which may not be a cannon
+        occupied[index, first] = False
+        has_second = has_first & occupied.any(axis=1)
+        second_code = segment[index, occupied.argmax(axis=1)]
+        attacked |= has_second & (second_code == cannon) & \
+            (first_code != _CANNON_CODES[0]) & (first_code != _CANNON_CODES[1])
+    return attacked
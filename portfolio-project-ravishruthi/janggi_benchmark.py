@@ -0,0 +1,290 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: A latency benchmark for the JanggiGame calls callers make
+#              (make_move, is_in_check and get_game_state). It plays a set of
+#              scripted games, records the time of every call and the memory
+#              used per game, and writes the results as JSON so that two runs
+#              can be compared.
+#
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from JanggiGame import JanggiGame, General, Guard, Elephant, Horse, Chariot, Cannon, Soldier, \
+    LOCATION_INDEX, SIDES, piece_code
+
+CALLS = ("make_move", "is_in_check", "get_game_state")
+
+
+def _layout(pieces):
+    """
+        Returns the 90 piece codes (see Board.get_position) of a position.
+    :param pieces: dict of location to (Piece class, side)
+    """
+    codes = [0] * len(LOCATION_INDEX)
+    for loc, (piece_type, side) in pieces.items():
+        codes[LOCATION_INDEX[loc]] = piece_code(piece_type(side))
+    return tuple(codes)
+
+
+# A quiet opening from the starting position, with one soldier exchange.
+OPENING_MOVES = [
+    ("c10", "d8"), ("c1", "d3"), ("g7", "f7"), ("g4", "f4"), ("h10", "g8"), ("h1", "g3"),
+    ("b8", "e8"), ("b3", "e3"), ("a10", "a9"), ("a1", "a2"), ("a9", "d9"), ("i1", "i2"),
+    ("i10", "i9"), ("i2", "f2"), ("e7", "e6"), ("e4", "e5"), ("e6", "e5"), ("e3", "e6"),
+]
+
+# Blue pieces pressing on a full red palace. The moves are mostly checks,
+# blocks and captures inside the palace.
+CROWDED_PALACE = _layout({
+    "e2": (General, "red"), "d1": (Guard, "red"), "f2": (Guard, "red"), "e1": (Chariot, "red"),
+    "i1": (Chariot, "red"), "f3": (Cannon, "red"), "c3": (Horse, "red"), "g1": (Elephant, "red"),
+    "a4": (Soldier, "red"), "c4": (Soldier, "red"), "e4": (Soldier, "red"), "g4": (Soldier, "red"),
+    "e9": (General, "blue"), "d10": (Guard, "blue"), "f10": (Guard, "blue"), "a10": (Chariot, "blue"),
+    "d8": (Chariot, "blue"), "b5": (Cannon, "blue"), "h8": (Cannon, "blue"), "f5": (Horse, "blue"),
+    "d9": (Horse, "blue"), "d4": (Soldier, "blue"), "g5": (Soldier, "blue"), "c7": (Soldier, "blue"),
+})
+CROWDED_PALACE_MOVES = [
+    ("d4", "d3"), ("e2", "f1"), ("d3", "d2"), ("e1", "e3"), ("d2", "e2"), ("c3", "e2"),
+    ("d8", "d1"), ("f3", "d1"), ("f5", "e3"), ("a4", "b4"), ("a10", "a8"), ("e4", "d4"),
+    ("e3", "c2"), ("d1", "f3"), ("c2", "e3"), ("i1", "i8"), ("d9", "e7"), ("f3", "d3"),
+    ("f10", "e10"), ("i8", "i4"), ("a8", "a7"), ("g4", "g5"), ("e7", "c6"), ("d3", "d10"),
+]
+
+# Blue mates with h5-d5: the Elephant can not block the d file and the
+# Chariot on e8 covers e2. Red's next move finds the checkmate.
+CHECKMATE_IN_ONE = _layout({
+    "d1": (General, "red"), "e1": (Elephant, "red"), "a4": (Soldier, "red"), "i4": (Soldier, "red"),
+    "f10": (General, "blue"), "e8": (Chariot, "blue"), "h5": (Chariot, "blue"),
+    "a7": (Soldier, "blue"), "i7": (Soldier, "blue"),
+})
+
+# Each scenario is played from position (None for the starting position)
+# with blue to move. Every move must return True except where expected
+# says otherwise, and the game must end in state.
+SCENARIOS = {
+    "opening": {
+        "position": None,
+        "moves": OPENING_MOVES,
+        "state": "UNFINISHED",
+    },
+    "crowded_palace": {
+        "position": CROWDED_PALACE,
+        "moves": CROWDED_PALACE_MOVES,
+        "state": "UNFINISHED",
+    },
+    "checkmate_in_one": {
+        "position": CHECKMATE_IN_ONE,
+        "moves": [("h5", "d5"), ("d1", "e2")],
+        "expected": [True, False],
+        "state": "BLUE_WON",
+    },
+    "long_passes": {
+        "position": None,
+        "moves": [("e9", "e9"), ("e2", "e2")] * 100,
+        "state": "UNFINISHED",
+    },
+}
+
+
+def _new_game(scenario, game=None):
+    """
+        Sets up the position of a scenario, on game if given (reset or set
+        to the position in place) or on a new JanggiGame.
+    :return: the JanggiGame object
+    """
+    if game is None:
+        game = JanggiGame()
+    elif scenario["position"] is None:
+        game.reset()
+    if scenario["position"] is not None:
+        game.set_position(scenario["position"])
+    return game
+
+
+def check_scenario(name):
+    """
+        Plays a scenario once and checks that every move has the expected
+        result and that the game ends in the expected state.
+    :raises ValueError: if it does not
+    """
+    scenario = SCENARIOS[name]
+    game = _new_game(scenario)
+    expected = scenario.get("expected", [True] * len(scenario["moves"]))
+    for ply, (start_loc, end_loc) in enumerate(scenario["moves"]):
+        if game.make_move(start_loc, end_loc) != expected[ply]:
+            raise ValueError(name + ": unexpected result at ply " + str(ply + 1) + ": " +
+                             start_loc + " " + end_loc)
+    if game.get_game_state() != scenario["state"]:
+        raise ValueError(name + ": game ended as " + game.get_game_state() + ", not " + scenario["state"])
+
+
+def _timer_overhead(samples=10000):
+    """Returns the median time in ns of two back to back clock reads."""
+    clock = time.perf_counter_ns
+    times = []
+    for _ in range(samples):
+        start = clock()
+        times.append(clock() - start)
+    times.sort()
+    return times[len(times) // 2]
+
+
+def _summarize(times):
+    """
+        Returns the count, mean and percentiles of a list of times in ns.
+        Percentiles use the nearest rank.
+    """
+    times = sorted(times)
+    count = len(times)
+
+    def percentile(p):
+        return times[min(count - 1, max(0, -(-p * count // 100) - 1))]
+
+    return {"count": count, "mean_ns": round(sum(times) / count, 1), "min_ns": times[0],
+            "p50_ns": percentile(50), "p90_ns": percentile(90), "p99_ns": percentile(99),
+            "max_ns": times[-1]}
+
+
+def time_scenario(name, rounds):
+    """
+        Plays a scenario rounds times, timing every make_move and, after each
+        move, is_in_check for both players and get_game_state. Setting up the
+        position between rounds is not timed.
+    :return: dict of call name to latency summary (see _summarize)
+    """
+    scenario = SCENARIOS[name]
+    clock = time.perf_counter_ns
+    samples = {call: [] for call in CALLS}
+    make_times = samples["make_move"]
+    check_times = samples["is_in_check"]
+    state_times = samples["get_game_state"]
+    game = JanggiGame()
+    for _ in range(rounds):
+        _new_game(scenario, game)
+        for start_loc, end_loc in scenario["moves"]:
+            start = clock()
+            game.make_move(start_loc, end_loc)
+            make_times.append(clock() - start)
+            for player in SIDES:
+                start = clock()
+                game.is_in_check(player)
+                check_times.append(clock() - start)
+            start = clock()
+            game.get_game_state()
+            state_times.append(clock() - start)
+    return {call: _summarize(samples[call]) for call in CALLS}
+
+
+def measure_memory(name):
+    """
+        Measures with tracemalloc the memory allocated by one game of a
+        scenario: when set up, after all of its moves, and at the peak.
+    :return: dict of byte counts
+    """
+    scenario = SCENARIOS[name]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        game = _new_game(scenario)
+        setup = tracemalloc.get_traced_memory()[0] - base
+        for start_loc, end_loc in scenario["moves"]:
+            game.make_move(start_loc, end_loc)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"setup_bytes": setup, "after_moves_bytes": current - base, "peak_bytes": peak - base}
+
+
+def run(names=None, rounds=200):
+    """
+        Runs the benchmark.
+    :param names: scenarios to run, all of them if None
+    :param rounds: times every scenario is played for the latency figures
+    :return: the results as a dict that can be written as JSON
+    """
+    if names is None:
+        names = list(SCENARIOS)
+    for name in names:
+        check_scenario(name)
+    # the first game fills the starting position cache, which every later
+    # game shares, so it is not counted against any scenario
+    JanggiGame()
+    results = {
+        "python": platform.python_implementation() + " " + platform.python_version(),
+        "platform": platform.platform(),
+        "rounds": rounds,
+        "timer_overhead_ns": _timer_overhead(),
+        "scenarios": {},
+    }
+    for name in names:
+        results["scenarios"][name] = {
+            "plies": len(SCENARIOS[name]["moves"]),
+            "latency": time_scenario(name, rounds),
+            "memory": measure_memory(name),
+        }
+    return results
+
+
+def compare(old, new, threshold=0.25):
+    """
+        Compares the median and 90th percentile latencies of two runs.
+    :param threshold: a ratio above 1 + threshold counts as a regression
+    :return: (list of report lines, number of regressions)
+    """
+    lines = []
+    regressions = 0
+    for name, result in new["scenarios"].items():
+        if name not in old["scenarios"]:
+            continue
+        for call in CALLS:
+            for stat in ("p50_ns", "p90_ns"):
+                before = old["scenarios"][name]["latency"][call][stat]
+                after = result["latency"][call][stat]
+                ratio = after / before if before else float("inf")
+                flag = ""
+                if ratio > 1 + threshold:
+                    flag = "  REGRESSION"
+                    regressions += 1
+                lines.append("%-17s %-15s %-7s %9d -> %9d  x%.2f%s" % (name, call, stat[:3], before, after,
+                                                                      ratio, flag))
+    return lines, regressions
+
+
+def main():
+    """Runs the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Latency benchmark for JanggiGame.")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run, may be given more than once (default: all)")
+    parser.add_argument("--rounds", type=int, default=200, help="times every scenario is played")
+    parser.add_argument("--output", help="file to write the JSON results to (default: standard output)")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="slowdown ratio above 1 that --compare reports as a regression")
+    args = parser.parse_args()
+
+    results = run(args.scenario, args.rounds)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as out:
+            out.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare) as old_file:
+            old = json.load(old_file)
+        lines, regressions = compare(old, results, args.threshold)
+        for line in lines:
+            print(line, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Tests of janggi_benchmark.py: every scenario plays as scripted,
+#              also on a reused game, a small run has results for every
+#              scenario and call, and compare() flags slowdowns.
+#
+
+import json
+
+import pytest
+
+import janggi_benchmark
+from janggi_benchmark import SCENARIOS, CALLS, _new_game, _summarize, check_scenario, compare, run
+from JanggiGame import JanggiGame
+
+
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+def test_scenario_plays_as_scripted(name):
+    check_scenario(name)
+
+
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+def test_reused_game_plays_the_same(name):
+    scenario = SCENARIOS[name]
+    game = JanggiGame()
+    for _ in range(2):
+        _new_game(scenario, game)
+        assert game.get_turn() == "blue"
+        assert len(game.get_history()) == 1
+        results = [game.make_move(*move) for move in scenario["moves"]]
+        assert results == scenario.get("expected", [True] * len(scenario["moves"]))
+        assert game.get_game_state() == scenario["state"]
+
+
+def test_check_scenario_raises_on_an_unexpected_result(monkeypatch):
+    broken = dict(SCENARIOS["opening"], moves=[("c10", "d8"), ("c10", "d8")])
+    monkeypatch.setitem(janggi_benchmark.SCENARIOS, "broken", broken)
+    with pytest.raises(ValueError, match="ply 2"):
+        check_scenario("broken")
+    monkeypatch.setitem(janggi_benchmark.SCENARIOS, "broken", dict(broken, moves=[], state="DRAW"))
+    with pytest.raises(ValueError, match="UNFINISHED"):
+        check_scenario("broken")
+
+
+def test_summarize_uses_nearest_rank_percentiles():
+    summary = _summarize(list(range(100, 0, -1)))
+    assert summary == {"count": 100, "mean_ns": 50.5, "min_ns": 1, "p50_ns": 50, "p90_ns": 90, "p99_ns": 99,
+                       "max_ns": 100}
+    assert _summarize([7])["p99_ns"] == 7
+
+
+def test_small_run_has_every_scenario_and_call():
+    results = run(rounds=2)
+    json.dumps(results)
+    assert sorted(results["scenarios"]) == sorted(SCENARIOS)
+    for name, result in results["scenarios"].items():
+        assert result["plies"] == len(SCENARIOS[name]["moves"])
+        for call in CALLS:
+            assert result["latency"][call]["count"] == 2 * result["plies"] * (2 if call == "is_in_check" else 1)
+        assert result["memory"]["peak_bytes"] >= result["memory"]["after_moves_bytes"]
+
+
+def test_compare_flags_regressions():
+    old = run(["checkmate_in_one"], rounds=1)
+    new = json.loads(json.dumps(old))
+    lines, regressions = compare(old, new)
+    assert regressions == 0
+    assert len(lines) == 2 * len(CALLS)
+    new["scenarios"]["checkmate_in_one"]["latency"]["make_move"]["p90_ns"] = \
+        2 * old["scenarios"]["checkmate_in_one"]["latency"]["make_move"]["p90_ns"] + 1
+    lines, regressions = compare(old, new)
+    assert regressions == 1
+    assert sum(line.endswith("REGRESSION") for line in lines) == 1
+    assert compare({"scenarios": {}}, new) == ([], 0)
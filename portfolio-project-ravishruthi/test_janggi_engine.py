@@ -0,0 +1,184 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Tests of JanggiEngine: searches find captures and mates and
+#              leave the board as it was, analyze_game gives the same
+#              annotations in one process and in many, and pondering hands
+#              its search over on a hit and is cancelled on a miss.
+#
+
+import random
+
+import pytest
+
+from JanggiEngine import JanggiEngine, SearchContext, SearchTimeout, MATE_SCORE, MAX_PLY, analyze_game
+from JanggiGame import JanggiGame, encode_move, LOCATION_INDEX
+from test_janggi_game import make_game, GENERALS
+
+
+def random_moves(count, seed):
+    """returns count random legal moves from the starting position, as location pairs"""
+    rng = random.Random(seed)
+    game = JanggiGame()
+    moves = []
+    for _ in range(count):
+        move = rng.choice(game.get_legal_moves())
+        game.make_move(*move)
+        moves.append(move)
+    return moves
+
+
+def test_search_takes_a_free_chariot():
+    game = make_game(dict(GENERALS, a10="bR", a3="rR"))
+    result = JanggiEngine().search(game.get_board(), "blue", depth=2)
+    assert result["move"] == (LOCATION_INDEX["a10"], LOCATION_INDEX["a3"])
+    assert result["depth"] == 2
+    assert result["score"] > 0
+    assert result["pv"][0] == result["move"]
+    assert result["nodes"] > 0
+
+
+def test_search_finds_mate_in_one():
+    game = make_game({"e1": "rG", "d9": "bG", "a2": "bR", "b3": "bR"})
+    result = JanggiEngine().search(game.get_board(), "blue", depth=3)
+    assert result["score"] >= MATE_SCORE - MAX_PLY
+    assert game.make_move(*[game.get_board().index_to_location(index) for index in result["move"]])
+    assert game.get_board().is_checkmate("red")
+
+
+def test_checkmated_player_has_no_move():
+    game = make_game({"e1": "rG", "d9": "bG", "a2": "bR", "b1": "bR"}, turn="red")
+    engine = JanggiEngine()
+    result = engine.search(game.get_board(), "red", depth=2)
+    assert result["move"] is None
+    assert result["score"] <= -MATE_SCORE + MAX_PLY
+    assert engine.choose_move(game, depth=2) is None
+
+
+def test_search_leaves_the_board_unchanged():
+    game = JanggiGame()
+    for move in random_moves(10, seed=3):
+        game.make_move(*move)
+    board = game.get_board()
+    position = board.get_position()
+    key = board.get_key()
+    moves = board.generate_moves(game.get_turn())
+    JanggiEngine().search(board, game.get_turn(), depth=3)
+    assert board.get_position() == position
+    assert board.get_key() == key
+    assert board.generate_moves(game.get_turn()) == moves
+
+
+def test_choose_move_is_legal():
+    game = JanggiGame()
+    engine = JanggiEngine()
+    for _ in range(6):
+        move = engine.choose_move(game, depth=2)
+        assert move in game.get_legal_moves() or move[0] == move[1]
+        assert game.make_move(*move)
+
+
+def test_evaluate_is_zero_sum():
+    game = JanggiGame()
+    for move in random_moves(15, seed=4):
+        game.make_move(*move)
+    engine = JanggiEngine()
+    assert engine.evaluate(game.get_board(), "red") == -engine.evaluate(game.get_board(), "blue")
+    assert engine.evaluate(JanggiGame().get_board(), "red") == 0
+
+
+def test_table_is_cleared_once_full():
+    engine = JanggiEngine(table_size=50)
+    engine.search(JanggiGame().get_board(), "blue", depth=3)
+    assert 0 < len(engine.get_table()) <= 50
+    engine.clear()
+    assert engine.get_table() == {}
+
+
+def test_time_limit_still_completes_depth_one():
+    result = JanggiEngine().search(JanggiGame().get_board(), "blue", time_limit=0)
+    assert result["depth"] >= 1
+    assert result["move"] is not None
+
+
+def test_analyze_game_annotates_every_ply():
+    moves = random_moves(6, seed=1)
+    annotations = analyze_game(moves, depth=2, workers=1)
+    assert [annotation["ply"] for annotation in annotations] == list(range(1, 7))
+    assert [annotation["player"] for annotation in annotations] == ["blue", "red"] * 3
+    assert [annotation["move"] for annotation in annotations] == moves
+    for annotation in annotations:
+        assert annotation["loss"] == max(0, annotation["eval"] - annotation["played_eval"])
+        assert annotation["blunder"] == (annotation["loss"] >= 300)
+        assert annotation["depth"] == 2
+
+
+def test_analyze_game_is_the_same_with_worker_processes():
+    moves = random_moves(8, seed=2)
+    assert analyze_game(moves, depth=2, workers=2) == analyze_game(moves, depth=2, workers=1)
+
+
+def test_analyze_game_takes_integer_moves():
+    moves = random_moves(4, seed=5)
+    encoded = [encode_move(LOCATION_INDEX[start], LOCATION_INDEX[end]) for start, end in moves]
+    assert analyze_game(encoded, depth=1, workers=1) == analyze_game(moves, depth=1, workers=1)
+
+
+def test_analyze_game_rejects_an_illegal_move():
+    with pytest.raises(ValueError, match="ply 2"):
+        analyze_game([("a7", "b7"), ("a1", "a9")], depth=1, workers=1)
+
+
+def test_ponder_hit_carries_on_with_the_search():
+    game = JanggiGame()
+    engine = JanggiEngine()
+    move = engine.choose_move(game, depth=2)
+    game.make_move(*move)
+    reply = engine.start_pondering(game)
+    assert reply is not None
+    assert engine.is_pondering()
+    game.make_move(*reply)
+    answer = engine.choose_move(game, depth=2)
+    assert not engine.is_pondering()
+    assert answer in game.get_legal_moves() or answer[0] == answer[1]
+
+
+def test_ponder_miss_is_cancelled():
+    game = JanggiGame()
+    game.make_move("a7", "b7")
+    engine = JanggiEngine()
+    assert engine.start_pondering(game, ("a4", "a5")) == ("a4", "a5")
+    game.make_move("i4", "i5")
+    answer = engine.choose_move(game, depth=1)
+    assert not engine.is_pondering()
+    assert answer in game.get_legal_moves() or answer[0] == answer[1]
+
+
+def test_search_stops_pondering_first():
+    game = JanggiGame()
+    game.make_move("a7", "b7")
+    engine = JanggiEngine()
+    engine.start_pondering(game, ("a4", "a5"))
+    result = engine.search(game.get_board(), "red", depth=1)
+    assert not engine.is_pondering()
+    assert result["depth"] == 1
+    assert result["nodes"] < 1000  # counted by this search alone
+
+
+def test_pondering_an_illegal_reply_does_nothing():
+    game = JanggiGame()
+    game.make_move("a7", "b7")
+    engine = JanggiEngine()
+    assert engine.start_pondering(game, ("a4", "a6")) is None
+    assert not engine.is_pondering()
+
+
+def test_search_context_check_time():
+    context = SearchContext()
+    context.check_time()
+    context.stop = True
+    with pytest.raises(SearchTimeout):
+        context.check_time()
+    context = SearchContext(time_limit=1)
+    context.deadline = context.start_time
+    with pytest.raises(SearchTimeout):
+        context.check_time()
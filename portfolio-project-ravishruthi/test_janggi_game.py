@@ -0,0 +1,557 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Tests of JanggiGame: check, checkmate, every piece's moves
+#              (cannon screens and palace diagonals included), the facing
+#              generals rule, the legal moves against playing every move out,
+#              reusing games (reset, set_position, JanggiGamePool), the draw
+#              rules, integer moves and the move cache. Positions are set up
+#              with JanggiGame.set_position from a few pieces on an empty
+#              board.
+#
+
+import random
+
+import pytest
+
+from JanggiGame import JanggiGame, JanggiGamePool, LOCATIONS, LOCATION_INDEX, MOVE_CAPTURE, MOVE_PASS, \
+    encode_move, decode_move, notation_to_move, move_to_notation, encode_moves, decode_moves
+
+# piece codes, see PIECE_TYPES: red 1 to 7, blue 8 to 14
+CODES = {"G": 1, "A": 2, "E": 3, "H": 4, "R": 5, "C": 6, "S": 7}
+
+
+def make_game(pieces, turn="blue", **rules):
+    """
+        Returns a JanggiGame with only the pieces given, as a dict of
+        location to a side letter and a piece letter, e.g. {"e2": "rG"}.
+    """
+    codes = [0] * 90
+    for loc, piece in pieces.items():
+        codes[LOCATION_INDEX[loc]] = CODES[piece[1]] + (7 if piece[0] == "b" else 0)
+    game = JanggiGame(**rules)
+    game.set_position(codes, turn)
+    return game
+
+
+GENERALS = {"e2": "rG", "d9": "bG"}
+
+
+def test_readme_example():
+    game = JanggiGame()
+    assert game.make_move("c1", "e3") is False  # not red's turn
+    assert game.make_move("a7", "b7") is True
+    assert game.is_in_check("blue") is False
+    assert game.make_move("a4", "a5") is True
+    assert game.get_game_state() == "UNFINISHED"
+    assert game.make_move("b7", "b6") is True
+    assert game.make_move("b3", "b6") is False  # a cannon needs a screen
+    assert game.get_turn() == "blue"  # an illegal move gives up the turn
+    assert game.make_move("a1", "a4") is False
+    assert game.make_move("c7", "d7") is True
+    assert game.make_move("a4", "a4") is False  # the soldier left a4 for a5
+    assert game.make_move("a10", "a9") is True
+    assert game.make_move("a5", "a5") is True  # red passes
+    assert game.get_turn() == "blue"
+
+
+def test_wrong_player_keeps_the_turn():
+    game = JanggiGame()
+    assert game.make_move("a4", "a5") is False
+    assert game.get_turn() == "blue"
+
+
+def test_empty_start_square_gives_up_the_turn():
+    game = JanggiGame()
+    assert game.make_move("e5", "e4") is False
+    assert game.get_turn() == "red"
+
+
+def test_chariot_gives_check_on_an_open_file():
+    game = make_game(dict(GENERALS, e7="bR"))
+    assert game.is_in_check("red")
+    assert not game.is_in_check("blue")
+    blocked = make_game(dict(GENERALS, e7="bR", e4="rS"))
+    assert not blocked.is_in_check("red")
+
+
+def test_can_not_move_into_check():
+    game = make_game(dict(GENERALS, d7="bR"), turn="red")
+    assert game.make_move("e2", "d2") is False
+    game = make_game(dict(GENERALS, d7="bR"), turn="red")
+    assert game.make_move("e2", "f2") is True
+
+
+def test_check_must_be_answered():
+    pieces = dict(GENERALS, e7="bR", a1="rR", h1="rS")
+    game = make_game(pieces, turn="red")
+    assert game.make_move("h1", "h2") is False
+    game = make_game(pieces, turn="red")
+    assert game.make_move("a1", "a3") is False
+    game = make_game(dict(pieces, a4="rR"), turn="red")
+    assert game.make_move("a4", "e4") is True  # blocks the file
+    assert not game.is_in_check("red")
+
+
+def test_pinned_piece_can_not_leave_the_file():
+    game = make_game(dict(GENERALS, e7="bR", e4="rR"), turn="red")
+    assert game.make_move("e4", "a4") is False
+    game = make_game(dict(GENERALS, e7="bR", e4="rR"), turn="red")
+    assert game.make_move("e4", "e7") is True
+
+
+def test_checkmate_ends_the_game_on_the_next_move():
+    game = make_game({"e1": "rG", "d9": "bG", "a2": "bR", "b3": "bR"})
+    assert game.make_move("b3", "b1") is True
+    assert game.is_in_check("red")
+    assert game.get_game_state() == "UNFINISHED"  # found when red tries to move
+    assert game.make_move("e1", "d1") is False
+    assert game.get_game_state() == "BLUE_WON"
+    assert game.make_move("d9", "d9") is False
+
+
+def test_check_that_can_be_escaped_is_not_checkmate():
+    game = make_game({"e1": "rG", "d9": "bG", "a2": "bR", "b3": "bR", "c3": "rR"})
+    assert game.make_move("b3", "b1") is True
+    assert game.make_move("c3", "c2") is False  # c2 does not block row 1
+    game = make_game({"e1": "rG", "d9": "bG", "a2": "bR", "b3": "bR", "c3": "rR"})
+    game.make_move("b3", "b1")
+    assert game.make_move("c3", "c1") is True
+    assert game.get_game_state() == "UNFINISHED"
+
+
+def test_pass():
+    game = JanggiGame()
+    assert game.make_move("e9", "e9") is True
+    assert game.get_turn() == "red"
+
+
+def test_cannon_needs_exactly_one_screen():
+    game = make_game(dict(GENERALS, a10="bC", a7="bS"))
+    assert game.make_move("a10", "a9") is False  # no screen before a9
+    game = make_game(dict(GENERALS, a10="bC", a7="bS"))
+    assert game.make_move("a10", "a4") is True
+    game = make_game(dict(GENERALS, a10="bC", a7="bS", a5="rS"))
+    assert game.make_move("a10", "a4") is False  # two screens
+
+
+def test_cannon_captures_over_a_screen():
+    game = make_game(dict(GENERALS, a10="bC", a7="bS", a5="rR"))
+    assert game.make_move("a10", "a5") is True
+    assert game.get_board().get_position()[LOCATION_INDEX["a5"]] == 13
+
+
+def test_cannon_can_not_jump_over_a_cannon():
+    game = make_game(dict(GENERALS, a10="bC", a7="rC"))
+    assert game.make_move("a10", "a5") is False
+
+
+def test_cannon_can_not_capture_a_cannon():
+    game = make_game(dict(GENERALS, a10="bC", a7="bS", a5="rC"))
+    assert game.make_move("a10", "a5") is False
+
+
+def test_cannon_gives_check_over_a_screen():
+    game = make_game(dict(GENERALS, e7="bC", e5="rS"))
+    assert game.is_in_check("red")
+    game = make_game(dict(GENERALS, e7="bC"))
+    assert not game.is_in_check("red")
+
+
+def test_cannon_jumps_along_a_palace_diagonal():
+    game = make_game({"e2": "rG", "f10": "bG", "d10": "bC", "e9": "bA"})
+    assert game.make_move("d10", "f8") is True
+    game = make_game({"e2": "rG", "f10": "bG", "d10": "bC"})
+    assert game.make_move("d10", "f8") is False  # no screen on the center
+
+
+def test_chariot_moves_along_palace_diagonals():
+    game = make_game({"e2": "rG", "f10": "bG", "d8": "bR"})
+    assert game.make_move("d8", "f10") is False  # own General
+    game = make_game({"e1": "rG", "f10": "bG", "d8": "bR"})
+    assert game.make_move("d8", "e9") is True
+    game = make_game({"e1": "rG", "f10": "bG", "f8": "bR"})
+    assert game.make_move("f8", "d10") is True  # through the empty center
+    game = make_game({"e1": "rG", "f10": "bG", "f8": "bR", "e9": "bA"})
+    assert game.make_move("f8", "d10") is False  # the center blocks it
+
+
+def test_chariot_does_not_move_diagonally_outside_a_palace():
+    game = make_game(dict(GENERALS, a7="bR"))
+    assert game.make_move("a7", "b6") is False
+
+
+def test_general_stays_in_the_palace_and_on_its_lines():
+    game = make_game({"e2": "rG", "e9": "bG"})
+    assert game.make_move("e9", "d8") is True  # center to corner
+    game = make_game({"e2": "rG", "d9": "bG"})
+    assert game.make_move("d9", "e8") is False  # no diagonal from a side
+    game = make_game({"e2": "rG", "d8": "bG"})
+    assert game.make_move("d8", "c8") is False  # leaves the palace
+    game = make_game({"e2": "rG", "d8": "bG"})
+    assert game.make_move("d8", "d6") is False  # one step only
+
+
+def test_guard_moves_like_the_general():
+    game = make_game(dict(GENERALS, f10="bA"))
+    assert game.make_move("f10", "e9") is True
+    game = make_game(dict(GENERALS, f10="bA"))
+    assert game.make_move("f10", "g10") is False
+
+
+def test_horse_is_blocked_on_its_leg():
+    game = make_game(dict(GENERALS, c10="bH"))
+    assert game.make_move("c10", "b8") is True
+    game = make_game(dict(GENERALS, c10="bH", c9="bS"))
+    assert game.make_move("c10", "b8") is False
+    game = make_game(dict(GENERALS, c10="bH", b9="bS"))
+    assert game.make_move("c10", "b8") is True  # b9 is not on the way
+
+
+def test_elephant_is_blocked_on_either_leg():
+    game = make_game(dict(GENERALS, b10="bE"))
+    assert game.make_move("b10", "d7") is True
+    for leg in ("b9", "c8"):
+        game = make_game(dict(GENERALS, b10="bE", **{leg: "bS"}))
+        assert game.make_move("b10", "d7") is False
+
+
+def test_soldier_moves_forward_and_sideways_only():
+    game = make_game(dict(GENERALS, c7="bS"))
+    assert game.make_move("c7", "c6") is True
+    game = make_game(dict(GENERALS, c7="bS"))
+    assert game.make_move("c7", "b7") is True
+    game = make_game(dict(GENERALS, c7="bS"))
+    assert game.make_move("c7", "c8") is False
+    game = make_game(dict(GENERALS, c7="bS"))
+    assert game.make_move("c7", "b6") is False
+    game = make_game(dict(GENERALS, c4="rS"), turn="red")
+    assert game.make_move("c4", "c5") is True
+
+
+def test_soldier_moves_diagonally_forward_in_the_enemy_palace():
+    game = make_game({"f1": "rG", "d9": "bG", "d3": "bS"})
+    assert game.make_move("d3", "e2") is True
+    game = make_game({"f1": "rG", "d9": "bG", "e2": "bS"})
+    assert game.make_move("e2", "d3") is False  # backwards
+
+
+@pytest.mark.parametrize("facing_generals, allowed", [(False, True), (True, False)])
+def test_facing_generals_rule(facing_generals, allowed):
+    game = make_game({"e2": "rG", "e9": "bG", "e5": "bS"}, facing_generals=facing_generals)
+    assert game.make_move("e5", "d5") is allowed
+
+
+def test_is_in_check_matches_is_square_attacked():
+    game = make_game(dict(GENERALS, e7="bR"))
+    assert game.is_square_attacked("e2", "blue")
+    assert not game.is_square_attacked("d2", "blue")
+
+
+def test_incremental_attack_maps_match_a_rebuild():
+    rng = random.Random(26)
+    for _ in range(10):
+        game = JanggiGame()
+        for _ in range(60):
+            moves = game.get_legal_moves()
+            if not moves or game.get_game_state() != "UNFINISHED":
+                break
+            game.make_move(*rng.choice(moves))
+            rebuilt = JanggiGame()
+            rebuilt.set_position(game.get_board().get_position(), game.get_turn())
+            for side in ("red", "blue"):
+                assert game.get_attack_map(side) == rebuilt.get_attack_map(side)
+                assert game.is_in_check(side) == rebuilt.is_in_check(side)
+            assert sorted(game.get_legal_moves()) == sorted(rebuilt.get_legal_moves())
+
+
+def played_out_moves(board, player):
+    """
+        Returns the legal moves of player worked out the slow way: every move
+        a piece attacks is played on the board, and kept if its General is
+        then not attacked (nor facing the other General, under that rule).
+    """
+    moves = []
+    for start in sorted(board.get_piece_squares(player)):
+        start_sq = board.get_board()[start // 9][start % 9]
+        for end in range(90):
+            end_piece = board.get_piece_at(end)
+            if end == start or not board.attacks(start_sq, board.get_board()[end // 9][end % 9]):
+                continue
+            if end_piece is not None and end_piece.get_side() == player:
+                continue
+            captured = board.apply_move(start, end)
+            if not board.is_in_check(player) and not (board.get_facing_generals() and board.generals_face()):
+                moves.append((start, end))
+            board.undo_move(start, end, captured)
+    return moves
+
+
+@pytest.mark.parametrize("facing_generals", [False, True])
+def test_pins_and_evasions_match_playing_every_move_out(facing_generals):
+    rng = random.Random(27)
+    for _ in range(8):
+        game = JanggiGame(facing_generals=facing_generals)
+        for _ in range(80):
+            board = game.get_board()
+            player = game.get_turn()
+            assert sorted(board.generate_moves(player)) == played_out_moves(board, player)
+            moves = game.get_legal_moves()
+            if not moves or game.get_game_state() != "UNFINISHED":
+                break
+            # captures first, so the games reach open positions with checks
+            captures = [move for move in moves if board.get_piece_at(LOCATION_INDEX[move[1]]) is not None]
+            game.make_move(*rng.choice(captures or moves))
+
+
+def test_pinned_piece_may_move_along_the_pin():
+    game = make_game(dict(GENERALS, e8="bR", e5="rR"), turn="red")
+    moves = game.get_legal_moves()
+    assert sorted(end for start, end in moves if start == "e5") == ["e3", "e4", "e6", "e7", "e8"]
+
+
+def test_second_cannon_screen_may_not_step_aside():
+    # with two screens the Cannon on e8 does not attack e2, with one it does
+    game = make_game({"e2": "rG", "d9": "bG", "e8": "bC", "e5": "rS", "e4": "rS"}, turn="red")
+    assert not game.is_in_check("red")
+    assert game.make_move("e5", "d5") is False
+    game = make_game({"e2": "rG", "d9": "bG", "e8": "bC", "e5": "rS", "e4": "rS", "a1": "rR"}, turn="red")
+    assert game.make_move("a1", "a2") is True
+
+
+def test_in_check_only_evasions_are_legal():
+    game = make_game(dict(GENERALS, e7="bR", a4="rR", i1="rH"), turn="red")
+    assert sorted(game.get_legal_moves()) == [("a4", "e4"), ("e2", "d1"), ("e2", "d2"), ("e2", "d3"),
+                                              ("e2", "f1"), ("e2", "f2"), ("e2", "f3")]
+
+
+def test_horse_check_is_escaped_by_blocking_its_leg():
+    game = make_game({"e1": "rG", "d9": "bG", "d3": "bH", "c2": "rA"}, turn="red")
+    assert game.is_in_check("red")
+    assert ("c2", "d2") in game.get_legal_moves()
+
+
+HORSE_SHUFFLE = [("c10", "d8"), ("c1", "d3"), ("d8", "c10"), ("d3", "c1")]
+
+
+def test_reset_matches_a_new_game():
+    game = JanggiGame()
+    for move in [("a7", "b7"), ("a4", "a5"), ("b10", "c8")]:
+        game.make_move(*move)
+    game.reset()
+    new_game = JanggiGame()
+    assert game.get_board().get_position() == new_game.get_board().get_position()
+    assert game.get_position_key() == new_game.get_position_key()
+    assert game.get_history() == new_game.get_history()
+    assert game.get_turn() == "blue"
+    assert sorted(game.get_legal_moves()) == sorted(new_game.get_legal_moves())
+    assert game.get_attack_map("red") == new_game.get_attack_map("red")
+
+
+def test_set_position_clears_the_history():
+    game = JanggiGame(repetition_limit=3)
+    for move in HORSE_SHUFFLE * 2:
+        assert game.make_move(*move) is True
+    assert game.repetition_count() == 3
+    assert game.get_game_state() == "DRAW"
+    game.set_position(game.get_board().get_position(), "blue")
+    assert game.get_history() == [game.get_position_key()]
+    assert game.repetition_count() == 1
+    assert game.get_game_state() == "UNFINISHED"
+
+
+def test_set_position_rejects_a_bad_turn():
+    game = JanggiGame()
+    with pytest.raises(ValueError):
+        game.set_position(game.get_board().get_position(), "green")
+
+
+def test_pool_reuses_released_games():
+    pool = JanggiGamePool(max_size=2)
+    game = pool.acquire()
+    game.make_move("a7", "b7")
+    pool.release(game)
+    assert pool.get_size() == 1
+    again = pool.acquire()
+    assert again is game
+    assert again.get_board().get_position() == JanggiGame().get_board().get_position()
+    assert again.get_turn() == "blue"
+    assert pool.get_size() == 0
+
+
+def test_pool_keeps_at_most_max_size_games():
+    pool = JanggiGamePool(max_size=2)
+    games = [pool.acquire() for _ in range(3)]
+    assert len({id(game) for game in games}) == 3
+    for game in games:
+        pool.release(game)
+    assert pool.get_size() == 2
+
+
+def test_pool_rejects_a_double_release():
+    pool = JanggiGamePool()
+    game = pool.acquire()
+    pool.release(game)
+    with pytest.raises(ValueError):
+        pool.release(game)
+    assert pool.get_size() == 1
+
+
+def test_pool_rejects_a_game_with_other_rules():
+    pool = JanggiGamePool(facing_generals=True, repetition_limit=3)
+    assert pool.acquire().get_rules() == (True, 3, False)
+    with pytest.raises(ValueError):
+        pool.release(JanggiGame())
+    assert pool.get_size() == 0
+
+
+def test_repetition_limit_draws_the_game():
+    game = JanggiGame(repetition_limit=3)
+    for move in HORSE_SHUFFLE * 2:
+        assert game.get_game_state() == "UNFINISHED"
+        assert game.make_move(*move) is True
+    assert game.repetition_count() == 3
+    assert game.get_game_state() == "DRAW"
+    assert game.make_move("a7", "b7") is False
+
+
+def test_repetitions_are_only_counted_without_a_limit():
+    game = JanggiGame()
+    for move in HORSE_SHUFFLE * 3:
+        game.make_move(*move)
+    assert game.repetition_count() == 4
+    assert game.get_game_state() == "UNFINISHED"
+    assert len(game.get_history()) == 13
+    assert game.get_history()[0] == game.get_history()[-1] == game.get_position_key()
+
+
+def test_position_key_includes_the_turn():
+    game = JanggiGame()
+    blue_key = game.get_position_key()
+    game.make_move("e9", "e9")  # blue passes
+    assert game.get_board().get_position() == JanggiGame().get_board().get_position()
+    assert game.get_position_key() != blue_key
+    assert game.repetition_count() == 1
+
+
+def test_bikjang_draw_when_the_generals_are_left_facing():
+    pieces = {"e2": "rG", "e9": "bG", "e5": "bS", "a1": "rR", "a4": "rR"}
+    game = make_game(pieces, bikjang_draw=True)
+    assert game.make_move("e5", "d5") is True  # blue faces the Generals
+    assert game.get_game_state() == "UNFINISHED"
+    assert game.make_move("a1", "a2") is True  # red leaves them facing
+    assert game.get_game_state() == "DRAW"
+    game = make_game(pieces, bikjang_draw=True)
+    game.make_move("e5", "d5")
+    assert game.make_move("a4", "e4") is True  # red blocks the file
+    assert game.get_game_state() == "UNFINISHED"
+
+
+def test_facing_generals_are_no_draw_without_bikjang():
+    game = make_game({"e2": "rG", "e9": "bG", "e5": "bS", "a1": "rR"})
+    game.make_move("e5", "d5")
+    game.make_move("a1", "a2")
+    assert game.get_game_state() == "UNFINISHED"
+
+
+def test_encode_and_decode_every_move():
+    for start in range(90):
+        for end in range(90):
+            move = encode_move(start, end)
+            assert decode_move(move) == (start, end)
+            assert decode_move(encode_move(start, end, capture=True)) == (start, end)
+            assert move_to_notation(move) == (LOCATIONS[start], LOCATIONS[end])
+            assert notation_to_move(LOCATIONS[start], LOCATIONS[end]) == move
+    assert encode_move(5, 5) & MOVE_PASS
+    assert not encode_move(5, 5, capture=True) & MOVE_CAPTURE
+    assert encode_move(5, 6, capture=True) & MOVE_CAPTURE
+
+
+def test_encode_and_decode_move_lists():
+    moves = [("a7", "b7"), ("e9", "e9"), ("i10", "i1")]
+    encoded = encode_moves(moves)
+    assert list(encoded) == [notation_to_move(*move) for move in moves]
+    assert decode_moves(encoded) == moves
+    assert decode_moves([]) == []
+
+
+def test_integer_moves_play_like_locations():
+    rng = random.Random(33)
+    by_location = JanggiGame()
+    by_integer = JanggiGame()
+    for _ in range(40):
+        moves = by_integer.get_legal_moves(encoded=True)
+        assert sorted(move_to_notation(move) for move in moves) == sorted(by_location.get_legal_moves())
+        move = rng.choice(moves)
+        assert bool(move & MOVE_CAPTURE) == (by_integer.get_board().get_piece_at(decode_move(move)[1]) is not None)
+        assert by_integer.make_move(move) is True
+        assert by_location.make_move(*move_to_notation(move)) is True
+        assert by_integer.get_position_key() == by_location.get_position_key()
+
+
+def test_integer_pass():
+    game = JanggiGame()
+    assert game.make_move(notation_to_move("e9", "e9")) is True
+    assert game.get_turn() == "red"
+
+
+@pytest.mark.parametrize("move", [90, 127 | (5 << 7), 5 | (100 << 7), "e7", None, 3.0])
+def test_bad_moves_return_false(move):
+    game = JanggiGame()
+    assert game.make_move(move) is False
+    assert game.get_board().get_position() == JanggiGame().get_board().get_position()
+    assert game.get_turn() == "blue"
+
+
+def test_unknown_locations_return_false():
+    game = JanggiGame()
+    assert game.make_move("a11", "a10") is False
+    assert game.make_move("e7", "j7") is False
+    assert game.get_turn() == "blue"
+
+
+def fresh_moves(board, player):
+    """returns the legal moves of player worked out on a new Board with the same position"""
+    fresh = JanggiGame(facing_generals=board.get_facing_generals()).get_board()
+    fresh.set_position(board.get_position())
+    return fresh.generate_moves(player)
+
+
+def test_cached_moves_match_a_fresh_board_through_apply_and_undo():
+    rng = random.Random(35)
+    for facing_generals in (False, True):
+        board = JanggiGame(facing_generals=facing_generals).get_board()
+        played = []
+        player = "blue"
+        for _ in range(150):
+            for side in ("blue", "red"):
+                assert board.generate_moves(side) == fresh_moves(board, side)
+            moves = board.generate_moves(player)
+            if played and (not moves or rng.random() < 0.3):
+                start, end, captured = played.pop()
+                board.undo_move(start, end, captured)
+            elif moves:
+                start, end = rng.choice(moves)
+                played.append((start, end, board.apply_move(start, end)))
+            player = "red" if player == "blue" else "blue"
+
+
+def test_cached_moves_are_copies():
+    game = JanggiGame()
+    moves = game.get_legal_moves()
+    moves.clear()
+    assert game.get_legal_moves() != []
+    board = game.get_board()
+    board.generate_moves("blue").append((0, 0))
+    assert (0, 0) not in board.generate_moves("blue")
+
+
+def test_cached_moves_change_after_a_move():
+    game = JanggiGame()
+    before = game.get_legal_moves()
+    game.make_move("a7", "a6")
+    game.make_move("a4", "a5")
+    after = game.get_legal_moves()
+    assert ("a10", "a7") in after and ("a10", "a7") not in before
+    assert ("a7", "a6") in before and ("a6", "a5") in after
+    assert game.get_legal_moves(encoded=True) == [notation_to_move(*move) | (MOVE_CAPTURE if (
+        game.get_board().get_piece_at(LOCATION_INDEX[move[1]]) is not None) else 0) for move in after]
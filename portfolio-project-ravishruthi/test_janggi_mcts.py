@@ -0,0 +1,125 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Tests of MCTSPlayer: it picks legal moves, takes free pieces,
+#              repeats itself with the same seed, keeps the tree under the
+#              new position when the game moves on, and plays its rollouts
+#              under the game's facing_generals rule.
+#
+
+import pytest
+
+import JanggiMCTS
+from JanggiGame import JanggiGame, LOCATION_INDEX
+from JanggiMCTS import MCTSPlayer, _evaluate_leaf
+from test_janggi_game import make_game, GENERALS
+
+
+@pytest.mark.parametrize("rollout_depth", [0, 8])
+def test_takes_a_free_chariot(rollout_depth):
+    game = make_game(dict(GENERALS, a10="bR", a3="rR"))
+    player = MCTSPlayer(workers=1, seed=1, rollout_depth=rollout_depth)
+    assert player.choose_move(game, playouts=300) == ("a10", "a3")
+
+
+def test_choose_move_is_legal_and_leaves_the_game_unchanged():
+    game = JanggiGame()
+    position = game.get_board().get_position()
+    player = MCTSPlayer(workers=1, seed=2)
+    move = player.choose_move(game, playouts=100)
+    assert move in game.get_legal_moves() or move[0] == move[1]
+    assert game.get_board().get_position() == position
+    assert game.get_turn() == "blue"
+
+
+def test_stats_count_the_playouts():
+    player = MCTSPlayer(workers=1, batch_size=7, seed=3)
+    player.choose_move(JanggiGame(), playouts=50)
+    stats = player.get_stats()
+    assert stats["playouts"] == 50
+    assert stats["nodes"] > 1
+    assert stats["seconds"] >= 0
+
+
+def test_time_limit_runs_at_least_one_batch():
+    player = MCTSPlayer(workers=1, batch_size=4, seed=3)
+    player.choose_move(JanggiGame(), time_limit=0.05)
+    assert player.get_stats()["playouts"] >= 4
+
+
+def test_checkmated_player_has_no_move():
+    game = make_game({"e1": "rG", "d9": "bG", "a2": "bR", "b1": "bR"}, turn="red")
+    assert MCTSPlayer(workers=1, seed=4).choose_move(game, playouts=20) is None
+
+
+def test_same_seed_same_move():
+    game = JanggiGame()
+    game.make_move("a7", "b7")
+    moves = [MCTSPlayer(workers=1, seed=5).choose_move(game, playouts=200) for _ in range(2)]
+    assert moves[0] == moves[1]
+
+
+def test_worker_processes_give_legal_moves():
+    game = make_game(dict(GENERALS, a10="bR", a3="rR"))
+    player = MCTSPlayer(workers=2, seed=6)
+    try:
+        assert player.choose_move(game, playouts=64) == ("a10", "a3")
+        game.make_move("a10", "a3")
+        move = player.choose_move(game, playouts=16)
+        assert move in game.get_legal_moves() or move[0] == move[1]
+    finally:
+        player.close()
+    player.close()  # closing twice does nothing
+
+
+def test_advance_keeps_the_tree_under_the_new_position():
+    game = JanggiGame()
+    player = MCTSPlayer(workers=1, seed=7)
+    move = player.choose_move(game, playouts=300)
+    size = player.get_stats()["nodes"]
+    game.make_move(*move)
+    player.advance(game)
+    player.choose_move(game, playouts=1)
+    kept = player.get_stats()["nodes"]
+    assert 1 < kept < size
+
+
+def test_advance_to_an_unknown_position_drops_the_tree():
+    player = MCTSPlayer(workers=1, seed=8)
+    player.choose_move(JanggiGame(), playouts=50)
+    game = make_game(dict(GENERALS, a10="bR"))
+    player.advance(game)
+    player.choose_move(game, playouts=1)
+    assert player.get_stats()["nodes"] == 2  # the root and the one leaf
+
+
+def test_tree_is_pruned_at_max_nodes():
+    game = JanggiGame()
+    player = MCTSPlayer(workers=1, max_nodes=50, seed=9)
+    move = player.choose_move(game, playouts=100)
+    assert player.get_stats()["nodes"] > 50
+    game.make_move(*move)
+    player.choose_move(game, playouts=1)
+    assert player.get_stats()["nodes"] < 100
+
+
+def test_evaluate_leaf_without_rollout_is_the_static_evaluation():
+    position = JanggiGame().get_board().get_position()
+    assert _evaluate_leaf(position, "blue", 0, 1) == 0.5
+    ahead = make_game(dict(GENERALS, a10="bR")).get_board().get_position()
+    assert _evaluate_leaf(ahead, "blue", 0, 1) > 0.5
+    assert _evaluate_leaf(ahead, "red", 0, 1) < 0.5
+    assert 0.0 <= _evaluate_leaf(position, "red", 8, 1) <= 1.0
+
+
+@pytest.mark.parametrize("facing_generals", [False, True])
+def test_rollouts_follow_the_facing_generals_rule(facing_generals):
+    # the blue Soldier on e5 is all that keeps the Generals apart
+    position = make_game({"e2": "rG", "e9": "bG", "e5": "bS"}).get_board().get_position()
+    stepped_aside = False
+    for seed in range(40):
+        _evaluate_leaf(position, "blue", 1, seed, facing_generals)
+        board = JanggiMCTS._leaf_boards[facing_generals]
+        assert board.get_facing_generals() == facing_generals
+        stepped_aside = stepped_aside or any(board.get_piece_at(LOCATION_INDEX[loc]) is not None
+                                             for loc in ("d5", "f5"))
+    assert stepped_aside != facing_generals
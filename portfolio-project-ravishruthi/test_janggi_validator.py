@@ -0,0 +1,160 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Tests of validate_positions: the check test against
+#              Board.is_in_check on random positions, with and without the
+#              facing generals rule, every error flag on a position made to
+#              raise it, and the shapes it accepts.
+#
+
+import random
+
+import numpy as np
+import pytest
+
+from JanggiGame import Board, INITIAL_LAYOUT, LOCATION_INDEX, RED_PALACE, BLUE_PALACE
+from JanggiValidator import validate_positions, describe_errors, INVALID_PIECE_CODE, MISSING_GENERAL, \
+    GENERAL_OUTSIDE_PALACE, GUARD_OUTSIDE_PALACE, SOLDIER_BEHIND_START, TOO_MANY_PIECES, OPPONENT_IN_CHECK
+from test_janggi_game import CODES
+
+
+def random_position(rng):
+    """
+        returns random piece codes with a General in each palace and up to
+        two of each other piece per side; Guards stay in their palace and
+        Soldiers in front of their starting rank, so only checks are errors
+    """
+    codes = [0] * 90
+    free = set(range(90))
+
+    def place(code, squares):
+        square = rng.choice(sorted(free & set(squares)))
+        codes[square] = code
+        free.discard(square)
+
+    for offset, palace, soldier_rows in ((0, RED_PALACE, range(3, 10)), (7, BLUE_PALACE, range(0, 7))):
+        place(CODES["G"] + offset, palace)
+        for letter in "AEHRCS":
+            for _ in range(rng.randrange(3)):
+                if letter == "A":
+                    squares = palace
+                elif letter == "S":
+                    squares = [row * 9 + col for row in soldier_rows for col in range(9)]
+                else:
+                    squares = range(90)
+                place(CODES[letter] + offset, squares)
+    return codes
+
+
+def position_with(pieces):
+    """returns piece codes with only the pieces given, as for make_game"""
+    codes = [0] * 90
+    for loc, piece in pieces.items():
+        codes[LOCATION_INDEX[loc]] = CODES[piece[1]] + (7 if piece[0] == "b" else 0)
+    return codes
+
+
+GENERALS = {"e2": "rG", "d9": "bG"}
+
+
+@pytest.mark.parametrize("facing_generals", [False, True])
+def test_check_matches_the_board(facing_generals):
+    rng = random.Random(36)
+    positions = [random_position(rng) for _ in range(600)]
+    to_move = [rng.choice(("red", "blue")) for _ in positions]
+    errors = validate_positions(positions, to_move, facing_generals)
+    board = Board(facing_generals)
+    in_check_count = 0
+    for codes, mover, error in zip(positions, to_move, errors):
+        board.set_position(codes)
+        victim = "red" if mover == "blue" else "blue"
+        in_check = board.is_in_check(victim) or (facing_generals and board.generals_face())
+        assert bool(error & OPPONENT_IN_CHECK) == in_check
+        assert int(error) & ~OPPONENT_IN_CHECK == 0
+        in_check_count += in_check
+    assert 0 < in_check_count < len(positions)
+
+
+def test_starting_position_is_valid():
+    assert validate_positions([INITIAL_LAYOUT, INITIAL_LAYOUT], ["blue", "red"]).tolist() == [0, 0]
+
+
+@pytest.mark.parametrize("pieces, flag", [
+    ({"e2": "rG"}, MISSING_GENERAL),
+    ({"e4": "rG", "d9": "bG"}, GENERAL_OUTSIDE_PALACE),
+    (dict(GENERALS, c1="rA"), GUARD_OUTSIDE_PALACE),
+    (dict(GENERALS, c3="rS"), SOLDIER_BEHIND_START),
+    (dict(GENERALS, c8="bS"), SOLDIER_BEHIND_START),
+    (dict(GENERALS, a1="rR", b1="rR", c1="rR"), TOO_MANY_PIECES),
+    (dict(GENERALS, e2="rG", f2="rG"), TOO_MANY_PIECES),
+    (dict(GENERALS, d5="rR"), OPPONENT_IN_CHECK),  # red to move, blue's General is open
+    (dict(GENERALS, d5="rC", d7="bS"), OPPONENT_IN_CHECK),
+    (dict(GENERALS, c7="rH"), OPPONENT_IN_CHECK),
+    (dict(GENERALS, b6="rE"), OPPONENT_IN_CHECK),
+])
+def test_each_error_flag(pieces, flag):
+    assert validate_positions([position_with(pieces)], "red").tolist() == [flag]
+
+
+def test_blocked_attacks_are_no_check():
+    for pieces in (dict(GENERALS, d5="rR", d7="bS"), dict(GENERALS, d5="rC"), dict(GENERALS, d5="rC", d7="bC"),
+                   dict(GENERALS, c7="rH", c8="bH"), dict(GENERALS, b6="rE", b7="bS"),
+                   dict(GENERALS, b6="rE", c8="bH")):
+        assert validate_positions([position_with(pieces)], "red").tolist() == [0]
+
+
+def test_side_to_move_may_be_in_check():
+    codes = position_with(dict(GENERALS, e5="bR", d5="rR"))
+    assert validate_positions([codes], "blue").tolist() == [OPPONENT_IN_CHECK]
+    assert validate_positions([codes, codes], np.array(["red", "blue"])).tolist() == [OPPONENT_IN_CHECK] * 2
+    codes = position_with(dict(GENERALS, e5="bR"))
+    assert validate_positions([codes, codes], ["red", "blue"]).tolist() == [0, OPPONENT_IN_CHECK]
+
+
+def test_facing_generals():
+    codes = position_with({"e2": "rG", "e9": "bG"})
+    assert validate_positions([codes], "red").tolist() == [0]
+    assert validate_positions([codes], "red", facing_generals=True).tolist() == [OPPONENT_IN_CHECK]
+    codes = position_with({"e2": "rG", "e9": "bG", "e5": "bS"})
+    assert validate_positions([codes], "red", facing_generals=True).tolist() == [0]
+
+
+def test_invalid_codes():
+    codes = list(INITIAL_LAYOUT)
+    codes[40] = 15
+    other = list(INITIAL_LAYOUT)
+    other[40] = -1
+    errors = validate_positions([codes, other, INITIAL_LAYOUT], "blue")
+    assert errors.tolist() == [INVALID_PIECE_CODE, INVALID_PIECE_CODE, 0]
+    unsigned = np.array([codes], dtype=np.uint8)
+    assert validate_positions(unsigned, "blue").tolist() == [INVALID_PIECE_CODE]
+
+
+def test_several_flags_at_once():
+    error = validate_positions([position_with({"e4": "rG", "c3": "rS", "d10": "rA"})], "blue")[0]
+    assert describe_errors(int(error)) == ["MISSING_GENERAL", "GENERAL_OUTSIDE_PALACE", "GUARD_OUTSIDE_PALACE",
+                                           "SOLDIER_BEHIND_START"]
+    assert describe_errors(0) == []
+
+
+def test_chunk_size_does_not_change_the_results():
+    rng = random.Random(7)
+    positions = np.array([random_position(rng) for _ in range(300)])
+    to_move = np.array([rng.choice(("red", "blue")) for _ in range(300)])
+    expected = validate_positions(positions, to_move)
+    for chunk_size in (1, 7, 299):
+        assert validate_positions(positions, to_move, chunk_size=chunk_size).tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize("positions", [INITIAL_LAYOUT, [INITIAL_LAYOUT[:89]], np.zeros((2, 90, 1))])
+def test_bad_shapes_raise(positions):
+    with pytest.raises(ValueError):
+        validate_positions(positions, "blue")
+
+
+def test_bad_to_move_shape_raises():
+    with pytest.raises(ValueError):
+        validate_positions([INITIAL_LAYOUT] * 3, ["red", "blue"])
+
+
+def test_no_positions():
+    assert validate_positions(np.zeros((0, 90), dtype=np.int64), "red").tolist() == []
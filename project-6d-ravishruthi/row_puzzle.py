@@ -2,16 +2,18 @@
 # Date: 02/08/2021
 # Description: A row puzzle that starts of at leftmost square and moves either
 #              right or left to get to the rightmost square. If it does, returns
-#              True. It returns False, if not possible.
+#              True. It returns False, if not possible. solve_row_puzzle solves
+#              it without recursion, and can return the shortest moves.
 #
 
+from array import array
+
+
 def shift_right(num_list, index):  # Helper function
     """
         Checks if current index can move right legally.
         Returns true if possible, false if not.
     """
-    if index == 0:  # At leftmost index
-        return True
     if index + num_list[index] < len(num_list):  # Checks if it goes of right end
         return True
     return False
@@ -71,3 +73,48 @@ def row_puzzle(num_list, pos=0, memo=None):
             return True
     if not left and not right:  # If stuck (cannot move left or right)
         return False
+
+
+def solve_row_puzzle(num_list, return_path=False):
+    """
+        Solves the puzzle with a breadth first search instead of recursion,
+        so rows of millions of squares do not run out of stack. Squares
+        reached are kept in a bytearray, one byte per square.
+        If return_path is False, returns True if the rightmost square can
+        be reached and False if not.
+        If return_path is True, returns the shortest list of "right" and
+        "left" moves that reaches the rightmost square, or None if it can
+        not be reached.
+    """
+    length = len(num_list)
+    if length == 0:
+        return None if return_path else False
+    last = length - 1
+    visited = bytearray(length)
+    visited[0] = 1
+    # every square is queued at most once, so the queue is an array read
+    # from the front instead of a deque
+    queue = array("q", [0])
+    parents = array("q", [-1]) * length if return_path else None
+    head = 0
+    while head < len(queue) and not visited[last]:
+        pos = queue[head]
+        head += 1
+        step = num_list[pos]
+        for new_pos in (pos + step, pos - step):
+            if 0 <= new_pos < length and not visited[new_pos]:
+                visited[new_pos] = 1
+                queue.append(new_pos)
+                if return_path:
+                    parents[new_pos] = pos
+    if not return_path:
+        return bool(visited[last])
+    if not visited[last]:
+        return None
+    moves = []
+    pos = last
+    while pos != 0:  # follow the parents back to the leftmost square
+        moves.append("right" if parents[pos] < pos else "left")
+        pos = parents[pos]
+    moves.reverse()
+    return moves
@@ -0,0 +1,140 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Solves many row puzzles at once with NumPy. The rows are given
+#              as one padded 2D array with their lengths, and every step moves
+#              the token of every unsolved puzzle from all of its newly reached
+#              squares at once, using the same right and left moves as
+#              shift_right and shift_left.
+#
+
+import argparse
+import time
+
+import numpy as np
+
+from row_puzzle import solve_row_puzzle
+
+
+def solve_batch(rows, lengths=None, chunk_size=65536):
+    """
+        Checks for every row whether the rightmost square can be reached.
+    :param rows: array-like of shape (N, width) of nonnegative integers, each
+        row padded on the right up to width
+    :param lengths: array-like of N row lengths, every row is width long if
+        None
+    :param chunk_size: rows solved together, which bounds the memory used
+        for the squares reached (one byte per square of a chunk)
+    :return: NumPy bool array of N results
+    :raises ValueError: if the shapes of rows and lengths do not match, or a
+        length is negative or more than width
+    """
+    rows = np.asarray(rows)
+    if rows.ndim != 2:
+        raise ValueError("rows must be a 2D array")
+    count, width = rows.shape
+    if lengths is None:
+        lengths = np.full(count, width, dtype=np.int64)
+    else:
+        lengths = np.asarray(lengths, dtype=np.int64)
+        if lengths.shape != (count,):
+            raise ValueError("lengths must have one length per row")
+        if (lengths < 0).any() or (lengths > width).any():
+            raise ValueError("lengths must be from 0 to the width of rows")
+    solved = np.zeros(count, dtype=bool)
+    for start in range(0, count, chunk_size):
+        end = min(start + chunk_size, count)
+        solved[start:end] = _solve_chunk(rows[start:end], lengths[start:end])
+    return solved
+
+
+def _solve_chunk(rows, lengths):
+    """Returns the results of one chunk of solve_batch."""
+    count, width = rows.shape
+    solved = lengths == 1  # the token starts on the rightmost square
+    if width == 0:
+        return solved
+    visited = np.zeros(count * width, dtype=bool)
+    # the frontier is the squares first reached in the last step, as flat
+    # indexes into visited, so a step costs the size of the frontier and not
+    # of the whole chunk
+    frontier = np.nonzero(lengths > 1)[0] * width
+    visited[frontier] = True
+    values = rows.reshape(-1).astype(np.int64)
+    last = lengths - 1
+    # marks which candidate claimed a square, to drop repeats without sorting
+    claims = np.empty(count * width, dtype=np.int64)
+    while len(frontier):
+        row = frontier // width
+        pos = frontier - row * width
+        step = values[frontier]
+        right = pos + step
+        left = pos - step
+        # the same checks as shift_right and shift_left
+        right_ok = right < lengths[row]
+        left_ok = left >= 0
+        candidates = np.concatenate((frontier[right_ok] + step[right_ok], frontier[left_ok] - step[left_ok]))
+        candidates = candidates[~visited[candidates]]
+        claims[candidates] = np.arange(len(candidates))
+        candidates = candidates[claims[candidates] == np.arange(len(candidates))]
+        visited[candidates] = True
+        cand_row = candidates // width
+        reached = candidates - cand_row * width == last[cand_row]
+        solved[cand_row[reached]] = True
+        # squares of solved puzzles are not explored any further
+        frontier = candidates[~solved[cand_row]]
+    return solved
+
+
+def random_puzzles(count, width, seed=0):
+    """
+        Returns count random puzzles of lengths 1 to width, as (rows, lengths)
+        for solve_batch. Every square holds 0 to its row's length - 1, and the
+        rightmost square holds 0.
+    """
+    rng = np.random.default_rng(seed)
+    lengths = rng.integers(1, width + 1, size=count)
+    rows = (rng.random((count, width)) * lengths[:, None]).astype(np.int64)
+    rows[np.arange(width) >= lengths[:, None] - 1] = 0
+    return rows, lengths
+
+
+def measure_throughput(count, width, seed=0, loop_count=2000):
+    """
+        Times solve_batch on count random puzzles and solve_row_puzzle on
+        the first loop_count of them, one at a time, and checks that they
+        agree.
+    :return: dict with the puzzles per second of both
+    :raises ValueError: if the results differ
+    """
+    rows, lengths = random_puzzles(count, width, seed)
+    start = time.perf_counter()
+    solved = solve_batch(rows, lengths)
+    batch_seconds = time.perf_counter() - start
+
+    loop_count = min(loop_count, count)
+    row_lists = [rows[index, :lengths[index]].tolist() for index in range(loop_count)]
+    start = time.perf_counter()
+    looped = [solve_row_puzzle(row_list) for row_list in row_lists]
+    loop_seconds = time.perf_counter() - start
+    if looped != solved[:loop_count].tolist():
+        raise ValueError("solve_batch and solve_row_puzzle disagree")
+    return {"batch_per_second": count / batch_seconds, "loop_per_second": loop_count / loop_seconds,
+            "solvable": int(solved.sum())}
+
+
+def main():
+    """Prints the puzzles per second of solve_batch and of solve_row_puzzle in a loop."""
+    parser = argparse.ArgumentParser(description="Throughput of the batch row puzzle solver.")
+    parser.add_argument("--count", type=int, default=200000, help="number of random puzzles")
+    parser.add_argument("--width", type=int, default=32, help="longest puzzle")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random puzzles")
+    args = parser.parse_args()
+
+    result = measure_throughput(args.count, args.width, args.seed)
+    print("%d puzzles of up to %d squares, %d solvable" % (args.count, args.width, result["solvable"]))
+    print("solve_batch:      %12.0f puzzles/s" % result["batch_per_second"])
+    print("solve_row_puzzle: %12.0f puzzles/s" % result["loop_per_second"])
+
+
+if __name__ == "__main__":
+    main()
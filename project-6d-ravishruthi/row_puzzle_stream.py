@@ -0,0 +1,142 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Solves the rows of a puzzle file of any size across a pool of
+#              processes. The input has one row per line, its squares
+#              separated by spaces or commas, and the output gets one True or
+#              False per line, in input order. The file is read in chunks and
+#              only a few chunks are in flight at a time, so memory stays the
+#              same however large the file is.
+#
+
+import argparse
+import collections
+import multiprocessing
+import os
+import sys
+import time
+
+from row_puzzle import solve_row_puzzle
+
+
+def _solve_lines(first_line, lines):
+    """
+        Solves the rows of a chunk of lines, in a worker process.
+    :param first_line: line number of the first line, for error messages
+    :return: the output lines of the chunk, as bytes
+    :raises ValueError: if a line has something other than integers
+    """
+    results = []
+    for line_number, line in enumerate(lines, first_line):
+        try:
+            num_list = [int(square) for square in line.replace(b",", b" ").split()]
+        except ValueError:
+            raise ValueError("line " + str(line_number) + ": squares must be integers") from None
+        results.append(b"True\n" if solve_row_puzzle(num_list) else b"False\n")
+    return b"".join(results)
+
+
+def _read_chunks(in_file, chunk_bytes):
+    """
+        Yields (first line number, lines, bytes read) for chunks of about
+        chunk_bytes of in_file. A chunk always ends at the end of a line.
+    """
+    line_number = 1
+    while True:
+        lines = in_file.readlines(chunk_bytes)
+        if not lines:
+            return
+        yield line_number, lines, sum(len(line) for line in lines)
+        line_number += len(lines)
+
+
+def solve_file(input_path, output_path, processes=None, chunk_bytes=1 << 20, progress=None, progress_interval=1.0):
+    """
+        Solves every row of input_path and writes the results to output_path.
+        The results go to output_path + ".part", renamed to output_path once
+        every row is solved, so a failed run leaves no partial output behind.
+    :param processes: worker processes, os.cpu_count() if None
+    :param chunk_bytes: about how much of the input one task gets; at most
+        two tasks per process are read ahead of the output
+    :param progress: if given, called with a stats dict (see the return
+        value) about every progress_interval seconds and once at the end
+    :return: dict of rows, solvable, bytes, seconds, rows_per_second and
+        fraction done
+    :raises ValueError: if a line has something other than integers
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    total_bytes = os.path.getsize(input_path)
+    stats = {"rows": 0, "solvable": 0, "bytes": 0, "seconds": 0.0, "rows_per_second": 0.0,
+             "fraction": 0.0 if total_bytes else 1.0}
+    start = time.perf_counter()
+    last_report = start
+
+    def update(results, size):
+        stats["rows"] += results.count(b"\n")
+        stats["solvable"] += results.count(b"True")
+        stats["bytes"] += size
+        stats["seconds"] = time.perf_counter() - start
+        stats["rows_per_second"] = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+        stats["fraction"] = stats["bytes"] / total_bytes if total_bytes else 1.0
+
+    part_path = output_path + ".part"
+    try:
+        # leaving the pool on an error terminates it, cancelling the queued tasks
+        with open(input_path, "rb") as in_file, open(part_path, "wb") as out_file, \
+                multiprocessing.Pool(processes) as pool:
+            pending = collections.deque()
+            for first_line, lines, size in _read_chunks(in_file, chunk_bytes):
+                pending.append((pool.apply_async(_solve_lines, (first_line, lines)), size))
+                if len(pending) < 2 * processes:
+                    continue
+                # the oldest task is written first, so the output keeps the input order
+                task, task_size = pending.popleft()
+                results = task.get()
+                out_file.write(results)
+                update(results, task_size)
+                if progress is not None and time.perf_counter() - last_report >= progress_interval:
+                    progress(dict(stats))
+                    last_report = time.perf_counter()
+            while pending:
+                task, task_size = pending.popleft()
+                results = task.get()
+                out_file.write(results)
+                update(results, task_size)
+        os.replace(part_path, output_path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    stats["seconds"] = time.perf_counter() - start
+    if progress is not None:
+        progress(dict(stats))
+    return stats
+
+
+def print_progress(stats):
+    """Prints a progress line for solve_file to standard error."""
+    print("%5.1f%%  %d rows  %d solvable  %.0f rows/s  %.1f MB/s" %
+          (stats["fraction"] * 100, stats["rows"], stats["solvable"], stats["rows_per_second"],
+           stats["bytes"] / stats["seconds"] / 1e6 if stats["seconds"] else 0.0), file=sys.stderr)
+
+
+def main():
+    """Solves a puzzle file from the command line."""
+    parser = argparse.ArgumentParser(description="Solve the row puzzles of a file across processes.")
+    parser.add_argument("input", help="file with one row of integers per line")
+    parser.add_argument("output", help="file to write one True or False per line to")
+    parser.add_argument("--processes", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--chunk-bytes", type=int, default=1 << 20, help="input bytes per task")
+    parser.add_argument("--quiet", action="store_true", help="do not report progress")
+    args = parser.parse_args()
+
+    try:
+        solve_file(args.input, args.output, args.processes, args.chunk_bytes,
+                   None if args.quiet else print_progress)
+    except ValueError as error:
+        print("error: " + str(error), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Tests of solve_row_puzzle against the recursive row_puzzle on
+#              every short row, and of the moves it returns: legal, ending on
+#              the rightmost square and as few as possible.
+#
+
+import itertools
+import random
+import sys
+from collections import deque
+
+import pytest
+
+from row_puzzle import row_puzzle, solve_row_puzzle
+
+
+def all_rows(max_length):
+    """yields every row of up to max_length squares holding 0 to its length - 1, with 0 on the right"""
+    for length in range(1, max_length + 1):
+        for row in itertools.product(range(length), repeat=length - 1):
+            yield list(row) + [0]
+
+
+def fewest_moves(row):
+    """returns the fewest moves from the leftmost to the rightmost square, or None, found with a deque"""
+    distance = {0: 0}
+    queue = deque([0])
+    while queue:
+        pos = queue.popleft()
+        if pos == len(row) - 1:
+            return distance[pos]
+        for new_pos in (pos + row[pos], pos - row[pos]):
+            if 0 <= new_pos < len(row) and new_pos not in distance:
+                distance[new_pos] = distance[pos] + 1
+                queue.append(new_pos)
+    return None
+
+
+def play(row, moves):
+    """returns the square the moves end on, checking that none leaves the row"""
+    pos = 0
+    for move in moves:
+        pos += row[pos] if move == "right" else -row[pos]
+        assert 0 <= pos < len(row)
+    return pos
+
+
+def test_readme_examples():
+    assert solve_row_puzzle([2, 4, 5, 3, 1, 3, 1, 4, 0]) is True
+    assert solve_row_puzzle([1, 3, 2, 1, 3, 4, 0]) is False
+    moves = solve_row_puzzle([2, 4, 5, 3, 1, 3, 1, 4, 0], return_path=True)
+    assert play([2, 4, 5, 3, 1, 3, 1, 4, 0], moves) == 8
+    assert len(moves) == fewest_moves([2, 4, 5, 3, 1, 3, 1, 4, 0])
+    assert solve_row_puzzle([1, 3, 2, 1, 3, 4, 0], return_path=True) is None
+
+
+def test_matches_row_puzzle_on_every_short_row():
+    for row in all_rows(6):
+        assert solve_row_puzzle(row) == bool(row_puzzle(row)), row
+
+
+def test_moves_are_legal_and_fewest():
+    for row in all_rows(6):
+        moves = solve_row_puzzle(row, return_path=True)
+        expected = fewest_moves(row)
+        if expected is None:
+            assert moves is None
+        else:
+            assert len(moves) == expected
+            assert play(row, moves) == len(row) - 1
+
+
+def test_one_square_is_already_solved():
+    assert solve_row_puzzle([0]) is True
+    assert solve_row_puzzle([0], return_path=True) == []
+
+
+def test_empty_row_can_not_be_solved():
+    assert solve_row_puzzle([]) is False
+    assert solve_row_puzzle([], return_path=True) is None
+
+
+def test_zero_squares_are_dead_ends():
+    assert solve_row_puzzle([0, 0]) is False
+    assert solve_row_puzzle([2, 5, 0, 0]) is False
+
+
+def test_solves_rows_deeper_than_the_recursion_limit():
+    # every square but the last moves one right, so the only path has a
+    # move per square
+    length = sys.getrecursionlimit() * 50
+    row = [1] * (length - 1) + [0]
+    assert solve_row_puzzle(row) is True
+    moves = solve_row_puzzle(row, return_path=True)
+    assert len(moves) == length - 1
+    assert set(moves) == {"right"}
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_long_random_rows(seed):
+    rng = random.Random(seed)
+    for _ in range(20):
+        length = rng.randrange(50, 500)
+        row = [rng.randrange(length // 4) for _ in range(length - 1)] + [0]
+        moves = solve_row_puzzle(row, return_path=True)
+        assert (moves is not None) == solve_row_puzzle(row)
+        if moves is not None:
+            assert len(moves) == fewest_moves(row)
+            assert play(row, moves) == length - 1
@@ -0,0 +1,91 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Tests of solve_batch against solve_row_puzzle on random and on
+#              hand-made puzzles, split into chunks or not, and of the errors
+#              it raises for rows and lengths that do not fit together.
+#
+
+import numpy as np
+import pytest
+
+from row_puzzle import solve_row_puzzle
+from row_puzzle_batch import measure_throughput, random_puzzles, solve_batch
+
+
+def looped(rows, lengths):
+    """returns solve_row_puzzle of every row, cut to its length"""
+    return [solve_row_puzzle(rows[index, :lengths[index]].tolist()) for index in range(len(rows))]
+
+
+@pytest.mark.parametrize("width", [1, 2, 5, 16, 40])
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_solve_row_puzzle(width, seed):
+    rows, lengths = random_puzzles(2000, width, seed)
+    assert solve_batch(rows, lengths).tolist() == looped(rows, lengths)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000, 5000])
+def test_chunk_size_does_not_change_the_results(chunk_size):
+    rows, lengths = random_puzzles(3000, 12, seed=5)
+    assert solve_batch(rows, lengths, chunk_size=chunk_size).tolist() == looped(rows, lengths)
+
+
+def test_readme_examples_with_padding():
+    rows = np.array([[2, 4, 5, 3, 1, 3, 1, 4, 0],
+                     [1, 3, 2, 1, 3, 4, 0, 9, 9],
+                     [0, 9, 9, 9, 9, 9, 9, 9, 9],
+                     [9, 9, 9, 9, 9, 9, 9, 9, 9]])
+    assert solve_batch(rows, [9, 7, 1, 0]).tolist() == [True, False, True, False]
+
+
+def test_padding_is_never_stepped_on():
+    # the move from square 1 lands on square 3, past a row of length 3 but
+    # on the way to the end of the whole width
+    rows = np.array([[1, 2, 0, 1, 0]])
+    assert solve_batch(rows, [3]).tolist() == [False]
+    assert solve_batch(rows).tolist() == [True]
+
+
+def test_rows_of_the_whole_width_without_lengths():
+    rows = np.array([[1, 1, 1, 0], [3, 0, 0, 0], [0, 1, 1, 0]])
+    assert solve_batch(rows).tolist() == [True, True, False]
+
+
+def test_empty_inputs():
+    assert solve_batch(np.zeros((0, 5), dtype=np.int64)).tolist() == []
+    assert solve_batch(np.zeros((3, 0), dtype=np.int64)).tolist() == [False, False, False]
+
+
+def test_accepts_nested_lists():
+    assert solve_batch([[1, 0], [0, 0]]).tolist() == [True, False]
+
+
+@pytest.mark.parametrize("rows, lengths", [
+    ([1, 2, 0], None),  # one row, not a 2D array
+    (np.zeros((2, 2, 2)), None),
+    (np.zeros((3, 4)), [1, 2]),  # too few lengths
+    (np.zeros((2, 4)), [[1, 2]]),
+    (np.zeros((2, 4)), [1, 5]),  # longer than the width
+    (np.zeros((2, 4)), [-1, 2]),
+])
+def test_bad_shapes_and_lengths_raise(rows, lengths):
+    with pytest.raises(ValueError):
+        solve_batch(rows, lengths)
+
+
+def test_random_puzzles_are_valid_rows():
+    rows, lengths = random_puzzles(500, 10, seed=3)
+    assert rows.shape == (500, 10)
+    assert lengths.min() >= 1 and lengths.max() <= 10
+    for row, length in zip(rows, lengths):
+        assert row[length - 1] == 0
+        assert (row[:length] < length).all()
+        assert (row[length:] == 0).all()
+
+
+def test_measure_throughput():
+    result = measure_throughput(500, 10, loop_count=100)
+    rows, lengths = random_puzzles(500, 10)
+    assert result["solvable"] == sum(looped(rows, lengths))
+    assert result["batch_per_second"] > 0
+    assert result["loop_per_second"] > 0
@@ -0,0 +1,100 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Tests of solve_file against solve_row_puzzle, with chunks small
+#              enough that many tasks are in flight, and of what it leaves
+#              behind when a line can not be read.
+#
+
+import os
+import random
+
+import pytest
+
+from row_puzzle import solve_row_puzzle
+from row_puzzle_stream import solve_file
+
+
+def write_rows(path, count, seed=0):
+    """writes count random rows to path, alternating spaces and commas, and returns them"""
+    rng = random.Random(seed)
+    rows = []
+    with open(path, "w") as out:
+        for index in range(count):
+            length = rng.randrange(1, 20)
+            row = [rng.randrange(length) for _ in range(length - 1)] + [0]
+            rows.append(row)
+            out.write((", " if index % 2 else " ").join(str(square) for square in row) + "\n")
+    return rows
+
+
+@pytest.mark.parametrize("processes, chunk_bytes", [(1, 1 << 20), (2, 64), (3, 1)])
+def test_matches_solve_row_puzzle_in_input_order(tmp_path, processes, chunk_bytes):
+    input_path = str(tmp_path / "rows.txt")
+    output_path = str(tmp_path / "results.txt")
+    rows = write_rows(input_path, 500)
+    stats = solve_file(input_path, output_path, processes=processes, chunk_bytes=chunk_bytes)
+    expected = [solve_row_puzzle(row) for row in rows]
+    with open(output_path) as results:
+        assert results.read().split("\n") == [str(result) for result in expected] + [""]
+    assert stats["rows"] == 500
+    assert stats["solvable"] == sum(expected)
+    assert stats["bytes"] == os.path.getsize(input_path)
+    assert stats["fraction"] == 1.0
+    assert not os.path.exists(output_path + ".part")
+
+
+def test_empty_file(tmp_path):
+    input_path = tmp_path / "rows.txt"
+    input_path.write_text("")
+    output_path = tmp_path / "results.txt"
+    stats = solve_file(str(input_path), str(output_path), processes=1)
+    assert output_path.read_text() == ""
+    assert stats["rows"] == 0
+    assert stats["fraction"] == 1.0
+
+
+def test_blank_line_is_an_empty_row(tmp_path):
+    input_path = tmp_path / "rows.txt"
+    input_path.write_text("1 0\n\n0\n")
+    output_path = tmp_path / "results.txt"
+    solve_file(str(input_path), str(output_path), processes=1)
+    assert output_path.read_text() == "True\nFalse\nTrue\n"
+
+
+def test_bad_line_raises_and_leaves_no_output(tmp_path):
+    input_path = str(tmp_path / "rows.txt")
+    output_path = str(tmp_path / "results.txt")
+    write_rows(input_path, 300)
+    with open(input_path, "a") as out:
+        out.write("1 x 0\n")
+    with pytest.raises(ValueError, match="line 301"):
+        solve_file(input_path, output_path, processes=2, chunk_bytes=64)
+    assert not os.path.exists(output_path)
+    assert not os.path.exists(output_path + ".part")
+
+
+def test_bad_line_keeps_an_earlier_output(tmp_path):
+    input_path = tmp_path / "rows.txt"
+    input_path.write_text("1 0\nzero\n")
+    output_path = tmp_path / "results.txt"
+    output_path.write_text("earlier results\n")
+    with pytest.raises(ValueError):
+        solve_file(str(input_path), str(output_path), processes=1)
+    assert output_path.read_text() == "earlier results\n"
+    assert not os.path.exists(str(output_path) + ".part")
+
+
+def test_progress_ends_with_the_returned_stats(tmp_path):
+    input_path = str(tmp_path / "rows.txt")
+    output_path = str(tmp_path / "results.txt")
+    write_rows(input_path, 400)
+    reports = []
+    stats = solve_file(input_path, output_path, processes=2, chunk_bytes=64, progress=reports.append,
+                       progress_interval=0)
+    assert len(reports) > 1
+    assert reports[-1] == stats
+    rows = [report["rows"] for report in reports]
+    assert rows == sorted(rows)
+    fractions = [report["fraction"] for report in reports]
+    assert fractions == sorted(fractions)
+    assert fractions[-1] == 1.0
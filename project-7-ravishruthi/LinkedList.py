@@ -1,10 +1,35 @@
 # Author: Shruthi Ravi
 # Date: 02/16/2021
-# Description: A linked list implementation with methods that use recursion.
+# Description: A linked list implementation whose methods walk the nodes with
+#              loops, so they run in constant stack depth on lists of any length.
+#              UnrolledLinkedList stores many values per node in arrays,
+#              IndexedLinkedList keeps a value index for fast contains/remove,
+#              and IndexableSkipList reads and inserts by position in O(log n).
+#              ConcurrentLinkedList locks only the nodes it links or unlinks,
+#              to be shared by threads, PersistentLinkedList is immutable,
+#              sharing nodes between versions, and MappedLinkedList keeps its
+#              nodes in a file.
 #
 
+import itertools
+import mmap
+import os
+import pickle
+import random
+import struct
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+
+# values joined into one write by display
+DISPLAY_CHUNK = 4096
+
 
 class Node:
+    # no per-node __dict__, which more than halves the size of a node
+    __slots__ = ("_data", "_next")
+
     def __init__(self, data):
         self._data = data
         self._next = None
@@ -26,139 +51,1742 @@ class Node:
         self._next = a_node
 
 
+class DoubleNode(Node):
+    __slots__ = ("_prev",)
+
+    def __init__(self, data):
+        super().__init__(data)
+        self._prev = None
+
+    def get_prev(self):
+        """returns the previous node."""
+        return self._prev
+
+    def set_prev(self, a_node):
+        """sets previous to the node passed in."""
+        self._prev = a_node
+
+
 class LinkedList:
     def __init__(self):
+        # _tail and _size are kept up to date by every method that adds,
+        # removes or reorders nodes, so changing the links of the nodes
+        # from outside the list leaves them out of date
         self._head = None
+        self._tail = None
+        self._size = 0
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """returns a new linked list holding the values of iterable, in order"""
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+
+    def __len__(self):
+        """returns the number of nodes in the linked list"""
+        return self._size
+
+    def __iter__(self):
+        """yields the values in the linked list, one node at a time"""
+        current = self._head
+        while current is not None:
+            yield current.get_data()
+            current = current.get_next()
+
+    def islice(self, *args):
+        """
+            returns an iterator over part of the linked list, taking the same
+            (stop) or (start, stop[, step]) arguments as itertools.islice
+        """
+        return itertools.islice(iter(self), *args)
 
     def get_head(self):
         """returns node object at head of linked list"""
         return self._head
 
-    def rec_add(self, val, a_node):
-        """
-            recursive add method
-            adds a new node with val passed in at the end of the linked list
-        """
+    def get_tail(self):
+        """returns node object at tail of linked list"""
+        return self._tail
+
+    def get_size(self):
+        """returns the number of nodes in the linked list"""
+        return self._size
+
+    def add(self, val):
+        """adds a new node with val passed in at the end of the linked list"""
+        new_node = Node(val)
         if self._head is None:  # if list is empty, create head node
-            self._head = Node(val)
-        elif a_node.get_next() is not None:  # recurse till last node in list
-            self.rec_add(val, a_node.get_next())
+            self._head = new_node
         else:
-            a_node.set_next(Node(val))
+            self._tail.set_next(new_node)
+        self._tail = new_node
+        self._size += 1
 
-    def add(self, val):
-        """recursive add helper method"""
-        self.rec_add(val, self._head)
+    def extend(self, iterable):
+        """adds the values of iterable at the end of the linked list, linking the nodes in one pass"""
+        if iterable is self:  # walking the list while adding to it would never end
+            iterable = self.to_plain_list()
+        tail = self._tail
+        count = 0
+        try:
+            for val in iterable:
+                new_node = Node(val)
+                if tail is None:
+                    self._head = new_node
+                else:
+                    tail.set_next(new_node)
+                tail = new_node
+                count += 1
+        finally:  # keep _tail and _size right even if iterable raises
+            self._tail = tail
+            self._size += count
 
-    def rec_remove(self, val, previous, current):
-        """
-            recursive remove method
-            removes node with specified val, if found
-        """
+    def remove(self, val):
+        """removes the first node with specified val, if found"""
         if self._head is None:  # if list is empty, return
             return
         if self._head.get_data() == val:  # if val is at head, set next node to head
             self._head = self._head.get_next()
-        else:
-            if current is not None and current.get_data() != val:  # recurse till found
-                self.rec_remove(val, current, current.get_next())
-            elif current is not None:  # if found, set the next of previous node to the node after current node
-                previous.set_next(current.get_next())
+            if self._head is None:
+                self._tail = None
+            self._size -= 1
+            return
+        previous = self._head
+        current = previous.get_next()
+        while current is not None and current.get_data() != val:  # walk till found
+            previous = current
+            current = current.get_next()
+        if current is not None:  # if found, set the next of previous node to the node after current node
+            previous.set_next(current.get_next())
+            if current is self._tail:
+                self._tail = previous
+            self._size -= 1
 
-    def remove(self, val):
-        """recursive remove helper method"""
-        self.rec_remove(val, None, self._head)
+    def remove_if(self, predicate):
+        """
+            removes every node whose value predicate returns True for, in one
+            walk of the list
+            returns the number of nodes removed
+        """
+        removed = 0
+        previous = None
+        current = self._head
+        try:
+            while current is not None:
+                next_node = current.get_next()
+                if predicate(current.get_data()):
+                    if previous is None:
+                        self._head = next_node
+                    else:
+                        previous.set_next(next_node)
+                    removed += 1
+                else:
+                    previous = current
+                current = next_node
+        finally:  # keep _tail and _size right even if predicate raises
+            if current is None:
+                self._tail = previous
+            self._size -= removed
+        return removed
 
-    def rec_contains(self, val, a_node):
+    def remove_all(self, val):
         """
-            recursive contains method
-            returns True if val passed in is in linked list, False otherwise
+            removes every node with specified val
+            returns the number of nodes removed
         """
-        if a_node is None:
-            return False
-        if a_node.get_data() == val:
-            return True
-        return self.rec_contains(val, a_node.get_next())
+        return self.remove_if(lambda data: data == val)
 
     def contains(self, val):
-        """recursive contains helper method"""
-        return self.rec_contains(val, self._head)
+        """returns True if val passed in is in linked list, False otherwise"""
+        current = self._head
+        while current is not None:
+            if current.get_data() == val:
+                return True
+            current = current.get_next()
+        return False
 
-    def rec_insert(self, val, pos, index, current):
+    def insert(self, val, pos):
         """
-            recursive insert helper method
             inserts node with val passed in, at position passed in
+            if pos >= list length (or negative), the node is placed at the end
         """
-        if self._head is None:  # if list is empty, insert node at head
-            self._head = Node(val)
-        elif pos == 0:  # assign head to new node and set next to initial head node
-            self._head = Node(val)
-            self._head.set_next(current)
-        elif index+1 == pos:  # if pos found, place new node in between current node and current's next node
-            new_node = Node(val)
+        if self._head is None or pos < 0 or pos >= self._size:  # at the end, no need to walk
+            self.add(val)
+            return
+        new_node = Node(val)
+        if pos == 0:  # assign head to new node and set next to initial head node
+            new_node.set_next(self._head)
+            self._head = new_node
+        else:
+            current = self._head
+            for _ in range(pos - 1):  # walk to node before pos
+                current = current.get_next()
+            new_node.set_next(current.get_next())  # place new node in between current node and current's next node
+            current.set_next(new_node)
+        self._size += 1
+
+    def reverse(self):
+        """
+            reverse the order of nodes in linked list by changing the 'next'
+            member of each node, not the data it holds
+        """
+        previous = None
+        current = self._head
+        self._tail = current  # head node becomes the tail node
+        while current is not None:
             next_node = current.get_next()  # store current node's 'next' node
-            current.set_next(new_node)  # set current node's 'next' member to new node
-            new_node.set_next(next_node)  # set new node's 'next' member to current node's initial 'next' node
-        elif current.get_next() is None:  # if pos >= list length, place new node at end
-            current.set_next(Node(val))
+            current.set_next(previous)  # set current node's 'next' member to previous node
+            previous = current
+            current = next_node
+        self._head = previous  # last node in list becomes the head node
+
+    def to_plain_list(self):
+        """
+            returns regular list that has same values, in same order has the
+            Nodes in the linked list
+        """
+        result_list = []
+        current = self._head
+        while current is not None:
+            result_list.append(current.get_data())
+            current = current.get_next()
+        return result_list
+
+    def display(self):
+        """prints the values in the linked list, separated by spaces"""
+        _display_values(self)
+
+    # is_empty taken directly from module
+    def is_empty(self):
+        """
+        Returns True if the linked list is empty, False otherwise
+        """
+        return self._head is None
+
+
+class IndexedLinkedList(LinkedList):
+    def __init__(self):
+        """
+            linked list with the same methods as LinkedList, made of
+            DoubleNodes so a node can be unlinked without a walk, and with an
+            index from each value to its nodes in list order, so contains and
+            remove do not scan the list
+            a value held by one node indexes that node, and a value held by
+            more indexes an OrderedDict of its nodes, which finds the first
+            and unlinks any of them in O(1)
+            unhashable values are left out of the index; while the list holds
+            any, contains and remove fall back to scanning the list
+            changing a node's data with set_data leaves the index out of date
+        """
+        super().__init__()
+        self._index = {}
+        self._unindexed = 0
+
+    def _index_node(self, node, equal_before=None):
+        """
+            adds node to the index entry of its value, after equal_before
+            nodes with the same value, or at the end if None
+        """
+        try:
+            entry = self._index.get(node.get_data())
+        except TypeError:  # unhashable value
+            self._unindexed += 1
+            return
+        if entry is None:
+            self._index[node.get_data()] = node
+            return
+        if isinstance(entry, DoubleNode):
+            entry = OrderedDict(((entry, None),))
+            self._index[node.get_data()] = entry
+        entry[node] = None
+        if equal_before is not None and equal_before < len(entry) - 1:
+            if equal_before == 0:
+                entry.move_to_end(node, last=False)
+            else:  # move the nodes that come after it behind it
+                for later in list(itertools.islice(entry, equal_before, len(entry) - 1)):
+                    entry.move_to_end(later)
+
+    def _unindex_node(self, node):
+        """removes node from the index entry of its value"""
+        try:
+            entry = self._index[node.get_data()]
+        except TypeError:  # unhashable value
+            self._unindexed -= 1
+            return
+        if isinstance(entry, DoubleNode):
+            del self._index[node.get_data()]
+            return
+        del entry[node]
+        if len(entry) == 1:  # back to indexing the node itself
+            self._index[node.get_data()] = next(iter(entry))
+
+    def _find(self, val):
+        """returns the first node holding val, None if there is none"""
+        if self._unindexed == 0:
+            try:
+                entry = self._index.get(val)
+            except TypeError:  # unhashable val, scan for it below
+                pass
+            else:
+                if entry is None or isinstance(entry, DoubleNode):
+                    return entry
+                return next(iter(entry))
+        current = self._head
+        while current is not None and current.get_data() != val:
+            current = current.get_next()
+        return current
+
+    def _unlink(self, node):
+        """takes node out of the linked list and the index"""
+        self._detach(node)
+        self._unindex_node(node)
+
+    def _detach(self, node):
+        """takes node out of the linked list, leaving the index to the caller"""
+        previous = node.get_prev()
+        next_node = node.get_next()
+        if previous is None:
+            self._head = next_node
         else:
-            self.rec_insert(val, pos, index+1, current.get_next())
+            previous.set_next(next_node)
+        if next_node is None:
+            self._tail = previous
+        else:
+            next_node.set_prev(previous)
+        self._size -= 1
 
-    def insert(self, val, pos):
-        """recursive insert method"""
-        self.rec_insert(val, pos, 0, self._head)
+    def add(self, val):
+        """adds a new node with val passed in at the end of the linked list"""
+        new_node = DoubleNode(val)
+        if self._head is None:
+            self._head = new_node
+        else:
+            self._tail.set_next(new_node)
+            new_node.set_prev(self._tail)
+        self._tail = new_node
+        self._size += 1
+        self._index_node(new_node)
+
+    def remove(self, val):
+        """removes the first node with specified val, if found"""
+        node = self._find(val)
+        if node is not None:
+            self._unlink(node)
 
-    def rec_reverse(self, previous, current):
+    def extend(self, iterable):
+        """adds the values of iterable at the end of the linked list"""
+        if iterable is self:  # walking the list while adding to it would never end
+            iterable = self.to_plain_list()
+        for val in iterable:
+            self.add(val)
+
+    def remove_if(self, predicate):
         """
-            recursive reverse helper method
-            reverse the order of nodes in linked list
+            removes every node whose value predicate returns True for, in one
+            walk of the list
+            the index entries of the removed values are rebuilt once each,
+            after the walk
+            returns the number of nodes removed
         """
-        if self._head is None:  # if list is empty, return
+        removed = 0
+        removed_by_value = {}
+        current = self._head
+        try:
+            while current is not None:
+                next_node = current.get_next()
+                if predicate(current.get_data()):
+                    self._detach(current)
+                    removed += 1
+                    try:
+                        removed_by_value.setdefault(current.get_data(), set()).add(current)
+                    except TypeError:  # unhashable value
+                        self._unindexed -= 1
+                current = next_node
+        finally:  # keep the index right even if predicate raises
+            for val, nodes in removed_by_value.items():
+                self._rebuild_entry(val, nodes)
+        return removed
+
+    def _rebuild_entry(self, val, nodes):
+        """rebuilds the index entry of val without the set of nodes passed in"""
+        entry = self._index[val]
+        if isinstance(entry, DoubleNode) or len(entry) == len(nodes):
+            del self._index[val]
+            return
+        kept = [node for node in entry if node not in nodes]
+        self._index[val] = kept[0] if len(kept) == 1 else OrderedDict.fromkeys(kept)
+
+    def remove_all(self, val):
+        """
+            removes every node with specified val, straight from the index
+            when it can be used
+            returns the number of nodes removed
+        """
+        if self._unindexed == 0:
+            try:
+                entry = self._index.pop(val, None)
+            except TypeError:  # unhashable val
+                pass
+            else:
+                if entry is None:
+                    return 0
+                nodes = [entry] if isinstance(entry, DoubleNode) else entry
+                for node in nodes:  # the whole entry is gone, so only unlink
+                    self._detach(node)
+                return len(nodes)
+        return super().remove_all(val)
+
+    def contains(self, val):
+        """returns True if val passed in is in linked list, False otherwise"""
+        return self._find(val) is not None
+
+    def insert(self, val, pos):
+        """
+            inserts node with val passed in, at position passed in
+            if pos >= list length (or negative), the node is placed at the end
+        """
+        if self._head is None or pos < 0 or pos >= self._size:  # at the end, no need to walk
+            self.add(val)
             return
-        elif current.get_next() is None:  # if on last node in list
-            self._head = current  # make this the head node
-            current.set_next(previous)  # set 'next' member to the node before it
+        new_node = DoubleNode(val)
+        equal_before = 0  # nodes with the same value before the new node
+        if pos == 0:
+            next_node = self._head
+            self._head = new_node
         else:
-            next_node = current.get_next()  # store current node's 'next' node
-            current.set_next(previous)  # set current node's 'next' member to previous node
-            self.rec_reverse(current, next_node)  # recurse, go to next node in list
+            current = self._head
+            for _ in range(pos - 1):  # walk to node before pos
+                if current.get_data() == val:
+                    equal_before += 1
+                current = current.get_next()
+            if current.get_data() == val:
+                equal_before += 1
+            next_node = current.get_next()
+            current.set_next(new_node)
+            new_node.set_prev(current)
+        new_node.set_next(next_node)
+        next_node.set_prev(new_node)
+        self._size += 1
+        self._index_node(new_node, equal_before)
 
     def reverse(self):
-        """recursive reverse method"""
-        self.rec_reverse(None, self._head)
+        """
+            reverse the order of nodes in linked list by swapping the 'next'
+            and 'prev' members of each node
+        """
+        previous = None
+        current = self._head
+        self._tail = current
+        while current is not None:
+            next_node = current.get_next()
+            current.set_next(current.get_prev())
+            current.set_prev(next_node)
+            previous = current
+            current = next_node
+        self._head = previous
+        for val, entry in list(self._index.items()):
+            if not isinstance(entry, DoubleNode):
+                self._index[val] = OrderedDict.fromkeys(reversed(entry))
 
-    def rec_to_plain_list(self, current, result_list):
+
+class Block:
+    __slots__ = ("_data", "_next")
+
+    def __init__(self, data):
+        self._data = data
+        self._next = None
+
+    def get_data(self):
+        """returns the list or array of values held in the block."""
+        return self._data
+
+    def set_data(self, values):
+        """sets the values to the list or array passed in."""
+        self._data = values
+
+    def get_next(self):
+        """returns the next block."""
+        return self._next
+
+    def set_next(self, a_block):
+        """sets next to the block passed in."""
+        self._next = a_block
+
+
+class UnrolledLinkedList:
+    def __init__(self, block_size=64, typecode=None):
         """
-            recursive to_plain_list helper method
-            returns regular list that has same values, in same order has the
-            Nodes in the linked list
+            unrolled linked list with the same methods as LinkedList, which
+            keeps up to block_size values in each Block instead of one value
+            per Node
+            with a typecode (see the array module), values are packed in
+            arrays of that type instead of lists
+        """
+        self._head = None
+        self._tail = None
+        self._size = 0
+        self._block_size = block_size
+        self._typecode = typecode
+
+    @classmethod
+    def from_iterable(cls, iterable, block_size=64, typecode=None):
+        """returns a new unrolled linked list holding the values of iterable, in order"""
+        linked_list = cls(block_size, typecode)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def __len__(self):
+        """returns the number of values in the linked list"""
+        return self._size
+
+    def __iter__(self):
+        """yields the values in the linked list, one block at a time"""
+        return _block_values(self._head)
+
+    def islice(self, *args):
+        """
+            returns an iterator over part of the linked list, taking the same
+            (stop) or (start, stop[, step]) arguments as itertools.islice
+            whole blocks before start are skipped without reading their values
+        """
+        bounds = slice(*args)
+        start = bounds.start or 0
+        stop = bounds.stop
+        if start < 0 or (stop is not None and stop < 0) or (bounds.step is not None and bounds.step < 1):
+            raise ValueError("islice arguments must be None or non-negative, and step must be positive")
+        current = self._head
+        while current is not None and start >= len(current.get_data()):
+            start -= len(current.get_data())
+            if stop is not None:
+                stop = max(0, stop - len(current.get_data()))
+            current = current.get_next()
+        return itertools.islice(_block_values(current), start, stop, bounds.step)
+
+    def get_head(self):
+        """returns block object at head of linked list"""
+        return self._head
+
+    def get_tail(self):
+        """returns block object at tail of linked list"""
+        return self._tail
+
+    def get_size(self):
+        """returns the number of values in the linked list"""
+        return self._size
+
+    def _new_block(self, values=()):
+        """returns a new block holding values"""
+        if self._typecode is None:
+            return Block(list(values))
+        return Block(array(self._typecode, values))
+
+    def add(self, val):
+        """adds val passed in at the end of the linked list"""
+        if self._tail is None or len(self._tail.get_data()) >= self._block_size:
+            new_block = self._new_block()
+            if self._tail is None:
+                self._head = new_block
+            else:
+                self._tail.set_next(new_block)
+            self._tail = new_block
+        self._tail.get_data().append(val)
+        self._size += 1
+
+    def extend(self, iterable):
+        """
+            adds the values of iterable at the end of the linked list, filling
+            the last block and then whole new blocks
+        """
+        if iterable is self:  # walking the list while adding to it would never end
+            iterable = self.to_plain_list()
+        values_iter = iter(iterable)
+        if self._tail is not None:
+            values = self._tail.get_data()
+            before = len(values)
+            try:
+                values.extend(itertools.islice(values_iter, self._block_size - before))
+            finally:
+                self._size += len(values) - before
+        while True:
+            new_block = self._new_block(itertools.islice(values_iter, self._block_size))
+            if not new_block.get_data():
+                return
+            if self._tail is None:
+                self._head = new_block
+            else:
+                self._tail.set_next(new_block)
+            self._tail = new_block
+            self._size += len(new_block.get_data())
+
+    def remove_if(self, predicate):
+        """
+            removes every value predicate returns True for, in one walk of the
+            list
+            emptied blocks are dropped and neighbouring blocks that fit in one
+            are merged
+            returns the number of values removed
+        """
+        removed = 0
+        previous = None
+        current = self._head
+        while current is not None:
+            values = current.get_data()
+            kept = [val for val in values if not predicate(val)]
+            next_block = current.get_next()
+            if len(kept) != len(values):
+                removed += len(values) - len(kept)
+                self._size -= len(values) - len(kept)
+                del values[:]
+                values.extend(kept)
+            if previous is not None and len(previous.get_data()) + len(values) <= self._block_size:
+                previous.get_data().extend(values)  # merge into the block before, or drop if empty
+                previous.set_next(next_block)
+                if current is self._tail:
+                    self._tail = previous
+            elif not values:  # empty block at the head
+                self._head = next_block
+                if current is self._tail:
+                    self._tail = None
+            else:
+                previous = current
+            current = next_block
+        return removed
+
+    def remove_all(self, val):
+        """
+            removes every occurrence of val
+            returns the number of values removed
+        """
+        return self.remove_if(lambda data: data == val)
+
+    def remove(self, val):
+        """
+            removes the first occurrence of val, if found
+            a block left less than half full is merged with the next block
+            if they fit in one
+        """
+        previous = None
+        current = self._head
+        while current is not None and val not in current.get_data():  # walk till found
+            previous = current
+            current = current.get_next()
+        if current is None:
+            return
+        values = current.get_data()
+        del values[values.index(val)]
+        self._size -= 1
+        next_block = current.get_next()
+        if not values:  # unlink the empty block
+            if previous is None:
+                self._head = next_block
+            else:
+                previous.set_next(next_block)
+            if current is self._tail:
+                self._tail = previous
+        elif (next_block is not None and len(values) < self._block_size // 2 and
+              len(values) + len(next_block.get_data()) <= self._block_size):
+            values.extend(next_block.get_data())
+            current.set_next(next_block.get_next())
+            if next_block is self._tail:
+                self._tail = current
+
+    def contains(self, val):
+        """returns True if val passed in is in linked list, False otherwise"""
+        current = self._head
+        while current is not None:
+            if val in current.get_data():
+                return True
+            current = current.get_next()
+        return False
+
+    def insert(self, val, pos):
+        """
+            inserts val passed in, at position passed in
+            if pos >= list length (or negative), val is placed at the end
+            a block that grows past block_size is split in two
+        """
+        if self._head is None or pos < 0 or pos >= self._size:  # at the end, no need to walk
+            self.add(val)
+            return
+        current = self._head
+        while pos > len(current.get_data()):  # walk to the block holding pos
+            pos -= len(current.get_data())
+            current = current.get_next()
+        values = current.get_data()
+        values.insert(pos, val)
+        self._size += 1
+        if len(values) > self._block_size:
+            half = len(values) // 2
+            new_block = self._new_block(values[half:])
+            del values[half:]
+            new_block.set_next(current.get_next())
+            current.set_next(new_block)
+            if current is self._tail:
+                self._tail = new_block
+
+    def reverse(self):
+        """reverse the order of values by reversing the blocks and the values in each"""
+        previous = None
+        current = self._head
+        self._tail = current
+        while current is not None:
+            current.get_data().reverse()
+            next_block = current.get_next()
+            current.set_next(previous)
+            previous = current
+            current = next_block
+        self._head = previous
+
+    def to_plain_list(self):
+        """returns regular list that has same values, in same order"""
+        result_list = []
+        current = self._head
+        while current is not None:
+            result_list.extend(current.get_data())
+            current = current.get_next()
+        return result_list
+
+    def display(self):
+        """prints the values in the linked list, separated by spaces"""
+        _display_values(self)
+
+    def is_empty(self):
+        """
+        Returns True if the linked list is empty, False otherwise
+        """
+        return self._head is None
+
+
+class SkipNode:
+    __slots__ = ("_data", "_next", "_width")
+
+    def __init__(self, data, level):
+        self._data = data
+        self._next = [None] * level
+        # _width[i] is how many positions following _next[i] moves forward,
+        # kept only while _next[i] is not None
+        self._width = [1] * level
+
+    def get_data(self):
+        """returns the data."""
+        return self._data
+
+    def set_data(self, val):
+        """sets the data to the value passed in."""
+        self._data = val
+
+    def get_level(self):
+        """returns the number of levels the node is linked on."""
+        return len(self._next)
+
+    def get_next(self, level=0):
+        """returns the next node on level passed in, the next node in the list on level 0."""
+        return self._next[level]
+
+    def set_next(self, a_node, level=0):
+        """sets next on level passed in to the node passed in."""
+        self._next[level] = a_node
+
+    def get_width(self, level=0):
+        """returns the number of positions between the node and its next node on level passed in."""
+        return self._width[level]
+
+    def set_width(self, width, level=0):
+        """sets the width on level passed in."""
+        self._width[level] = width
+
+
+class IndexableSkipList:
+    # 2 ** MAX_LEVEL values before the top level stops thinning out
+    MAX_LEVEL = 32
+
+    def __init__(self, seed=None):
+        """
+            skip list ordered by position, not by value, with the same methods
+            as LinkedList plus __getitem__ and __delitem__
+            every link stores how many positions it skips, so reading,
+            inserting and deleting at a position take O(log n) expected steps
+            seed seeds the random levels of the nodes, for repeatable layouts
+        """
+        self._header = SkipNode(None, self.MAX_LEVEL)  # sentinel before position 0
+        self._level = 1
+        self._tail = None
+        self._size = 0
+        self._random = random.Random(seed)
+
+    @classmethod
+    def from_iterable(cls, iterable, seed=None):
+        """returns a new skip list holding the values of iterable, in order"""
+        skip_list = cls(seed)
+        skip_list.extend(iterable)
+        return skip_list
+
+    def __len__(self):
+        """returns the number of values in the skip list"""
+        return self._size
+
+    def __iter__(self):
+        """yields the values in the skip list, following the level 0 links"""
+        current = self._header.get_next()
+        while current is not None:
+            yield current.get_data()
+            current = current.get_next()
+
+    def islice(self, *args):
+        """
+            returns an iterator over part of the skip list, taking the same
+            (stop) or (start, stop[, step]) arguments as itertools.islice
+            the node at start is found by position, without walking the
+            nodes before it
+        """
+        bounds = slice(*args)
+        start = bounds.start or 0
+        stop = bounds.stop
+        if start < 0 or (stop is not None and stop < 0) or (bounds.step is not None and bounds.step < 1):
+            raise ValueError("islice arguments must be None or non-negative, and step must be positive")
+        if start >= self._size:
+            return iter(())
+        current = self._find(start)[0][0].get_next()
+        if stop is not None:
+            stop = max(0, stop - start)
+        return itertools.islice(_node_values(current), 0, stop, bounds.step)
+
+    def __getitem__(self, pos):
+        """returns the value at position pos, counting from the end if negative"""
+        pos = self._check_position(pos)
+        current = self._header
+        index = -1
+        for level in range(self._level - 1, -1, -1):
+            while current.get_next(level) is not None and index + current.get_width(level) <= pos:
+                index += current.get_width(level)
+                current = current.get_next(level)
+        return current.get_data()
+
+    def __delitem__(self, pos):
+        """removes the value at position pos, counting from the end if negative"""
+        pos = self._check_position(pos)
+        update = self._find(pos)[0]
+        self._unlink(update, update[0].get_next())
+
+    def get_head(self):
+        """returns node object at head of skip list"""
+        return self._header.get_next()
+
+    def get_tail(self):
+        """returns node object at tail of skip list"""
+        return self._tail
+
+    def get_size(self):
+        """returns the number of values in the skip list"""
+        return self._size
+
+    def _check_position(self, pos):
+        """returns pos as a position from the start, raising IndexError if out of range"""
+        if pos < 0:
+            pos += self._size
+        if not 0 <= pos < self._size:
+            raise IndexError("skip list index out of range")
+        return pos
+
+    def _random_level(self):
         """
+            returns a level from 1 to MAX_LEVEL, each level half as likely as
+            the one below
+            a level more than one above the top level in use is cut down to
+            it, so short lists are not walked through many empty levels
+        """
+        bits = self._random.getrandbits(self.MAX_LEVEL - 1)
+        level = 1
+        while bits & 1 and level <= self._level:
+            level += 1
+            bits >>= 1
+        return level
+
+    def _find(self, pos):
+        """
+            returns, for every level, the last node before position pos and
+            that node's position (-1 for the header)
+        """
+        update = [self._header] * self.MAX_LEVEL
+        positions = [-1] * self.MAX_LEVEL
+        current = self._header
+        index = -1
+        for level in range(self._level - 1, -1, -1):
+            while current.get_next(level) is not None and index + current.get_width(level) < pos:
+                index += current.get_width(level)
+                current = current.get_next(level)
+            update[level] = current
+            positions[level] = index
+        return update, positions
+
+    def _insert_at(self, val, pos):
+        """inserts val so that it ends up at position pos, 0 <= pos <= size"""
+        update, positions = self._find(pos)
+        new_node = SkipNode(val, self._random_level())
+        new_level = new_node.get_level()
+        if new_level > self._level:  # levels above the old top start at the header
+            self._level = new_level
+        for level in range(new_level):
+            previous = update[level]
+            following = previous.get_next(level)
+            if following is not None:  # following moves one position on
+                new_node.set_width(positions[level] + previous.get_width(level) + 1 - pos, level)
+            new_node.set_next(following, level)
+            previous.set_next(new_node, level)
+            previous.set_width(pos - positions[level], level)
+        for level in range(new_level, self._level):  # links that now skip one more position
+            if update[level].get_next(level) is not None:
+                update[level].set_width(update[level].get_width(level) + 1, level)
+        if new_node.get_next() is None:
+            self._tail = new_node
+        self._size += 1
+
+    def _unlink(self, update, node):
+        """unlinks node, given the last node before it on every level"""
+        for level in range(self._level):
+            previous = update[level]
+            if previous.get_next(level) is node:
+                if node.get_next(level) is not None:
+                    previous.set_width(previous.get_width(level) + node.get_width(level) - 1, level)
+                previous.set_next(node.get_next(level), level)
+            elif previous.get_next(level) is not None:  # link skipped over node
+                previous.set_width(previous.get_width(level) - 1, level)
+        while self._level > 1 and self._header.get_next(self._level - 1) is None:
+            self._level -= 1
+        if node is self._tail:
+            self._tail = None if update[0] is self._header else update[0]
+        self._size -= 1
+
+    def add(self, val):
+        """adds a new node with val passed in at the end of the skip list"""
+        self._insert_at(val, self._size)
+
+    def extend(self, iterable):
+        """adds the values of iterable at the end of the skip list, in O(1) expected steps per value"""
+        if iterable is self:  # walking the list while adding to it would never end
+            iterable = self.to_plain_list()
+        # appending only ever links after the last node on each level
+        update, positions = self._find(self._size)
+        for val in iterable:
+            new_node = SkipNode(val, self._random_level())
+            new_level = new_node.get_level()
+            if new_level > self._level:
+                self._level = new_level
+            for level in range(new_level):
+                update[level].set_next(new_node, level)
+                update[level].set_width(self._size - positions[level], level)
+                update[level] = new_node
+                positions[level] = self._size
+            self._tail = new_node
+            self._size += 1
+
+    def remove(self, val):
+        """
+            removes the first occurrence of val, if found
+            finding val walks the level 0 links, since the skip list is not
+            ordered by value, then the nodes before it are found by position
+        """
+        pos = 0
+        current = self._header.get_next()
+        while current is not None and current.get_data() != val:  # walk till found
+            pos += 1
+            current = current.get_next()
         if current is not None:
+            self._unlink(self._find(pos)[0], current)
+
+    def contains(self, val):
+        """returns True if val passed in is in skip list, False otherwise"""
+        current = self._header.get_next()
+        while current is not None:
+            if current.get_data() == val:
+                return True
+            current = current.get_next()
+        return False
+
+    def insert(self, val, pos):
+        """
+            inserts val passed in, at position passed in
+            if pos >= list length (or negative), val is placed at the end
+        """
+        if pos < 0 or pos >= self._size:
+            pos = self._size
+        self._insert_at(val, pos)
+
+    def reverse(self):
+        """
+            reverse the order of values
+            the widths depend on the order, so the values are linked into
+            new nodes in reverse order
+        """
+        values = self.to_plain_list()
+        self._header = SkipNode(None, self.MAX_LEVEL)
+        self._level = 1
+        self._tail = None
+        self._size = 0
+        self.extend(reversed(values))
+
+    def to_plain_list(self):
+        """returns regular list that has same values, in same order"""
+        return list(self)
+
+    def display(self):
+        """prints the values in the skip list, separated by spaces"""
+        _display_values(self)
+
+    def is_empty(self):
+        """
+        Returns True if the skip list is empty, False otherwise
+        """
+        return self._size == 0
+
+
+class LockedNode(Node):
+    __slots__ = ("_lock", "_removed")
+
+    def __init__(self, data):
+        super().__init__(data)
+        self._lock = threading.Lock()
+        self._removed = False
+
+    def get_lock(self):
+        """returns the lock guarding the node's next link."""
+        return self._lock
+
+    def is_removed(self):
+        """returns True once the node has been unlinked from its list."""
+        return self._removed
+
+    def set_removed(self):
+        """marks the node as unlinked from its list."""
+        self._removed = True
+
+
+class ConcurrentLinkedList:
+    def __init__(self):
+        """
+            linked list with the same methods as LinkedList that can be shared
+            between threads
+            every node has its own lock, but walks take no locks: a method
+            finds its place without locking, locks only the nodes it links or
+            unlinks, in list order, and checks they are still linked to each
+            other, starting over if not, so threads working on different
+            parts of the list do not wait for each other
+            an unlinked node is marked removed and keeps its next link, so a
+            walk standing on it carries on into the list, and no node is
+            ever linked after a removed one
+            add only locks the tail node, and the size has its own lock
+        """
+        self._head = LockedNode(None)  # sentinel, never removed
+        self._tail = self._head  # only written while holding the tail node's lock
+        self._size = 0
+        self._size_lock = threading.Lock()
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """returns a new linked list holding the values of iterable, in order"""
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+
+    def __len__(self):
+        """returns the number of nodes in the linked list"""
+        return self._size
+
+    def __iter__(self):
+        """
+            yields the values in the linked list as they were when iteration
+            started, so no lock is held between values
+        """
+        return iter(self.to_plain_list())
+
+    def islice(self, *args):
+        """
+            returns an iterator over part of the linked list, taking the same
+            (stop) or (start, stop[, step]) arguments as itertools.islice
+        """
+        return itertools.islice(iter(self), *args)
+
+    def get_head(self):
+        """returns node object at head of linked list"""
+        return self._head.get_next()
+
+    def get_tail(self):
+        """returns node object at tail of linked list"""
+        tail = self._tail
+        return None if tail is self._head else tail
+
+    def get_size(self):
+        """returns the number of nodes in the linked list"""
+        return self._size
+
+    def _change_size(self, change):
+        """adds change to the size"""
+        with self._size_lock:
+            self._size += change
+
+    def _link_after(self, previous, val):
+        """links a new node with val after previous, whose lock the caller holds"""
+        new_node = LockedNode(val)
+        new_node.set_next(previous.get_next())
+        previous.set_next(new_node)
+        if previous is self._tail:
+            self._tail = new_node
+        self._change_size(1)
+
+    def add(self, val):
+        """adds a new node with val passed in at the end of the linked list"""
+        while True:
+            tail = self._tail
+            with tail.get_lock():
+                # another thread may have added after or removed tail
+                # between reading it and locking it
+                if tail.get_next() is None and not tail.is_removed():
+                    self._link_after(tail, val)
+                    return
+
+    def extend(self, iterable):
+        """adds the values of iterable at the end of the linked list"""
+        if iterable is self:  # walking the list while adding to it would never end
+            iterable = self.to_plain_list()
+        for val in iterable:
+            self.add(val)
+
+    def remove(self, val):
+        """removes the first occurrence of val, if found"""
+        while True:
+            previous = self._head
+            current = previous.get_next()
+            while current is not None and current.get_data() != val:
+                previous = current
+                current = current.get_next()
+            if current is None:
+                return
+            with previous.get_lock(), current.get_lock():
+                # another thread may have unlinked either node, or linked a
+                # node between them, since the walk passed them
+                if not previous.is_removed() and not current.is_removed() and previous.get_next() is current:
+                    previous.set_next(current.get_next())
+                    current.set_removed()
+                    if current is self._tail:
+                        self._tail = previous
+                    self._change_size(-1)
+                    return
+
+    def contains(self, val):
+        """
+            returns True if val passed in is in linked list, False otherwise
+            no lock is taken; a walk only reaches a removed node that was
+            unlinked after the walk started, whose value counts as found
+        """
+        current = self._head.get_next()
+        while current is not None:
+            if current.get_data() == val:
+                return True
+            current = current.get_next()
+        return False
+
+    def insert(self, val, pos):
+        """
+            inserts val passed in, at position passed in
+            if pos >= list length (or negative), val is placed at the end
+        """
+        if pos < 0:
+            self.add(val)
+            return
+        while True:
+            # walk to the node before pos, stopping at the tail if the list
+            # is shorter than pos
+            previous = self._head
+            steps = pos
+            while steps > 0 and previous.get_next() is not None:
+                previous = previous.get_next()
+                steps -= 1
+            with previous.get_lock():
+                if not previous.is_removed():
+                    self._link_after(previous, val)
+                    return
+
+    def reverse(self):
+        """
+            reverse the order of nodes
+            every node is locked, in list order, while the reversed list is
+            built from new nodes; the old nodes are marked removed and keep
+            their links, so walks already on them finish on the old order
+        """
+        locked = [self._head]
+        self._head.get_lock().acquire()
+        try:
+            current = self._head.get_next()
+            while current is not None:
+                current.get_lock().acquire()
+                locked.append(current)
+                current = current.get_next()
+            first = None
+            tail = self._head
+            for current in locked[1:]:
+                new_node = LockedNode(current.get_data())
+                new_node.set_next(first)
+                first = new_node
+                if tail is self._head:
+                    tail = new_node
+                current.set_removed()
+            self._head.set_next(first)
+            self._tail = tail
+        finally:
+            for node in locked:
+                node.get_lock().release()
+
+    def to_plain_list(self):
+        """
+            returns regular list that has same values, in same order
+            no lock is taken, so values linked or unlinked by other threads
+            during the walk may or may not be in it
+        """
+        result_list = []
+        current = self._head.get_next()
+        while current is not None:
             result_list.append(current.get_data())
-            self.rec_to_plain_list(current.get_next(), result_list)
+            current = current.get_next()
         return result_list
 
+    def display(self):
+        """prints the values in the linked list, separated by spaces"""
+        _display_values(self)
+
+    def is_empty(self):
+        """
+        Returns True if the linked list is empty, False otherwise
+        """
+        return self._head.get_next() is None
+
+
+class PersistentLinkedList:
+    def __init__(self):
+        """
+            immutable linked list, with the same methods as LinkedList except
+            that add, remove, insert and reverse return a new list and leave
+            this one as it was
+            new lists share every node after the changed part with the list
+            they came from, so keeping an old version as a snapshot costs
+            nothing, and a change allocates only the nodes before it
+            the nodes are shared between versions and must not be changed
+        """
+        self._head = None
+        self._size = 0
+        # reverse() is lazy: a reversed list keeps the list it reverses in
+        # _reversed_from until its nodes are first needed, and both lists
+        # keep each other in _reverse so reversing back costs nothing
+        self._reversed_from = None
+        self._reverse = None
+
+    @classmethod
+    def _from_nodes(cls, head, size):
+        """returns a new persistent list whose nodes start at head"""
+        persistent_list = cls()
+        persistent_list._head = head
+        persistent_list._size = size
+        return persistent_list
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """returns a new persistent list holding the values of iterable, in order"""
+        head = None
+        size = 0
+        for val in reversed(list(iterable)):
+            new_node = Node(val)
+            new_node.set_next(head)
+            head = new_node
+            size += 1
+        return cls._from_nodes(head, size)
+
+    def __len__(self):
+        """returns the number of nodes in the linked list"""
+        return self._size
+
+    def __iter__(self):
+        """yields the values in the linked list, one node at a time"""
+        return _node_values(self.get_head())
+
+    def islice(self, *args):
+        """
+            returns an iterator over part of the linked list, taking the same
+            (stop) or (start, stop[, step]) arguments as itertools.islice
+        """
+        return itertools.islice(iter(self), *args)
+
+    def get_head(self):
+        """returns node object at head of linked list, building it first if the list is a pending reverse"""
+        if self._reversed_from is not None:
+            head = None
+            for val in self._reversed_from:
+                new_node = Node(val)
+                new_node.set_next(head)
+                head = new_node
+            self._head = head
+            self._reversed_from = None
+        return self._head
+
+    def get_size(self):
+        """returns the number of nodes in the linked list"""
+        return self._size
+
+    def _copy_prefix(self, count):
+        """
+            copies the first count nodes
+            returns the first and last copied nodes, and the first node not
+            copied
+        """
+        first = None
+        last = None
+        current = self.get_head()
+        for _ in range(count):
+            new_node = Node(current.get_data())
+            if first is None:
+                first = new_node
+            else:
+                last.set_next(new_node)
+            last = new_node
+            current = current.get_next()
+        return first, last, current
+
+    def add(self, val):
+        """returns a new list with a new node with val passed in at the front, sharing every node of this one"""
+        new_node = Node(val)
+        new_node.set_next(self.get_head())
+        return self._from_nodes(new_node, self._size + 1)
+
+    def remove(self, val):
+        """
+            returns a new list without the first occurrence of val, copying
+            the nodes before it and sharing the nodes after it
+            returns this list if val is not found
+        """
+        pos = 0
+        current = self.get_head()
+        while current is not None and current.get_data() != val:  # walk till found
+            pos += 1
+            current = current.get_next()
+        if current is None:
+            return self
+        first, last, found = self._copy_prefix(pos)
+        if first is None:
+            return self._from_nodes(found.get_next(), self._size - 1)
+        last.set_next(found.get_next())
+        return self._from_nodes(first, self._size - 1)
+
+    def contains(self, val):
+        """returns True if val passed in is in linked list, False otherwise"""
+        current = self.get_head()
+        while current is not None:
+            if current.get_data() == val:
+                return True
+            current = current.get_next()
+        return False
+
+    def insert(self, val, pos):
+        """
+            returns a new list with val passed in at position passed in,
+            copying the nodes before it and sharing the nodes after it
+            if pos >= list length (or negative), val is placed at the end,
+            which copies every node
+        """
+        if pos < 0 or pos >= self._size:
+            pos = self._size
+        first, last, rest = self._copy_prefix(pos)
+        new_node = Node(val)
+        new_node.set_next(rest)
+        if first is None:
+            return self._from_nodes(new_node, self._size + 1)
+        last.set_next(new_node)
+        return self._from_nodes(first, self._size + 1)
+
+    def reverse(self):
+        """
+            returns a new list with the values in reverse order
+            the reversed nodes are only built when the new list is first
+            read, and reversing it again returns this list
+        """
+        if self._reverse is None:
+            reversed_list = self._from_nodes(None, self._size)
+            reversed_list._reversed_from = self
+            reversed_list._reverse = self
+            self._reverse = reversed_list
+        return self._reverse
+
     def to_plain_list(self):
-        """recursive to_plain_list method"""
-        return self.rec_to_plain_list(self._head, [])
-
-    # rec_display taken directly from README
-    def rec_display(self, a_node):
-        """recursive display method"""
-        if a_node is None:
-            print("\n")  # added for new line
+        """returns regular list that has same values, in same order"""
+        return list(self)
+
+    def display(self):
+        """prints the values in the linked list, separated by spaces"""
+        _display_values(self)
+
+    def is_empty(self):
+        """
+        Returns True if the linked list is empty, False otherwise
+        """
+        return self._size == 0
+
+
+class MappedLinkedList:
+    MAGIC = b"LLMM"
+    # magic, typecode (a space for pickled values), then head, tail, size,
+    # free list head, free count, records allocated, heap end, heap bytes
+    # of removed values
+    HEADER = struct.Struct("<4s1s3x8q")
+    NULL = -1
+    INITIAL_CAPACITY = 1024
+    # compact() runs on its own once at least this many records are
+    # allocated and half of them are free, or half the heap is garbage
+    COMPACT_MIN_RECORDS = 1024
+
+    def __init__(self, path, typecode=None):
+        """
+            linked list with the same methods as LinkedList whose nodes are
+            fixed-size records in a memory-mapped file, so it can hold more
+            values than fit in memory and keeps them after it is closed
+            with a typecode (see the array module), each record holds the
+            value itself; without one, values are pickled into a value heap
+            in path + ".heap" and the record holds their offset and length
+            (only open heaps from a trusted source, as unpickling runs code)
+            an existing file at path is opened with its values, and must
+            have been written with the same typecode
+            only the integer and float typecodes can be used, as the values
+            are stored with their array itemsize; others raise ValueError
+            removed records go on a free list that later nodes reuse, and
+            compact() rewrites the records in list order
+        """
+        self._path = path
+        self._heap_path = path + ".heap"
+        self._typecode = typecode
+        if typecode is None:
+            self._record = struct.Struct("<qqq")  # heap offset, length, next
+        else:
+            self._record = struct.Struct("<" + _struct_code(typecode) + "q")  # value, next
+        self._next_offset = self._record.size - 8
+        self._open()
+
+    @classmethod
+    def from_iterable(cls, iterable, path, typecode=None):
+        """returns a new mapped linked list at path holding the values of iterable, in order"""
+        linked_list = cls(path, typecode)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _open(self):
+        """
+            opens the record file, creating it if missing, and reads or writes
+            its header, then opens the heap if values are pickled; a record
+            file created here is deleted again if anything fails
+        """
+        code = b" " if self._typecode is None else self._typecode.encode("ascii")
+        created = not os.path.exists(self._path)
+        self._file = open(self._path, "w+b" if created else "r+b")
+        self._map = None
+        self._heap = None
+        try:
+            file_size = os.fstat(self._file.fileno()).st_size
+            if file_size == 0:  # new file
+                self._file.truncate(self.HEADER.size + self.INITIAL_CAPACITY * self._record.size)
+                self._head = self._tail = self._free = self.NULL
+                self._size = self._free_count = self._count = self._heap_end = self._heap_garbage = 0
+                self._map = mmap.mmap(self._file.fileno(), 0)
+                self._store_header()
+            else:
+                fields = None
+                if file_size >= self.HEADER.size:
+                    self._map = mmap.mmap(self._file.fileno(), 0)
+                    fields = self.HEADER.unpack_from(self._map, 0)
+                if fields is None or fields[0] != self.MAGIC or fields[1] != code:
+                    raise ValueError(self._path + " is not a mapped linked list with typecode " +
+                                     repr(self._typecode))
+                (self._head, self._tail, self._size, self._free, self._free_count, self._count,
+                 self._heap_end, self._heap_garbage) = fields[2:]
+            # the heap is only opened once the header is known to match, so a
+            # failed open leaves no stray heap file behind
+            if self._typecode is None:
+                self._heap = open(self._heap_path, "r+b" if os.path.exists(self._heap_path) else "w+b")
+        except BaseException:
+            self.close()
+            if created:
+                os.remove(self._path)
+            raise
+
+    def _store_header(self):
+        """writes the head, tail, size and allocation counts to the header"""
+        code = b" " if self._typecode is None else self._typecode.encode("ascii")
+        self.HEADER.pack_into(self._map, 0, self.MAGIC, code, self._head, self._tail, self._size, self._free,
+                              self._free_count, self._count, self._heap_end, self._heap_garbage)
+
+    def flush(self):
+        """writes the changes to disk"""
+        self._map.flush()
+        if self._heap is not None:
+            self._heap.flush()
+
+    def close(self):
+        """writes the changes to disk and closes the files"""
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+            self._map = None
+        if self._heap is not None:
+            self._heap.close()
+            self._heap = None
+        self._file.close()
+
+    def __enter__(self):
+        """returns the linked list, to use it in a with statement"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """closes the linked list at the end of a with statement"""
+        self.close()
+
+    def __len__(self):
+        """returns the number of nodes in the linked list"""
+        return self._size
+
+    def __iter__(self):
+        """yields the values in the linked list, one record at a time"""
+        current = self._head
+        while current != self.NULL:
+            fields = self._record.unpack_from(self._map, self.HEADER.size + current * self._record.size)
+            yield self._value(fields)
+            current = fields[-1]
+
+    def islice(self, *args):
+        """
+            returns an iterator over part of the linked list, taking the same
+            (stop) or (start, stop[, step]) arguments as itertools.islice
+        """
+        return itertools.islice(iter(self), *args)
+
+    def get_size(self):
+        """returns the number of nodes in the linked list"""
+        return self._size
+
+    def _value(self, fields):
+        """returns the value of a record, given its unpacked fields"""
+        if self._typecode is not None:
+            return fields[0]
+        self._heap.seek(fields[0])
+        return pickle.loads(self._heap.read(fields[1]))
+
+    def _get_next(self, record):
+        """returns the record after record passed in"""
+        return struct.unpack_from("<q", self._map, self.HEADER.size + record * self._record.size +
+                                  self._next_offset)[0]
+
+    def _set_next(self, record, next_record):
+        """sets the record after record passed in"""
+        struct.pack_into("<q", self._map, self.HEADER.size + record * self._record.size + self._next_offset,
+                         next_record)
+
+    def _new_record(self, val, next_record):
+        """stores val in a free record, or a new one, and returns its number"""
+        if self._free != self.NULL:
+            record = self._free
+            self._free = self._get_next(record)
+            self._free_count -= 1
+        else:
+            record = self._count
+            self._count += 1
+            if self.HEADER.size + self._count * self._record.size > len(self._map):
+                self._grow()
+        if self._typecode is None:
+            data = pickle.dumps(val, pickle.HIGHEST_PROTOCOL)
+            self._heap.seek(self._heap_end)
+            self._heap.write(data)
+            fields = (self._heap_end, len(data), next_record)
+            self._heap_end += len(data)
+        else:
+            fields = (val, next_record)
+        self._record.pack_into(self._map, self.HEADER.size + record * self._record.size, *fields)
+        return record
+
+    def _grow(self):
+        """doubles the records the file has room for"""
+        size = len(self._map)
+        self._map.flush()
+        self._map.close()
+        self._file.truncate(self.HEADER.size + 2 * (size - self.HEADER.size))
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    def _free_record(self, record):
+        """puts record passed in on the free list"""
+        if self._typecode is None:
+            self._heap_garbage += self._record.unpack_from(self._map, self.HEADER.size +
+                                                           record * self._record.size)[1]
+        self._set_next(record, self._free)
+        self._free = record
+        self._free_count += 1
+
+    def add(self, val):
+        """adds a new node with val passed in at the end of the linked list"""
+        record = self._new_record(val, self.NULL)
+        if self._head == self.NULL:  # if list is empty, it becomes the head
+            self._head = record
+        else:
+            self._set_next(self._tail, record)
+        self._tail = record
+        self._size += 1
+        self._store_header()
+
+    def extend(self, iterable):
+        """adds the values of iterable at the end of the linked list"""
+        if iterable is self:  # walking the list while adding to it would never end
+            iterable = self.to_plain_list()
+        for val in iterable:
+            self.add(val)
+
+    def remove(self, val):
+        """
+            removes the first occurrence of val, if found
+            compacts the file if enough of it is free
+        """
+        previous = self.NULL
+        current = self._head
+        while current != self.NULL:  # walk till found
+            fields = self._record.unpack_from(self._map, self.HEADER.size + current * self._record.size)
+            if self._value(fields) == val:
+                break
+            previous = current
+            current = fields[-1]
+        if current == self.NULL:
             return
-        print(a_node.get_data(), end=" ")
-        self.rec_display(a_node.get_next())
+        next_record = self._get_next(current)
+        if previous == self.NULL:
+            self._head = next_record
+        else:
+            self._set_next(previous, next_record)
+        if current == self._tail:
+            self._tail = previous
+        self._free_record(current)
+        self._size -= 1
+        self._store_header()
+        if self._count >= self.COMPACT_MIN_RECORDS and (2 * self._free_count >= self._count or
+                                                        2 * self._heap_garbage > self._heap_end):
+            self.compact()
+
+    def contains(self, val):
+        """returns True if val passed in is in linked list, False otherwise"""
+        for data in self:
+            if data == val:
+                return True
+        return False
+
+    def insert(self, val, pos):
+        """
+            inserts val passed in, at position passed in
+            if pos >= list length (or negative), val is placed at the end
+        """
+        if self._head == self.NULL or pos < 0 or pos >= self._size:  # at the end, no need to walk
+            self.add(val)
+            return
+        if pos == 0:
+            self._head = self._new_record(val, self._head)
+        else:
+            previous = self._head
+            for _ in range(pos - 1):  # walk to the record before pos
+                previous = self._get_next(previous)
+            self._set_next(previous, self._new_record(val, self._get_next(previous)))
+        self._size += 1
+        self._store_header()
+
+    def reverse(self):
+        """reverse the order of nodes by rewriting the next offsets"""
+        previous = self.NULL
+        current = self._head
+        self._tail = current
+        while current != self.NULL:
+            next_record = self._get_next(current)
+            self._set_next(current, previous)
+            previous = current
+            current = next_record
+        self._head = previous
+        self._store_header()
+
+    def compact(self):
+        """
+            rewrites the records in list order, with no free records, and
+            the heap with only the values still in the list, then swaps the
+            new files in
+            walking the list afterwards reads the file front to back
+        """
+        new_path = self._path + ".compact"
+        for stale in (new_path, new_path + ".heap"):
+            if os.path.exists(stale):
+                os.remove(stale)
+        compacted = MappedLinkedList(new_path, self._typecode)
+        try:
+            compacted.extend(self)
+            compacted.flush()
+        finally:
+            compacted.close()
+        self.close()
+        os.replace(new_path, self._path)
+        if self._typecode is None:
+            os.replace(new_path + ".heap", self._heap_path)
+        self._open()
+
+    def to_plain_list(self):
+        """returns regular list that has same values, in same order"""
+        return list(self)
 
-    # display taken directly from README
     def display(self):
-        """recursive display helper method"""
-        self.rec_display(self.get_head())
+        """prints the values in the linked list, separated by spaces"""
+        _display_values(self)
 
-    # is_empty taken directly from module
     def is_empty(self):
         """
         Returns True if the linked list is empty, False otherwise
         """
-        return self._head is None
+        return self._head == self.NULL
+
+
+def _struct_code(typecode):
+    """
+        returns the struct code of the same size and kind as array typecode,
+        which struct sizes the same on every platform when used with "<"
+        raises ValueError for typecodes that are not integers or floats
+    """
+    if typecode in ("f", "d"):
+        return typecode
+    if typecode not in ("b", "B", "h", "H", "i", "I", "l", "L", "q", "Q"):
+        raise ValueError("typecode must be an array integer or float typecode, not " + repr(typecode))
+    code = {1: "b", 2: "h", 4: "i", 8: "q"}[array(typecode).itemsize]
+    return code if typecode.islower() else code.upper()
+
+
+def _block_values(block):
+    """yields the values of block and every block after it"""
+    while block is not None:
+        yield from block.get_data()
+        block = block.get_next()
+
+
+def _node_values(node):
+    """yields the data of node and every node after it"""
+    while node is not None:
+        yield node.get_data()
+        node = node.get_next()
+
+
+def _display_values(values):
+    """
+        prints values separated by spaces and followed by a blank line, the
+        same output as print(val, end=" ") for each value then print("\\n"),
+        but written DISPLAY_CHUNK values at a time
+    """
+    out = sys.stdout
+    chunk = []
+    for val in values:
+        chunk.append(str(val))
+        if len(chunk) == DISPLAY_CHUNK:
+            chunk.append("")  # space after the last value of the chunk
+            out.write(" ".join(chunk))
+            chunk = []
+    chunk.append("")
+    out.write(" ".join(chunk) + "\n\n")
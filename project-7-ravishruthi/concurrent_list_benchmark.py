@@ -0,0 +1,253 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: A multithreaded stress test and throughput benchmark for
+#              ConcurrentLinkedList. The stress test runs many threads mixing
+#              every method on one shared list and then checks that no value
+#              was lost or duplicated and that the links are intact. The
+#              benchmark times a producer/consumer mix at growing thread
+#              counts, against a LinkedList behind one global lock.
+#
+#              ConcurrentLinkedList walks without locks and locks only the
+#              nodes it changes, so it costs about the same as the global
+#              lock on one thread. On a CPython build with the GIL, only one
+#              thread runs Python code at a time, so neither list gets faster
+#              with more threads; only a free-threaded build can show
+#              ConcurrentLinkedList scaling. After its table, the benchmark
+#              prints how the two compare and whether either one scaled.
+#
+
+import argparse
+import random
+import sys
+import threading
+import time
+
+from LinkedList import LinkedList, ConcurrentLinkedList
+
+
+class GlobalLockList:
+    """A LinkedList with one lock around every method, the baseline for the benchmark."""
+    def __init__(self):
+        self._list = LinkedList()
+        self._lock = threading.Lock()
+
+    def add(self, val):
+        """adds val at the end of the list."""
+        with self._lock:
+            self._list.add(val)
+
+    def remove(self, val):
+        """removes the first occurrence of val, if found."""
+        with self._lock:
+            self._list.remove(val)
+
+    def contains(self, val):
+        """returns True if val is in the list."""
+        with self._lock:
+            return self._list.contains(val)
+
+    def insert(self, val, pos):
+        """inserts val at pos."""
+        with self._lock:
+            self._list.insert(val, pos)
+
+    def to_plain_list(self):
+        """returns the values as a regular list."""
+        with self._lock:
+            return self._list.to_plain_list()
+
+
+# name, list class
+STRUCTURES = [
+    ("global lock", GlobalLockList),
+    ("concurrent", ConcurrentLinkedList),
+]
+
+
+def _run_threads(count, target):
+    """Runs target(thread number) on count threads, started together, and returns the elapsed seconds."""
+    barrier = threading.Barrier(count + 1)
+    errors = []
+
+    def worker(number):
+        barrier.wait()
+        try:
+            target(number)
+        except BaseException as error:  # reported by the main thread
+            errors.append(error)
+
+    threads = [threading.Thread(target=worker, args=(number,)) for number in range(count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+    return elapsed
+
+
+def check_links(linked_list):
+    """
+        Checks the nodes of a ConcurrentLinkedList that no thread is using:
+        the walk from the head ends, reaches no removed node, ends at the
+        tail and counts the size.
+    :raises RuntimeError: if it does not
+    """
+    count = 0
+    last = None
+    current = linked_list.get_head()
+    while current is not None:
+        if current.is_removed():
+            raise RuntimeError("removed node still linked at position " + str(count))
+        count += 1
+        if count > linked_list.get_size():
+            raise RuntimeError("more nodes linked than the size of " + str(linked_list.get_size()))
+        last = current
+        current = current.get_next()
+    if count != linked_list.get_size():
+        raise RuntimeError(str(count) + " nodes linked, but the size is " + str(linked_list.get_size()))
+    if last is not linked_list.get_tail():
+        raise RuntimeError("the tail is not the last node")
+
+
+def stress(threads=8, operations=2000, seed=0):
+    """
+        Runs threads threads that each make operations random calls on one
+        shared ConcurrentLinkedList: add, insert, remove, contains,
+        to_plain_list and, on thread 0, reverse. Each thread only removes
+        values it added itself, so the values left at the end are known.
+    :raises RuntimeError: if a value is lost or duplicated, contains misses a
+        value, or the links are broken
+    """
+    linked_list = ConcurrentLinkedList()
+    kept = [[] for _ in range(threads)]
+
+    def work(number):
+        rng = random.Random(seed * 1000 + number)
+        mine = kept[number]
+        for step in range(operations):
+            val = (number, step)
+            choice = rng.random()
+            if choice < 0.3:
+                linked_list.add(val)
+                mine.append(val)
+            elif choice < 0.5:
+                linked_list.insert(val, rng.randrange(-1, len(linked_list) + 2))
+                mine.append(val)
+            elif choice < 0.75 and mine:
+                linked_list.remove(mine.pop(rng.randrange(len(mine))))
+            elif choice < 0.9 and mine:
+                if not linked_list.contains(rng.choice(mine)):
+                    raise RuntimeError("contains missed a value of thread " + str(number))
+            elif choice < 0.99 or number != 0:
+                linked_list.to_plain_list()
+            else:
+                linked_list.reverse()
+
+    # switch threads far more often than usual, to interleave more
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        _run_threads(threads, work)
+    finally:
+        sys.setswitchinterval(interval)
+
+    check_links(linked_list)
+    expected = sorted(val for mine in kept for val in mine)
+    if sorted(linked_list.to_plain_list()) != expected:
+        raise RuntimeError("the values left do not match the values added and not removed")
+
+
+def throughput(structure, threads, operations, initial):
+    """
+        Times a producer/consumer mix on one shared list: every thread adds
+        values at the end and removes the values it added first, and some
+        calls are contains or insert near the front.
+    :param structure: list class, see STRUCTURES
+    :param operations: calls made by each thread
+    :param initial: values in the list before the threads start
+    :return: calls per second, over all threads
+    """
+    linked_list = structure()
+    for val in range(initial):
+        linked_list.add(val)
+
+    def work(number):
+        rng = random.Random(number)
+        pending = []
+        for step in range(operations):
+            choice = rng.random()
+            if choice < 0.4 or not pending:
+                val = (number, step)
+                linked_list.add(val)
+                pending.append(val)
+            elif choice < 0.8:
+                linked_list.remove(pending.pop(0))
+            elif choice < 0.9:
+                linked_list.contains(rng.randrange(initial))
+            else:
+                val = (number, step)
+                linked_list.insert(val, rng.randrange(initial // 4 + 1))
+                pending.append(val)
+
+    return threads * operations / _run_threads(threads, work)
+
+
+def main():
+    """Runs the stress test, then prints the throughput at every thread count."""
+    parser = argparse.ArgumentParser(description="Stress test and throughput of ConcurrentLinkedList.")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8], help="thread counts to time")
+    parser.add_argument("--operations", type=int, default=2000, help="calls made by each thread")
+    parser.add_argument("--initial", type=int, default=200, help="values in the list before timing")
+    parser.add_argument("--stress-rounds", type=int, default=5, help="stress test runs, 0 to skip")
+    args = parser.parse_args()
+
+    for round_number in range(args.stress_rounds):
+        stress(max(args.threads), args.operations, seed=round_number)
+    if args.stress_rounds:
+        print("stress test passed %d rounds with %d threads" % (args.stress_rounds, max(args.threads)))
+
+    print("%-16s %8s %14s" % ("list", "threads", "calls/s"))
+    rates = {}
+    for name, structure in STRUCTURES:
+        for count in args.threads:
+            rates[name, count] = throughput(structure, count, args.operations, args.initial)
+            print("%-16s %8d %14.0f" % (name, count, rates[name, count]))
+    print()
+    for line in summarize(rates, args.threads):
+        print(line)
+
+
+def summarize(rates, thread_counts):
+    """
+        Returns lines saying, at every thread count, how the throughput of
+        ConcurrentLinkedList compares to the global lock, and whether the
+        throughput of either list grew with the thread count.
+    :param rates: dict of (list name, threads) to calls per second
+    """
+    lines = []
+    for count in thread_counts:
+        ratio = rates["concurrent", count] / rates["global lock", count]
+        lines.append("%d threads: ConcurrentLinkedList runs at %.2fx the global lock" % (count, ratio))
+    fewest = min(thread_counts)
+    most = max(thread_counts)
+    if most == fewest:
+        return lines
+    scaled = False
+    for name, structure in STRUCTURES:
+        speedup = rates[name, most] / rates[name, fewest]
+        scaled = scaled or (name == "concurrent" and speedup > 1)
+        lines.append("%s: %.2fx the throughput of %d threads with %d threads" % (name, speedup, fewest, most))
+    if getattr(sys, "_is_gil_enabled", lambda: True)():
+        lines.append("this Python has the GIL, which runs one thread at a time, so no list here can scale "
+                     "with threads; ConcurrentLinkedList only scales on a free-threaded build")
+    elif not scaled:
+        lines.append("ConcurrentLinkedList did not scale with threads on this machine")
+    return lines
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Measures the memory per element and the traversal speed of the
+#              node layouts in LinkedList.py against the original layout, whose
+#              nodes kept their data and next link in a per-node __dict__.
+#              With --crossover, it instead times insert and read at random
+#              positions in LinkedList and IndexableSkipList, to find the list
+#              length from which the skip list is faster.
+#
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from LinkedList import LinkedList, UnrolledLinkedList, IndexableSkipList
+
+
+class DictNode:
+    """The original Node layout, kept here as the baseline."""
+    def __init__(self, data):
+        self._data = data
+        self._next = None
+
+    def get_data(self):
+        """returns the data."""
+        return self._data
+
+    def get_next(self):
+        """returns the next node."""
+        return self._next
+
+    def set_next(self, a_node):
+        """sets next to the node passed in."""
+        self._next = a_node
+
+
+def build_dict_nodes(values):
+    """Links values into DictNodes and returns the head node."""
+    head = None
+    for val in reversed(values):
+        node = DictNode(val)
+        node.set_next(head)
+        head = node
+    return head
+
+
+def build_linked_list(values):
+    """Returns a LinkedList of values."""
+    linked_list = LinkedList()
+    for val in values:
+        linked_list.add(val)
+    return linked_list
+
+
+def build_unrolled(values, typecode=None):
+    """Returns an UnrolledLinkedList of values."""
+    linked_list = UnrolledLinkedList(typecode=typecode)
+    for val in values:
+        linked_list.add(val)
+    return linked_list
+
+
+def walk_nodes(head):
+    """Reads every value by following get_next from head."""
+    total = 0
+    node = head
+    while node is not None:
+        node.get_data()
+        total += 1
+        node = node.get_next()
+    return total
+
+
+def walk_blocks(head):
+    """Reads every value of an unrolled list, block by block."""
+    total = 0
+    block = head
+    while block is not None:
+        for val in block.get_data():
+            total += 1
+        block = block.get_next()
+    return total
+
+
+# name, builder, walk over the head node or block
+LAYOUTS = [
+    ("dict nodes (original)", build_dict_nodes, lambda built: walk_nodes(built)),
+    ("slotted nodes", build_linked_list, lambda built: walk_nodes(built.get_head())),
+    ("unrolled, list blocks", build_unrolled, lambda built: walk_blocks(built.get_head())),
+    ("unrolled, array('q') blocks", lambda values: build_unrolled(values, "q"),
+     lambda built: walk_blocks(built.get_head())),
+]
+
+
+def bytes_per_element(build, values):
+    """
+        Returns the bytes allocated while building the structure, divided by
+        the number of values. The values themselves exist beforehand and are
+        not counted.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        built = build(values)
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del built
+    return used / len(values)
+
+
+def best_time(func, repeat=5):
+    """Returns the fastest of repeat runs of func, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+# list lengths timed by --crossover
+CROSSOVER_SIZES = [4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096, 16384]
+
+
+def read_linked_list(linked_list, pos):
+    """Reads the value at pos of a LinkedList, which has no positional read, by walking to it."""
+    return next(linked_list.islice(pos, None))
+
+
+def read_skip_list(skip_list, pos):
+    """Reads the value at pos of an IndexableSkipList."""
+    return skip_list[pos]
+
+
+def undo_linked_list(linked_list, val, pos):
+    """Removes the value inserted at pos of a LinkedList, which walks to it like insert did."""
+    linked_list.remove(val)
+
+
+def undo_skip_list(skip_list, val, pos):
+    """Deletes the value inserted at pos of an IndexableSkipList by position."""
+    del skip_list[pos]
+
+
+# name, builder, positional read, removal of an inserted value
+POSITIONAL = [
+    ("LinkedList", LinkedList.from_iterable, read_linked_list, undo_linked_list),
+    ("IndexableSkipList", lambda values: IndexableSkipList.from_iterable(values, seed=1), read_skip_list,
+     undo_skip_list),
+]
+
+
+def positional_times(size, operations):
+    """
+        Times operations inserts and reads at random positions in lists of
+        size values, the same positions for every structure. Every insert is
+        undone and timed with it, so the length stays at size.
+    :return: dict of name to (insert and remove ns per op, read ns per op)
+    """
+    rng = random.Random(size)
+    positions = [rng.randrange(size) for _ in range(operations)]
+    values = list(range(size))
+    times = {}
+    for name, build, read, undo in POSITIONAL:
+        built = build(values)
+
+        def inserts():
+            for pos in positions:
+                built.insert(-1, pos)
+                undo(built, -1, pos)
+
+        def reads():
+            for pos in positions:
+                read(built, pos)
+
+        times[name] = (best_time(inserts) / operations * 1e9, best_time(reads) / operations * 1e9)
+    return times
+
+
+def crossover(operations):
+    """
+        Prints insert and read times at every length in CROSSOVER_SIZES and
+        the length from which IndexableSkipList beats LinkedList at every
+        longer length timed.
+    """
+    print("%8s %18s %18s %14s %14s" % ("length", "list ins+del ns", "skip ins+del ns", "list read ns",
+                                       "skip read ns"))
+    first_faster = {"insert and delete": None, "read": None}
+    for size in CROSSOVER_SIZES:
+        times = positional_times(size, operations)
+        linked, skip = times["LinkedList"], times["IndexableSkipList"]
+        print("%8d %18.0f %18.0f %14.0f %14.0f" % (size, linked[0], skip[0], linked[1], skip[1]))
+        for column, kind in enumerate(first_faster):
+            if skip[column] >= linked[column]:
+                first_faster[kind] = None
+            elif first_faster[kind] is None:
+                first_faster[kind] = size
+    for kind, size in first_faster.items():
+        if size is None:
+            print("skip list %s is not faster at the longest length timed" % kind)
+        else:
+            print("skip list %s is faster from length %d" % (kind, size))
+
+
+def main():
+    """Prints bytes per element and traversal times for every layout."""
+    parser = argparse.ArgumentParser(description="Memory and traversal speed of LinkedList layouts.")
+    parser.add_argument("--size", type=int, default=200000, help="number of elements")
+    parser.add_argument("--crossover", action="store_true",
+                        help="time positional insert and read in LinkedList and IndexableSkipList instead")
+    parser.add_argument("--operations", type=int, default=500, help="operations timed per length by --crossover")
+    args = parser.parse_args()
+
+    if args.crossover:
+        crossover(args.operations)
+        return
+    values = list(range(1000, 1000 + args.size))
+    print("%-30s %12s %14s" % ("layout", "bytes/elem", "walk ns/elem"))
+    for name, build, walk in LAYOUTS:
+        per_element = bytes_per_element(build, values)
+        built = build(values)
+        seconds = best_time(lambda: walk(built))
+        print("%-30s %12.1f %14.1f" % (name, per_element, seconds / args.size * 1e9))
+
+
+if __name__ == "__main__":
+    main()
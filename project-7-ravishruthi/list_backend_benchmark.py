@@ -0,0 +1,260 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: A benchmark of the LinkedList.py lists against the built-in
+#              list and collections.deque. It times add, insert at the head,
+#              middle and tail, remove, contains, reverse and to_plain_list at
+#              sizes from 10**2 up to 10**7, measures the memory used to build
+#              each list and the peak memory of each operation, and writes the
+#              results as JSON so that two runs can be compared.
+#
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+from LinkedList import LinkedList, UnrolledLinkedList, IndexedLinkedList, IndexableSkipList
+
+OPERATIONS = ("add", "insert_head", "insert_middle", "insert_tail", "remove", "contains", "reverse",
+              "to_plain_list")
+
+# Every operation is a function of (list, size it was built with, call
+# number). Inserted values are call numbers, which stay below the values
+# that remove looks for, from the middle of the list up.
+LINKED_OPERATIONS = {
+    "add": lambda built, size, call: built.add(call),
+    "insert_head": lambda built, size, call: built.insert(call, 0),
+    "insert_middle": lambda built, size, call: built.insert(call, size // 2),
+    "insert_tail": lambda built, size, call: built.insert(call, len(built)),
+    "remove": lambda built, size, call: built.remove(size // 2 + call),
+    "contains": lambda built, size, call: built.contains(-1),
+    "reverse": lambda built, size, call: built.reverse(),
+    "to_plain_list": lambda built, size, call: built.to_plain_list(),
+}
+
+PLAIN_OPERATIONS = {
+    "add": lambda built, size, call: built.append(call),
+    "insert_head": lambda built, size, call: built.insert(0, call),
+    "insert_middle": lambda built, size, call: built.insert(size // 2, call),
+    "insert_tail": lambda built, size, call: built.insert(len(built), call),
+    "remove": lambda built, size, call: built.remove(size // 2 + call),
+    "contains": lambda built, size, call: -1 in built,
+    "reverse": lambda built, size, call: built.reverse(),
+    "to_plain_list": lambda built, size, call: list(built),
+}
+
+# name, builder from a list of values, operations
+BACKENDS = {
+    "list": (list, PLAIN_OPERATIONS),
+    "deque": (deque, PLAIN_OPERATIONS),
+    "LinkedList": (LinkedList.from_iterable, LINKED_OPERATIONS),
+    "UnrolledLinkedList": (UnrolledLinkedList.from_iterable, LINKED_OPERATIONS),
+    "IndexedLinkedList": (IndexedLinkedList.from_iterable, LINKED_OPERATIONS),
+    "IndexableSkipList": (lambda values: IndexableSkipList.from_iterable(values, seed=1), LINKED_OPERATIONS),
+}
+
+
+def _calls_for(single_ns, size, target_ns):
+    """
+        Returns how many calls to time together: enough to take about
+        target_ns, but no more than a tenth of size, so the list does not
+        drift far from size while it is timed.
+    """
+    return int(max(1, min(size // 10, target_ns // max(single_ns, 1))))
+
+
+def _peak_bytes(func):
+    """Returns the peak bytes allocated by one call of func, as measured by tracemalloc."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak - base
+
+
+def measure_build(build, values, with_memory):
+    """
+        Times building a list from values and, if with_memory, measures the
+        bytes it keeps and the peak while building.
+    :return: (built list, dict of results)
+    """
+    gc.collect()
+    start = time.perf_counter_ns()
+    built = build(values)
+    result = {"ns": time.perf_counter_ns() - start}
+    if with_memory:
+        del built
+        gc.collect()
+        tracemalloc.start()
+        try:
+            base = tracemalloc.get_traced_memory()[0]
+            built = build(values)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result["bytes"] = current - base
+        result["bytes_per_element"] = round((current - base) / len(values), 1)
+        result["peak_bytes"] = peak - base
+    return built, result
+
+
+def measure_operation(build, operation, values, rounds, target_ns, with_memory):
+    """
+        Times an operation on lists built from values. Every round builds a
+        new list, which is not timed, calls the operation once to calibrate,
+        then times a block of calls.
+    :return: dict of results, with the best and median ns per call over the
+        rounds
+    """
+    size = len(values)
+    per_call = []
+    calls = 1
+    clock = time.perf_counter_ns
+    for _ in range(rounds):
+        built = build(values)
+        start = clock()
+        operation(built, size, 0)
+        calls = _calls_for(clock() - start, size, target_ns)
+        gc.disable()
+        try:
+            start = clock()
+            for call in range(1, calls + 1):
+                operation(built, size, call)
+            elapsed = clock() - start
+        finally:
+            gc.enable()
+        per_call.append(elapsed / calls)
+    per_call.sort()
+    result = {"calls": calls, "rounds": rounds, "best_ns": round(per_call[0], 1),
+              "median_ns": round(per_call[len(per_call) // 2], 1)}
+    if with_memory:
+        built = build(values)
+        result["peak_bytes"] = _peak_bytes(lambda: operation(built, size, 0))
+    return result
+
+
+def run(backends=None, max_exponent=6, rounds=5, target_ms=20, time_limit=2.0, memory_max_size=10 ** 6):
+    """
+        Runs the benchmark at sizes 10**2 to 10**max_exponent.
+    :param backends: names in BACKENDS to run, all of them if None
+    :param rounds: rounds per operation, fewer for large lists so that a
+        round covers about 5 million elements in all
+    :param target_ms: time of one block of timed calls
+    :param time_limit: an operation whose single call, times 10, would take
+        longer than this many seconds is skipped at the next size, and
+        larger sizes are skipped once building a list takes longer than this
+    :param memory_max_size: largest size measured with tracemalloc, which
+        is slow and needs memory of its own for every allocation
+    :return: the results as a dict that can be written as JSON
+    """
+    if backends is None:
+        backends = list(BACKENDS)
+    sizes = [10 ** exponent for exponent in range(2, max_exponent + 1)]
+    results = {
+        "python": platform.python_implementation() + " " + platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": sizes,
+        "backends": {},
+    }
+    for name in backends:
+        build, operations = BACKENDS[name]
+        backend_results = results["backends"][name] = {}
+        last_single_ns = {}
+        build_too_slow = False
+        for size in sizes:
+            if build_too_slow:
+                backend_results[str(size)] = {"skipped": "build over the time limit at a smaller size"}
+                continue
+            values = list(range(size))
+            with_memory = size <= memory_max_size
+            built, build_result = measure_build(build, values, with_memory)
+            del built
+            size_results = backend_results[str(size)] = {"build": build_result, "operations": {}}
+            for op_name in OPERATIONS:
+                if last_single_ns.get(op_name, 0) * 10 > time_limit * 1e9:
+                    size_results["operations"][op_name] = {"skipped": "over the time limit at a smaller size"}
+                    continue
+                op_rounds = max(1, min(rounds, 5 * 10 ** 6 // size))
+                op_result = measure_operation(build, operations[op_name], values, op_rounds, target_ms * 10 ** 6,
+                                              with_memory)
+                last_single_ns[op_name] = op_result["median_ns"]
+                size_results["operations"][op_name] = op_result
+            build_too_slow = build_result["ns"] > time_limit * 1e9
+            print(name + " " + str(size) + " done", file=sys.stderr)
+    return results
+
+
+def compare(old, new, threshold=0.25):
+    """
+        Compares the median time per call of every operation in two runs.
+    :param threshold: a ratio above 1 + threshold counts as a regression
+    :return: (list of report lines, number of regressions)
+    """
+    lines = []
+    regressions = 0
+    for name, backend_results in new["backends"].items():
+        for size, size_results in backend_results.items():
+            old_size = old["backends"].get(name, {}).get(size, {})
+            for op_name, op_result in size_results.get("operations", {}).items():
+                old_result = old_size.get("operations", {}).get(op_name, {})
+                if "median_ns" not in op_result or "median_ns" not in old_result:
+                    continue
+                before = old_result["median_ns"]
+                after = op_result["median_ns"]
+                ratio = after / before if before else float("inf")
+                flag = ""
+                if ratio > 1 + threshold:
+                    flag = "  REGRESSION"
+                    regressions += 1
+                lines.append("%-18s %9s %-13s %12.1f -> %12.1f  x%.2f%s" % (name, size, op_name, before, after,
+                                                                            ratio, flag))
+    return lines, regressions
+
+
+def main():
+    """Runs the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="LinkedList.py lists against list and deque.")
+    parser.add_argument("--backend", action="append", choices=sorted(BACKENDS),
+                        help="list to run, may be given more than once (default: all)")
+    parser.add_argument("--max-exponent", type=int, default=6, choices=range(2, 8),
+                        help="largest size is 10 to this power (7 needs several GB of memory)")
+    parser.add_argument("--rounds", type=int, default=5, help="rounds per operation at small sizes")
+    parser.add_argument("--target-ms", type=float, default=20, help="time of one block of timed calls")
+    parser.add_argument("--time-limit", type=float, default=2.0,
+                        help="seconds a call may be expected to take before larger sizes are skipped")
+    parser.add_argument("--memory-max-size", type=int, default=10 ** 6,
+                        help="largest size whose memory is measured")
+    parser.add_argument("--output", help="file to write the JSON results to (default: standard output)")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="slowdown ratio above 1 that --compare reports as a regression")
+    args = parser.parse_args()
+
+    results = run(args.backend, args.max_exponent, args.rounds, args.target_ms, args.time_limit,
+                  args.memory_max_size)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as out:
+            out.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare) as old_file:
+            old = json.load(old_file)
+        lines, regressions = compare(old, results, args.threshold)
+        for line in lines:
+            print(line, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Tests of ConcurrentLinkedList, on one thread against a Python
+#              list model and on many threads with the stress test of
+#              concurrent_list_benchmark.py.
+#
+
+import random
+import threading
+
+import pytest
+
+from LinkedList import ConcurrentLinkedList
+from concurrent_list_benchmark import check_links, stress, summarize
+from test_linked_list import run_random_calls
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_a_list_on_one_thread(seed):
+    rng = random.Random(seed)
+    run_random_calls(ConcurrentLinkedList(), [], rng, 300, list(range(5)), check_links)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_stress(seed):
+    stress(threads=6, operations=800, seed=seed)
+
+
+def test_producers_and_consumers():
+    linked_list = ConcurrentLinkedList()
+    count = 2000
+    taken = []
+
+    def produce(number):
+        for val in range(count):
+            linked_list.add((number, val))
+
+    def consume(number):
+        # a value is removed only once it can be seen in the list
+        val = 0
+        while val < count:
+            if linked_list.contains((number, val)):
+                linked_list.remove((number, val))
+                taken.append((number, val))
+                val += 1
+
+    threads = [threading.Thread(target=produce, args=(number,)) for number in range(3)]
+    threads += [threading.Thread(target=consume, args=(number,)) for number in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert linked_list.is_empty()
+    assert len(linked_list) == 0
+    assert sorted(taken) == [(number, val) for number in range(3) for val in range(count)]
+    check_links(linked_list)
+
+
+def test_contains_finds_a_value_kept_through_reversals():
+    linked_list = ConcurrentLinkedList.from_iterable(range(500))
+    misses = []
+    done = threading.Event()
+
+    def reverse():
+        for _ in range(200):
+            linked_list.reverse()
+        done.set()
+
+    def look():
+        while not done.is_set():
+            if not linked_list.contains(250):
+                misses.append(1)
+
+    threads = [threading.Thread(target=reverse), threading.Thread(target=look)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not misses
+    assert sorted(linked_list.to_plain_list()) == list(range(500))
+    check_links(linked_list)
+
+
+def test_remove_releases_its_locks_when_comparing_raises():
+    class Unequal:
+        def __eq__(self, other):
+            raise RuntimeError("no comparing")
+
+    linked_list = ConcurrentLinkedList.from_iterable([1, Unequal(), 3])
+    with pytest.raises(RuntimeError):
+        linked_list.remove(3)
+    node = linked_list.get_head()
+    while node is not None:
+        assert not node.get_lock().locked()
+        node = node.get_next()
+    linked_list.add(4)
+    assert len(linked_list) == 4
+
+
+def test_summarize_reports_each_thread_count():
+    rates = {("global lock", 1): 100.0, ("global lock", 4): 100.0,
+             ("concurrent", 1): 90.0, ("concurrent", 4): 180.0}
+    lines = summarize(rates, [1, 4])
+    assert lines[0] == "1 threads: ConcurrentLinkedList runs at 0.90x the global lock"
+    assert lines[1] == "4 threads: ConcurrentLinkedList runs at 1.80x the global lock"
+    assert "concurrent: 2.00x the throughput of 1 threads with 4 threads" in lines
@@ -0,0 +1,462 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Tests of the LinkedList.py lists against a regular Python list
+#              used as a model: random add, remove, insert, contains and
+#              reverse calls must leave both holding the same values.
+#
+
+import random
+import sys
+
+import pytest
+
+import LinkedList as linked_list_module
+from LinkedList import LinkedList, Node, UnrolledLinkedList, IndexedLinkedList, DoubleNode, IndexableSkipList, \
+    PersistentLinkedList
+
+
+def model_insert(model, val, pos):
+    """inserts val into a Python list the way LinkedList.insert does"""
+    if pos < 0 or pos >= len(model):
+        model.append(val)
+    else:
+        model.insert(pos, val)
+
+
+def model_remove(model, val):
+    """removes the first val from a Python list, if found, like LinkedList.remove"""
+    if val in model:
+        model.remove(val)
+
+
+def run_random_calls(linked_list, model, rng, steps, values, check=None):
+    """
+        makes steps random calls on linked_list and the same changes to
+        model, checking the values after every call
+        check, if given, is called with the linked list after every call
+    """
+    for _ in range(steps):
+        choice = rng.random()
+        val = rng.choice(values)
+        if choice < 0.3:
+            linked_list.add(val)
+            model.append(val)
+        elif choice < 0.5:
+            pos = rng.randrange(-2, len(model) + 3)
+            linked_list.insert(val, pos)
+            model_insert(model, val, pos)
+        elif choice < 0.75:
+            linked_list.remove(val)
+            model_remove(model, val)
+        elif choice < 0.95:
+            assert linked_list.contains(val) == (val in model)
+        else:
+            linked_list.reverse()
+            model.reverse()
+        assert linked_list.to_plain_list() == model
+        if check is not None:
+            check(linked_list)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_linked_list_matches_a_list(seed):
+    rng = random.Random(seed)
+    run_random_calls(LinkedList(), [], rng, 300, list(range(8)))
+
+
+def test_operations_run_past_the_recursion_limit():
+    size = sys.getrecursionlimit() * 20
+    linked_list = LinkedList()
+    for val in range(size):
+        linked_list.add(val)
+    linked_list.insert(-1, size - 1)
+    assert linked_list.contains(size - 1)
+    assert not linked_list.contains(-2)
+    linked_list.remove(size - 1)
+    linked_list.reverse()
+    values = linked_list.to_plain_list()
+    assert len(values) == size
+    assert values[:2] == [-1, size - 2]
+    assert values[-1] == 0
+
+
+def test_empty_list():
+    linked_list = LinkedList()
+    assert linked_list.is_empty()
+    assert linked_list.get_head() is None
+    linked_list.remove(1)
+    linked_list.reverse()
+    assert linked_list.to_plain_list() == []
+    linked_list.insert(1, 5)
+    assert linked_list.to_plain_list() == [1]
+    assert not linked_list.is_empty()
+
+
+def check_tail_and_size(linked_list):
+    """checks that get_tail is the last node and len and get_size count the nodes"""
+    count = 0
+    last = None
+    current = linked_list.get_head()
+    while current is not None:
+        count += 1
+        last = current
+        current = current.get_next()
+    assert linked_list.get_tail() is last
+    assert len(linked_list) == linked_list.get_size() == count
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_tail_and_size_stay_right(seed):
+    rng = random.Random(seed)
+    run_random_calls(LinkedList(), [], rng, 300, list(range(5)), check_tail_and_size)
+
+
+def test_add_links_after_the_tail():
+    linked_list = LinkedList()
+    linked_list.add(1)
+    assert linked_list.get_head() is linked_list.get_tail()
+    linked_list.add(2)
+    assert linked_list.get_head().get_next() is linked_list.get_tail()
+    assert linked_list.get_tail().get_data() == 2
+    linked_list.remove(2)
+    assert linked_list.get_tail() is linked_list.get_head()
+    linked_list.remove(1)
+    assert linked_list.get_tail() is None
+    assert len(linked_list) == 0
+
+
+def test_nodes_have_no_instance_dict():
+    assert not hasattr(Node(1), "__dict__")
+
+
+def check_blocks(linked_list):
+    """checks that no block is empty or over block_size and that tail and size are right"""
+    count = 0
+    last = None
+    current = linked_list.get_head()
+    while current is not None:
+        assert 0 < len(current.get_data()) <= linked_list._block_size
+        count += len(current.get_data())
+        last = current
+        current = current.get_next()
+    assert linked_list.get_tail() is last
+    assert len(linked_list) == count
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 8])
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_unrolled_linked_list_matches_a_list(block_size, typecode):
+    rng = random.Random(block_size)
+    run_random_calls(UnrolledLinkedList(block_size, typecode), [], rng, 400, list(range(6)), check_blocks)
+
+
+def test_unrolled_linked_list_packs_typed_values():
+    linked_list = UnrolledLinkedList(4, "d")
+    for val in range(10):
+        linked_list.add(val / 2)
+    assert linked_list.get_head().get_data().typecode == "d"
+    assert linked_list.to_plain_list() == [val / 2 for val in range(10)]
+    with pytest.raises(TypeError):
+        linked_list.add("x")
+
+
+ISLICE_ARGS = [(0,), (5,), (100,), (3, 11), (7, None), (2, 30, 3), (0, None, 4), (40, 50), (35, None, 2)]
+
+
+@pytest.mark.parametrize("block_size", [None, 1, 4])
+def test_iteration_and_islice(block_size):
+    values = list(range(37))
+    if block_size is None:
+        linked_list = LinkedList.from_iterable(values)
+    else:
+        linked_list = UnrolledLinkedList.from_iterable(values, block_size)
+    assert list(linked_list) == values
+    for args in ISLICE_ARGS:
+        assert list(linked_list.islice(*args)) == values[slice(*args)]
+
+
+def test_iteration_is_lazy():
+    linked_list = LinkedList.from_iterable(range(5))
+    values = iter(linked_list)
+    assert next(values) == 0
+    linked_list.add(5)
+    assert list(values) == [1, 2, 3, 4, 5]
+
+
+def test_unrolled_islice_rejects_negative_arguments():
+    linked_list = UnrolledLinkedList.from_iterable(range(10), 4)
+    with pytest.raises(ValueError):
+        linked_list.islice(-1, 5)
+
+
+@pytest.mark.parametrize("count", [0, 1, 5, 11])
+def test_display_matches_one_print_per_value(count, capsys, monkeypatch):
+    monkeypatch.setattr(linked_list_module, "DISPLAY_CHUNK", 4)
+    LinkedList.from_iterable(range(count)).display()
+    shown = capsys.readouterr().out
+    for val in range(count):
+        print(val, end=" ")
+    print("\n")
+    assert shown == capsys.readouterr().out
+
+
+def check_index(linked_list):
+    """
+        checks the prev links of an IndexedLinkedList and that its index holds
+        exactly the nodes of every hashable value, in list order
+    """
+    check_tail_and_size(linked_list)
+    expected = {}
+    unhashable = 0
+    previous = None
+    current = linked_list.get_head()
+    while current is not None:
+        assert current.get_prev() is previous
+        try:
+            expected.setdefault(current.get_data(), []).append(current)
+        except TypeError:
+            unhashable += 1
+        previous = current
+        current = current.get_next()
+    assert linked_list._unindexed == unhashable
+    index = {}
+    for val, entry in linked_list._index.items():
+        if isinstance(entry, DoubleNode):
+            index[val] = [entry]
+        else:
+            assert len(entry) > 1
+            index[val] = list(entry)
+    assert index.keys() == expected.keys()
+    for val, nodes in expected.items():
+        assert [id(node) for node in index[val]] == [id(node) for node in nodes]
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_indexed_linked_list_matches_a_list(seed):
+    rng = random.Random(seed)
+    run_random_calls(IndexedLinkedList(), [], rng, 400, list(range(4)) + ["a", (1, 2)], check_index)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_indexed_linked_list_with_unhashable_values(seed):
+    rng = random.Random(seed)
+    # [1] == 1 is False, so the scan and the index must agree on what matches
+    run_random_calls(IndexedLinkedList(), [], rng, 400, [0, 1, 2, [1], [2], {"a": 1}], check_index)
+
+
+def test_indexed_remove_takes_the_first_of_equal_values():
+    linked_list = IndexedLinkedList.from_iterable([1, 2, 1, 3, 1])
+    first = linked_list.get_head()
+    linked_list.remove(1)
+    assert linked_list.to_plain_list() == [2, 1, 3, 1]
+    assert linked_list.get_head() is first.get_next()
+    linked_list.insert(1, 0)
+    linked_list.remove(1)
+    assert linked_list.to_plain_list() == [2, 1, 3, 1]
+    check_index(linked_list)
+
+
+def test_indexed_equal_values_compare_like_the_list():
+    linked_list = IndexedLinkedList.from_iterable([1.0, True, 2])
+    assert linked_list.contains(1)
+    linked_list.remove(1)
+    assert linked_list.to_plain_list() == [True, 2]
+    check_index(linked_list)
+
+
+# list class, check of its structure
+BULK_LISTS = [
+    (LinkedList, check_tail_and_size),
+    (IndexedLinkedList, check_index),
+    (lambda: UnrolledLinkedList(3), check_blocks),
+]
+
+
+@pytest.mark.parametrize("make, check", BULK_LISTS)
+def test_extend_and_from_iterable(make, check):
+    linked_list = make()
+    linked_list.extend([])
+    linked_list.extend(range(5))
+    linked_list.extend(iter([5, 6]))
+    linked_list.extend(linked_list)
+    assert linked_list.to_plain_list() == [0, 1, 2, 3, 4, 5, 6] * 2
+    check(linked_list)
+    assert type(linked_list).from_iterable(range(4)).to_plain_list() == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("make, check", BULK_LISTS)
+@pytest.mark.parametrize("seed", range(4))
+def test_remove_if_and_remove_all_match_a_list(make, check, seed):
+    rng = random.Random(seed)
+    for _ in range(30):
+        model = [rng.randrange(5) for _ in range(rng.randrange(20))]
+        linked_list = make()
+        linked_list.extend(model)
+        val = rng.randrange(5)
+        assert linked_list.remove_all(val) == model.count(val)
+        model = [data for data in model if data != val]
+        assert linked_list.to_plain_list() == model
+        check(linked_list)
+        odd = linked_list.remove_if(lambda data: data % 2 == 1)
+        assert odd == sum(data % 2 for data in model)
+        assert linked_list.to_plain_list() == [data for data in model if data % 2 == 0]
+        check(linked_list)
+
+
+@pytest.mark.parametrize("make, check", BULK_LISTS)
+def test_extend_keeps_the_list_right_when_the_iterable_raises(make, check):
+    def values():
+        yield 1
+        yield 2
+        raise KeyError("stop")
+
+    linked_list = make()
+    linked_list.add(0)
+    with pytest.raises(KeyError):
+        linked_list.extend(values())
+    assert linked_list.to_plain_list() == [0, 1, 2]
+    check(linked_list)
+
+
+@pytest.mark.parametrize("make, check", BULK_LISTS[:2])
+def test_remove_if_keeps_the_list_right_when_the_predicate_raises(make, check):
+    def predicate(data):
+        if data == 3:
+            raise KeyError("stop")
+        return data % 2 == 0
+
+    linked_list = make()
+    linked_list.extend([0, 1, 2, 3, 4])
+    with pytest.raises(KeyError):
+        linked_list.remove_if(predicate)
+    assert linked_list.to_plain_list() == [1, 3, 4]
+    check(linked_list)
+
+
+def test_unrolled_remove_if_keeps_whole_blocks_when_the_predicate_raises():
+    def predicate(data):
+        if data == 3:
+            raise KeyError("stop")
+        return data % 2 == 0
+
+    linked_list = UnrolledLinkedList.from_iterable([0, 1, 2, 3, 4], 2)
+    with pytest.raises(KeyError):
+        linked_list.remove_if(predicate)
+    # the block being filtered is left as it was
+    assert linked_list.to_plain_list() == [1, 2, 3, 4]
+    check_blocks(linked_list)
+
+
+def check_skip_list(skip_list):
+    """
+        checks that every link of an IndexableSkipList skips as many
+        positions as its width says, and that the tail and size are right
+    """
+    positions = {}
+    last = None
+    current = skip_list.get_head()
+    while current is not None:
+        positions[id(current)] = len(positions)
+        last = current
+        current = current.get_next()
+    assert skip_list.get_tail() is last
+    assert len(skip_list) == len(positions)
+    header = skip_list._header
+    for level in range(skip_list.MAX_LEVEL):
+        pos = -1
+        current = header
+        while current.get_next(level) is not None:
+            following = current.get_next(level)
+            pos += current.get_width(level)
+            assert positions[id(following)] == pos
+            current = following
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_skip_list_matches_a_list(seed):
+    rng = random.Random(seed)
+    run_random_calls(IndexableSkipList(seed), [], rng, 400, list(range(6)), check_skip_list)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_skip_list_reads_and_deletes_by_position(seed):
+    rng = random.Random(seed)
+    model = list(range(200))
+    skip_list = IndexableSkipList.from_iterable(model, seed)
+    for _ in range(300):
+        pos = rng.randrange(-len(model), len(model))
+        assert skip_list[pos] == model[pos]
+        if rng.random() < 0.3:
+            del skip_list[pos]
+            del model[pos]
+        else:
+            insert_pos = rng.randrange(len(model) + 1)
+            skip_list.insert(-1, insert_pos)
+            model_insert(model, -1, insert_pos)
+        assert skip_list.to_plain_list() == model
+    check_skip_list(skip_list)
+    for args in ISLICE_ARGS:
+        assert list(skip_list.islice(*args)) == model[slice(*args)]
+
+
+def test_skip_list_positions_out_of_range():
+    skip_list = IndexableSkipList.from_iterable([1, 2, 3])
+    for pos in (3, -4):
+        with pytest.raises(IndexError):
+            skip_list[pos]
+        with pytest.raises(IndexError):
+            del skip_list[pos]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_persistent_versions_never_change(seed):
+    rng = random.Random(seed)
+    versions = [(PersistentLinkedList(), [])]
+    for _ in range(300):
+        persistent_list, model = rng.choice(versions)
+        val = rng.randrange(5)
+        choice = rng.random()
+        if choice < 0.3:
+            new_list, new_model = persistent_list.add(val), [val] + model
+        elif choice < 0.55:
+            pos = rng.randrange(-1, len(model) + 2)
+            new_model = model[:]
+            model_insert(new_model, val, pos)
+            new_list = persistent_list.insert(val, pos)
+        elif choice < 0.8:
+            new_model = model[:]
+            model_remove(new_model, val)
+            new_list = persistent_list.remove(val)
+            if val not in model:
+                assert new_list is persistent_list
+        else:
+            new_list, new_model = persistent_list.reverse(), model[::-1]
+        assert persistent_list.contains(val) == (val in model)
+        versions.append((new_list, new_model))
+    for persistent_list, model in versions:
+        assert persistent_list.to_plain_list() == model
+        assert len(persistent_list) == len(model)
+        assert persistent_list.is_empty() == (not model)
+
+
+def test_persistent_changes_share_the_nodes_after_them():
+    persistent_list = PersistentLinkedList.from_iterable(range(10))
+    assert persistent_list.add(-1).get_head().get_next() is persistent_list.get_head()
+    inserted = persistent_list.insert(-1, 3)
+    assert inserted.get_head() is not persistent_list.get_head()
+    node = inserted.get_head()
+    for _ in range(4):
+        node = node.get_next()
+    original = persistent_list.get_head()
+    for _ in range(3):
+        original = original.get_next()
+    assert node is original
+    removed = persistent_list.remove(0)
+    assert removed.get_head() is persistent_list.get_head().get_next()
+
+
+def test_persistent_reverse_twice_is_the_same_list():
+    persistent_list = PersistentLinkedList.from_iterable(range(5))
+    reversed_list = persistent_list.reverse()
+    assert reversed_list.reverse() is persistent_list
+    assert list(reversed_list.islice(1, 3)) == [3, 2]
@@ -0,0 +1,88 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Tests of list_backend_benchmark.py: every backend's operations
+#              change a list the same way, a small run has results for every
+#              size and operation, and compare() flags slowdowns.
+#
+
+import json
+
+import pytest
+
+from list_backend_benchmark import BACKENDS, OPERATIONS, _calls_for, compare, run
+
+
+def plain_values(built):
+    """returns the values of a list built by any backend, as a list"""
+    return built.to_plain_list() if hasattr(built, "to_plain_list") else list(built)
+
+
+@pytest.mark.parametrize("name", sorted(BACKENDS))
+@pytest.mark.parametrize("op_name", OPERATIONS)
+def test_operations_match_the_list_backend(name, op_name):
+    size = 100
+    expected = list(range(size))
+    build, operations = BACKENDS[name]
+    built = build(list(range(size)))
+    for call in range(5):
+        returned = operations[op_name](built, size, call)
+        expected_returned = BACKENDS["list"][1][op_name](expected, size, call)
+        if op_name in ("contains", "to_plain_list"):
+            assert returned == expected_returned
+    assert plain_values(built) == expected
+
+
+@pytest.mark.parametrize("single_ns, size, target_ns, calls", [
+    (1000, 10 ** 6, 10 ** 6, 1000),  # enough calls to reach the target
+    (1000, 100, 10 ** 6, 10),  # no more than a tenth of the size
+    (10 ** 9, 10 ** 6, 10 ** 6, 1),  # at least one call
+    (0, 10 ** 6, 10 ** 6, 10 ** 5),  # a call too quick to time
+    (3, 10 ** 6, 10, 3),
+])
+def test_calls_for(single_ns, size, target_ns, calls):
+    result = _calls_for(single_ns, size, target_ns)
+    assert result == calls
+    assert isinstance(result, int)
+
+
+def test_small_run_has_every_size_and_operation():
+    results = run(backends=["list", "LinkedList"], max_exponent=3, rounds=1, target_ms=1,
+                  memory_max_size=100)
+    assert results["sizes"] == [100, 1000]
+    json.dumps(results)
+    for name in ("list", "LinkedList"):
+        for size in ("100", "1000"):
+            size_results = results["backends"][name][size]
+            assert size_results["build"]["ns"] > 0
+            assert sorted(size_results["operations"]) == sorted(OPERATIONS)
+            for op_result in size_results["operations"].values():
+                assert op_result["best_ns"] <= op_result["median_ns"]
+                assert ("peak_bytes" in op_result) == (size == "100")
+    assert results["backends"]["list"]["100"]["build"]["bytes_per_element"] > 0
+
+
+def test_run_skips_operations_over_the_time_limit():
+    results = run(backends=["LinkedList"], max_exponent=3, rounds=1, target_ms=1, time_limit=0,
+                  memory_max_size=0)
+    assert "skipped" not in results["backends"]["LinkedList"]["100"]["operations"]["add"]
+    assert "skipped" in results["backends"]["LinkedList"]["1000"]
+
+
+def test_compare_flags_regressions():
+    def results(median_ns):
+        return {"backends": {"list": {"100": {"operations": {
+            "add": {"median_ns": median_ns}, "reverse": {"median_ns": 10.0}, "remove": {"skipped": "x"}}}}}}
+
+    lines, regressions = compare(results(100.0), results(130.0))
+    assert regressions == 1
+    assert len(lines) == 2
+    assert lines[0].endswith("REGRESSION")
+    lines, regressions = compare(results(100.0), results(120.0))
+    assert regressions == 0
+    lines, regressions = compare(results(100.0), results(120.0), threshold=0.1)
+    assert regressions == 1
+
+
+def test_compare_skips_what_only_one_run_has():
+    new = {"backends": {"deque": {"100": {"operations": {"add": {"median_ns": 5.0}}}}}}
+    assert compare({"backends": {}}, new) == ([], 0)
@@ -0,0 +1,98 @@
+# Author: Shruthi Ravi
+# Date: 10/19/2026
+# Description: Tests of MappedLinkedList against a Python list model, with
+#              pickled values and with array typecodes, and of reopening,
+#              compacting and refusing files it can not read.
+#
+
+import os
+import random
+
+import pytest
+
+from LinkedList import MappedLinkedList
+from test_linked_list import run_random_calls
+
+VALUES = {None: [0, 1, "two", (3,), None, 5.5], "q": list(range(-3, 5)), "d": [0.5, -1.25, 2.0, 3.75]}
+
+
+@pytest.mark.parametrize("typecode", [None, "q", "d"])
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_a_list(tmp_path, typecode, seed):
+    rng = random.Random(seed)
+    with MappedLinkedList(str(tmp_path / "list.bin"), typecode) as linked_list:
+        run_random_calls(linked_list, [], rng, 300, VALUES[typecode])
+        assert len(linked_list) == len(linked_list.to_plain_list())
+
+
+@pytest.mark.parametrize("typecode", [None, "q", "d"])
+def test_reopen_keeps_the_values(tmp_path, typecode):
+    path = str(tmp_path / "list.bin")
+    values = VALUES[typecode] * 3
+    with MappedLinkedList.from_iterable(values, path, typecode) as linked_list:
+        linked_list.remove(values[1])
+        linked_list.reverse()
+        expected = linked_list.to_plain_list()
+    with MappedLinkedList(path, typecode) as linked_list:
+        assert linked_list.to_plain_list() == expected
+        assert len(linked_list) == len(expected)
+        linked_list.add(values[0])
+        assert linked_list.to_plain_list() == expected + [values[0]]
+
+
+@pytest.mark.parametrize("typecode", [None, "q"])
+def test_compact_keeps_the_values_and_shrinks_the_heap(tmp_path, typecode):
+    path = str(tmp_path / "list.bin")
+    with MappedLinkedList.from_iterable(range(500), path, typecode) as linked_list:
+        for val in range(0, 500, 3):
+            linked_list.remove(val)
+        linked_list.reverse()
+        expected = linked_list.to_plain_list()
+        heap_size = os.path.getsize(path + ".heap") if typecode is None else None
+        linked_list.compact()
+        assert linked_list.to_plain_list() == expected
+        assert list(linked_list.islice(5, 10)) == expected[5:10]
+        if typecode is None:
+            assert os.path.getsize(path + ".heap") < heap_size
+    assert not os.path.exists(path + ".compact")
+    with MappedLinkedList(path, typecode) as linked_list:
+        assert linked_list.to_plain_list() == expected
+
+
+def test_removing_most_values_compacts_on_its_own(tmp_path):
+    path = str(tmp_path / "list.bin")
+    count = 2 * MappedLinkedList.COMPACT_MIN_RECORDS
+    with MappedLinkedList.from_iterable(range(count), path, "q") as linked_list:
+        full_size = os.path.getsize(path)
+        for val in range(count - 10):
+            linked_list.remove(val)
+        assert linked_list.to_plain_list() == list(range(count - 10, count))
+    assert os.path.getsize(path) < full_size
+
+
+def test_typecode_mismatch_raises_and_leaves_no_heap(tmp_path):
+    path = str(tmp_path / "list.bin")
+    with MappedLinkedList.from_iterable([1, 2, 3], path, "q"):
+        pass
+    with pytest.raises(ValueError):
+        MappedLinkedList(path)
+    assert not os.path.exists(path + ".heap")
+    with MappedLinkedList(path, "q") as linked_list:
+        assert linked_list.to_plain_list() == [1, 2, 3]
+
+
+def test_file_that_is_not_a_list_raises_and_is_kept(tmp_path):
+    path = tmp_path / "list.bin"
+    path.write_bytes(b"not a list")
+    with pytest.raises(ValueError):
+        MappedLinkedList(str(path))
+    assert path.read_bytes() == b"not a list"
+    assert not os.path.exists(str(path) + ".heap")
+
+
+@pytest.mark.parametrize("typecode", ["u", "w", "x"])
+def test_unsupported_typecode_raises(tmp_path, typecode):
+    path = str(tmp_path / "list.bin")
+    with pytest.raises(ValueError):
+        MappedLinkedList(path, typecode)
+    assert not os.path.exists(path)